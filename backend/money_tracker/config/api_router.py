@@ -19,4 +19,5 @@ urlpatterns += [
     path('assets/', include('money_tracker.assets.urls')),
     path('liabilities/', include('money_tracker.liabilities.urls')),
     path('expenses/', include('money_tracker.expenses.urls')),
+    path('', include('money_tracker.reports.urls')),
 ]
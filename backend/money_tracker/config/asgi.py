@@ -0,0 +1,27 @@
+# ruff: noqa
+"""
+ASGI config for Money Tracker project.
+
+It exposes the ASGI callable as a module-level variable named ``application``.
+Serve the project with it (uvicorn) rather than WSGI so that the event streams
+of money_tracker.reports.push are held open without a thread each.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/dev/howto/deployment/asgi/
+
+"""
+
+import os
+import sys
+from pathlib import Path
+
+from django.core.asgi import get_asgi_application
+
+# This allows easy placement of apps within the interior
+# money_tracker directory.
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR / "money_tracker"))
+# We defer to a DJANGO_SETTINGS_MODULE already in the environment.
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.production")
+
+application = get_asgi_application()
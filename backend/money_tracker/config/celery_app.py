@@ -28,10 +28,18 @@ def config_loggers(*args, **kwargs):
 # Load task modules from all registered Django app configs.
 app.autodiscover_tasks()
 
-# Run the loan check daily at midnight
+# Run the loan check daily at midnight and record net worth just before the day ends
 app.conf.beat_schedule = {
     "check_loan_default_daily": {
         "task": "money_tracker.liabilities.tasks.check_loan_default",
         "schedule": crontab(hour=0, minute=0),
-    }
+    },
+    "snapshot_net_worth_daily": {
+        "task": "money_tracker.reports.tasks.snapshot_net_worth",
+        "schedule": crontab(hour=23, minute=55),
+    },
+    "prune_sync_tombstones_daily": {
+        "task": "money_tracker.reports.tasks.prune_sync_tombstones",
+        "schedule": crontab(hour=3, minute=30),
+    },
 }
\ No newline at end of file
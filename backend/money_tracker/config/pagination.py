@@ -0,0 +1,207 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    Keyset pagination on (ordering fields, pk), newest first by default.
+
+    A cursor holds the (values, pk) of the row a page starts after, so every page is
+    one index range read of at most page_size + 1 rows however deep the client goes, and
+    rows inserted meanwhile never shift or repeat a page. Views with an OrderingFilter may
+    pick the field (?ordering=amount, ?ordering=-created_at); otherwise the view's `ordering`
+    applies (e.g. ["-is_local", "code"]), and views without one order by -created_at.
+    No COUNT(*) is run; with ?total=estimate the response carries the planner's row estimate.
+    """
+
+    default_ordering = "-created_at"
+    page_size = 50
+    max_page_size = 500
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    total_query_param = "total"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.fields, directions = zip(*self.get_ordering(request, queryset, view))
+        cursor = self.decode_cursor(request, queryset.model)
+        self.estimated_total = self.estimate_total(queryset) if self.wants_estimate(request) else None
+
+        backwards = cursor is not None and cursor[0] == "p"
+        # (field, whether the page walks towards its larger values); the pk breaks ties like the last field
+        terms = [
+            (field, descending == backwards)
+            for field, descending in zip(self.fields + ("pk",), directions + directions[-1:])
+        ]
+        queryset = queryset.order_by(*(field if later else f"-{field}" for field, later in terms))
+        if cursor is not None:
+            _, values, pk = cursor
+            # Rows past (v1, ..., pk): past v1, or equal to v1 and past v2, ..., or equal on every field and past pk
+            after, equal = Q(), {}
+            for (field, later), value in zip(terms, values + (pk,)):
+                after |= Q(**equal, **{f"{field}__{'gt' if later else 'lt'}": value})
+                equal[field] = value
+            queryset = queryset.filter(after)
+
+        return self.paginate_rows(list(queryset[: self.page_size + 1]), cursor)
+
+    def paginate_rows(self, rows, cursor):
+        """The page of up to page_size + 1 rows read past the cursor; sets the next and previous cursors."""
+        backwards = cursor is not None and cursor[0] == "p"
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if backwards:
+            rows.reverse()
+
+        # Moving backwards always leaves a next page behind; moving forwards from a cursor, a previous one
+        self.next_cursor = self.encode_cursor("n", rows[-1]) if rows and (has_more or backwards) else None
+        has_previous = cursor is not None and (has_more or not backwards)
+        self.previous_cursor = self.encode_cursor("p", rows[0]) if rows and has_previous else None
+        return rows
+
+    def get_ordering(self, request, queryset, view):
+        """
+        [(field name, descending), ...] of the first ?ordering= term the view's OrderingFilter accepts,
+        else of the view's `ordering`, else of the default. Related fields fall back to the default.
+        """
+        ordering = None
+        for backend in getattr(view, "filter_backends", []):
+            if issubclass(backend, OrderingFilter) and request.query_params.get(backend.ordering_param):
+                ordering = (backend().get_ordering(request, queryset, view) or [])[:1]
+        if not ordering:
+            ordering = getattr(view, "ordering", None)
+            ordering = [ordering] if isinstance(ordering, str) else ordering
+        if not ordering or any("__" in term for term in ordering):
+            ordering = [self.default_ordering]
+        return [(term.lstrip("-"), term.startswith("-")) for term in ordering]
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def wants_estimate(self, request):
+        return request.query_params.get(self.total_query_param) == "estimate"
+
+    @staticmethod
+    def estimate_total(queryset):
+        """The planner's estimate of the number of rows, from EXPLAIN rather than COUNT(*)."""
+        plan = json.loads(queryset.order_by().explain(format="json"))
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def decode_cursor(self, request, model):
+        """(direction, values, pk) from the cursor query parameter, or None on the first page."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            direction, values, pk = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            if direction not in ("n", "p") or not isinstance(values, list) or len(values) != len(self.fields):
+                raise ValueError(direction)
+            values = tuple(model._meta.get_field(field).to_python(value) for field, value in zip(self.fields, values))
+            return direction, values, model._meta.pk.to_python(pk)
+        except (TypeError, ValueError, UnicodeError, binascii.Error, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, direction, row):
+        # Rows are model instances, or .values() dicts that include the fields and "pk"
+        if isinstance(row, dict):
+            values, pk = [row[field] for field in self.fields], row["pk"]
+        else:
+            values, pk = [getattr(row, field) for field in self.fields], row.pk
+        values = [value.isoformat() if isinstance(value, datetime) else str(value) for value in values]
+        token = json.dumps([direction, values, pk], separators=(",", ":"))
+        encoded = base64.urlsafe_b64encode(token.encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        return self.next_cursor
+
+    def get_previous_link(self):
+        return self.previous_cursor
+
+    def get_paginated_response(self, data):
+        payload = {"next": self.get_next_link(), "previous": self.get_previous_link()}
+        if self.estimated_total is not None:
+            payload["estimated_total"] = self.estimated_total
+        payload["results"] = data
+        return Response(payload)
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "estimated_total": {
+                    "type": "integer",
+                    "description": f"Planner estimate of the row count, with ?{self.total_query_param}=estimate",
+                },
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {"name": self.cursor_query_param, "required": False, "in": "query",
+             "description": "The pagination cursor value.", "schema": {"type": "string"}},
+            {"name": self.page_size_query_param, "required": False, "in": "query",
+             "description": f"Number of results per page, at most {self.max_page_size}.", "schema": {"type": "integer"}},
+            {"name": self.total_query_param, "required": False, "in": "query",
+             "description": "Pass 'estimate' to include an estimated total.", "schema": {"type": "string", "enum": ["estimate"]}},
+        ]
+
+
+class FeedCursorPagination(KeysetCursorPagination):
+    """
+    Keyset pagination of a merged feed (money_tracker.reports.transactions.TransactionFeed), newest
+    first, on (created_at, type, id): ids repeat across the merged tables, so the type breaks their ties.
+    paginate_queryset() takes the feed instead of a queryset.
+    """
+
+    def paginate_queryset(self, feed, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.estimated_total = None
+        cursor = self.decode_cursor(request)
+        backwards = cursor is not None and cursor[0] == "p"
+        rows = feed.page(self.page_size + 1, cursor[1:] if cursor else None, backwards)
+        return self.paginate_rows(rows, cursor)
+
+    def decode_cursor(self, request, model=None):
+        """(direction, created_at, type, id) from the cursor query parameter, or None on the first page."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            direction, created_at, row_type, pk = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            if direction not in ("n", "p") or not isinstance(row_type, str):
+                raise ValueError(direction)
+            return direction, datetime.fromisoformat(created_at), row_type, int(pk)
+        except (TypeError, ValueError, UnicodeError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, direction, row):
+        token = json.dumps([direction, row["created_at"].isoformat(), row["type"], row["id"]], separators=(",", ":"))
+        encoded = base64.urlsafe_b64encode(token.encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_schema_operation_parameters(self, view):
+        return super().get_schema_operation_parameters(view)[:2]  # no ?total=estimate
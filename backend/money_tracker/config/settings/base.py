@@ -105,6 +105,7 @@ LOCAL_APPS = [
     "money_tracker.expenses",
     "money_tracker.assets",
     "money_tracker.liabilities",
+    "money_tracker.reports",
 ]
 # https://docs.djangoproject.com/en/dev/ref/settings/#installed-apps
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
@@ -392,6 +393,7 @@ REST_FRAMEWORK = {
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_PAGINATION_CLASS": "config.pagination.KeysetCursorPagination",
 }
 
 # django-cors-headers - https://github.com/adamchainz/django-cors-headers#setup
@@ -459,4 +461,43 @@ CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
 
 ACCOUNT_ADAPTER = 'money_tracker.users.adapters.CustomAccountAdapter'
 
-PASSWORD_RESET_TIMEOUT = 600
\ No newline at end of file
+PASSWORD_RESET_TIMEOUT = 600
+
+# Exchange rate caching
+# ------------------------------------------------------------------------------
+# Process-local LRU in front of the shared cache, see money_tracker.currencies.rates
+EXCHANGE_RATE_LOCAL_CACHE_SIZE = env.int("EXCHANGE_RATE_LOCAL_CACHE_SIZE", default=256)
+EXCHANGE_RATE_LOCAL_CACHE_TTL = env.int("EXCHANGE_RATE_LOCAL_CACHE_TTL", default=30)
+EXCHANGE_RATE_CACHE_TIMEOUT = env.int("EXCHANGE_RATE_CACHE_TIMEOUT", default=3600)
+EXCHANGE_RATE_HISTORY_TTL = env.int("EXCHANGE_RATE_HISTORY_TTL", default=300)
+LOCAL_CURRENCY_CACHE_TIMEOUT = env.int("LOCAL_CURRENCY_CACHE_TIMEOUT", default=3600)
+
+# Stored LCY revaluation, see money_tracker.currencies.valuation
+LCY_REVALUE_ON_RATE_CHANGE = env.bool("LCY_REVALUE_ON_RATE_CHANGE", default=True)
+LCY_REVALUATION_CHUNK_SIZE = env.int("LCY_REVALUATION_CHUNK_SIZE", default=10000)
+# "stored" reads the *_lcy columns, "live" values rows at the current rate in SQL (LCYQuerySet.with_live_lcy)
+LCY_VALUATION_MODE = env.str("LCY_VALUATION_MODE", default="stored")
+# Rows validated and inserted per chunk by money_tracker.currencies.importer
+RATE_IMPORT_CHUNK_SIZE = env.int("RATE_IMPORT_CHUNK_SIZE", default=5000)
+# Per-user cross-rate matrices, see money_tracker.currencies.crossrates
+CROSS_RATE_CACHE_TIMEOUT = env.int("CROSS_RATE_CACHE_TIMEOUT", default=3600)
+# Render read-only list pages from .values() rows, see money_tracker.currencies.api.compiled
+FAST_LIST_RENDERING = env.bool("FAST_LIST_RENDERING", default=True)
+
+# Reports
+# ------------------------------------------------------------------------------
+DASHBOARD_SUMMARY_CACHE_TIMEOUT = env.int("DASHBOARD_SUMMARY_CACHE_TIMEOUT", default=300)
+MONTHLY_REPORT_MAX_MONTHS = env.int("MONTHLY_REPORT_MAX_MONTHS", default=120)
+NET_WORTH_SNAPSHOT_CHUNK_SIZE = env.int("NET_WORTH_SNAPSHOT_CHUNK_SIZE", default=1000)
+NET_WORTH_MAX_DAYS = env.int("NET_WORTH_MAX_DAYS", default=3660)
+CASH_FLOW_FORECAST_MAX_MONTHS = env.int("CASH_FLOW_FORECAST_MAX_MONTHS", default=120)
+# Delta sync (money_tracker.reports.sync): how long deletes are remembered, and how far the
+# returned watermark lags the clock to catch rows of transactions still open
+SYNC_TOMBSTONE_RETENTION_DAYS = env.int("SYNC_TOMBSTONE_RETENTION_DAYS", default=30)
+SYNC_WATERMARK_OVERLAP_SECONDS = env.int("SYNC_WATERMARK_OVERLAP_SECONDS", default=30)
+# Push of data changes (money_tracker.reports.push): the fan-out backend, the keep-alive interval,
+# how long one event stream stays open and how long browsers wait before reconnecting
+PUSH_BACKEND = env("PUSH_BACKEND", default="money_tracker.reports.push.RedisPushBackend")
+PUSH_HEARTBEAT_SECONDS = env.int("PUSH_HEARTBEAT_SECONDS", default=15)
+PUSH_STREAM_TIMEOUT_SECONDS = env.int("PUSH_STREAM_TIMEOUT_SECONDS", default=300)
+PUSH_RECONNECT_MILLISECONDS = env.int("PUSH_RECONNECT_MILLISECONDS", default=3000)
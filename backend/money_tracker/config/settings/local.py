@@ -32,6 +32,11 @@ CACHES = {
     },
 }
 
+# PUSH
+# ------------------------------------------------------------------------------
+# Event streams and writes share one process, like the local-memory cache above
+PUSH_BACKEND = "money_tracker.reports.push.InMemoryPushBackend"
+
 # EMAIL
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#email-host
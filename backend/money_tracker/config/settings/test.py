@@ -34,5 +34,11 @@ TEMPLATES[0]["OPTIONS"]["debug"] = True  # type: ignore[index]
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#media-url
 MEDIA_URL = "http://media.testserver"
+
+# PUSH
+# ------------------------------------------------------------------------------
+# Event streams and writes share one process
+PUSH_BACKEND = "money_tracker.reports.push.InMemoryPushBackend"
+
 # Your stuff...
 # ------------------------------------------------------------------------------
@@ -5,18 +5,20 @@ from . . models import LiquidAsset, Equity, InvestmentAccount, RetirementAccount
 from . serializers import LiquidAssetSerializer, EquitySerializer, InvestmentAccountSerializer, RetirementAccountSerializer
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from django.db.models import Sum
+from money_tracker.currencies.api.mixins import CompiledListMixin, ConditionalGetMixin, DisplayCurrencyMixin
+from money_tracker.currencies.api.filters import SparseFieldsFilter
+from money_tracker.reports.summary import group_totals
 
 # Create your views here.
-class BaseAssetViewSet(viewsets.ModelViewSet):
+class BaseAssetViewSet(ConditionalGetMixin, CompiledListMixin, viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [filters.SearchFilter, filters.OrderingFilter, SparseFieldsFilter]
     ordering_fields = ["created_at", "amount"]
     ordering = ["-created_at"]
     
     def get_queryset(self):
         if self.request.user.is_authenticated:
-            return self.queryset.filter(created_by=self.request.user)  # ✅ Only their own assets
+            return self.queryset.filter(created_by=self.request.user).valued()  # ✅ Only their own assets
         return self.queryset.none()
 
     def perform_create(self, serializer):
@@ -50,7 +52,7 @@ class RetirementAccountViewSet(BaseAssetViewSet):
     search_fields = ["name", "employer", "currency__code"]
 
 @extend_schema(tags=["Total Assets"])
-class TotalAssetsAPIView(APIView):
+class TotalAssetsAPIView(ConditionalGetMixin, DisplayCurrencyMixin, APIView):
     """API endpoint to get the total expenses across all categories."""
     permission_classes = [IsAuthenticated]
     def get(self, request):
@@ -58,18 +60,5 @@ class TotalAssetsAPIView(APIView):
         if not user.is_authenticated:
             return Response({"detail":"Authenticated Required"}, status=status.HTTP_401_UNAUTHORIZED)
         
-        liquid_assets_total = LiquidAsset.objects.filter(created_by=user).aggregate(total=Sum('amount'))['total'] or 0
-        equity_total = Equity.objects.filter(created_by=user).aggregate(total=Sum('amount'))['total'] or 0
-        investment_account_total = InvestmentAccount.objects.filter(created_by=user).aggregate(total=Sum('amount'))['total'] or 0
-        retirement_account_total = RetirementAccount.objects.filter(created_by=user).aggregate(total=Sum('amount'))['total'] or 0
-
-        total_assets = liquid_assets_total + equity_total + investment_account_total + retirement_account_total
-        
-        return Response({
-            "total_assets": total_assets,
-            "liquid_assets": liquid_assets_total,
-            "equities": equity_total,
-            "investment_accounts": investment_account_total,
-            "retirement_accounts": retirement_account_total,
-        }, status=status.HTTP_200_OK)
+        return self.totals_response(request, group_totals(user.pk, "assets"))
     
\ No newline at end of file
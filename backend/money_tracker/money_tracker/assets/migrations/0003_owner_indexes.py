@@ -0,0 +1,32 @@
+# Generated by Django 5.2.2 on 2026-10-18 06:13
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assets', '0002_initial'),
+        ('currencies', '0005_owner_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='equity',
+            index=models.Index(fields=['created_by', '-created_at', '-id'], include=('amount_lcy',), name='equity_owner_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='investmentaccount',
+            index=models.Index(fields=['created_by', '-created_at', '-id'], include=('amount_lcy',), name='investmentaccount_owner_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='liquidasset',
+            index=models.Index(fields=['created_by', '-created_at', '-id'], include=('amount_lcy',), name='liquidasset_owner_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='retirementaccount',
+            index=models.Index(fields=['created_by', '-created_at', '-id'], include=('amount_lcy',), name='retirementaccount_owner_idx'),
+        ),
+    ]
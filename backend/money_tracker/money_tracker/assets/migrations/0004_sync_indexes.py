@@ -0,0 +1,32 @@
+# Generated by Django 5.2.2 on 2026-10-18 06:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assets', '0003_owner_indexes'),
+        ('currencies', '0006_sync_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='equity',
+            index=models.Index(fields=['created_by', 'modified_at'], name='equity_sync_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='investmentaccount',
+            index=models.Index(fields=['created_by', 'modified_at'], name='investmentaccount_sync_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='liquidasset',
+            index=models.Index(fields=['created_by', 'modified_at'], name='liquidasset_sync_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='retirementaccount',
+            index=models.Index(fields=['created_by', 'modified_at'], name='retirementaccount_sync_idx'),
+        ),
+    ]
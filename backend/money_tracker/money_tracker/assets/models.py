@@ -3,6 +3,8 @@ from django.conf import settings
 User = settings.AUTH_USER_MODEL
 from money_tracker.currencies.models import Currency
 from money_tracker.currencies.mixins import CurrencyConversionMixin
+from money_tracker.currencies.valuation import LCYQuerySet
+from money_tracker.reports.tracking import SummaryTrackedMixin
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.db import transaction
@@ -12,7 +14,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 # Create your models here.        
-class BaseAsset(models.Model, CurrencyConversionMixin):
+class BaseAsset(SummaryTrackedMixin, models.Model, CurrencyConversionMixin):
     """Abstract base model for financial assets."""
     name = models.CharField(max_length=100, null=False, blank=False)
     currency = models.ForeignKey(Currency, on_delete=models.PROTECT, null=False, blank=False)
@@ -24,10 +26,18 @@ class BaseAsset(models.Model, CurrencyConversionMixin):
     modified_by = models.ForeignKey(User, on_delete=models.PROTECT, related_name="%(class)s_modifier", blank=True, null=True)
     modified_at = models.DateTimeField(auto_now=True)
 
+    objects = LCYQuerySet.as_manager()
+
     class Meta:
         abstract = True
         ordering = ["id"]
         get_latest_by = "created_at"
+        indexes = [
+            # Covers the owner's keyset-paginated list (newest first) and LCY totals
+            models.Index(fields=["created_by", "-created_at", "-id"], include=["amount_lcy"], name="%(class)s_owner_idx"),
+            # Delta sync reads the rows an owner changed after a watermark (money_tracker.reports.sync)
+            models.Index(fields=["created_by", "modified_at"], name="%(class)s_sync_idx"),
+        ]
 
     def save(self, *args, **kwargs):
         if not self._state.adding and not self.modified_by:
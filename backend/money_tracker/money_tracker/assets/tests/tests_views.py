@@ -4,6 +4,7 @@ from rest_framework import status
 from rest_framework.test import APIClient
 from decimal import Decimal
 from ..models import LiquidAsset, Equity, InvestmentAccount, RetirementAccount
+from .factories import CurrencyFactory, LiquidAssetFactory
 
 @pytest.fixture
 def api_client():
@@ -31,8 +32,8 @@ class TestLiquidAssetViewSet:
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 1  
-        assert response.data[0]["source"] == liquid_asset.source
+        assert len(response.data["results"]) == 1  
+        assert response.data["results"][0]["source"] == liquid_asset.source
         
     def test_create_liquid_asset(self, authenticated_api_client, local_currency):
         """Test creating a liquid asset"""
@@ -104,8 +105,8 @@ class TestEquityViewSet:
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 1  
-        assert response.data[0]["name"] == equity.name
+        assert len(response.data["results"]) == 1  
+        assert response.data["results"][0]["name"] == equity.name
         
     def test_create_equity(self, authenticated_api_client, local_currency):
         """Test creating an equity asset"""
@@ -177,8 +178,8 @@ class TestInvestmentAccountViewSet:
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 1  
-        assert response.data[0]["name"] == investment_account.name
+        assert len(response.data["results"]) == 1  
+        assert response.data["results"][0]["name"] == investment_account.name
     
     def test_create_investment_account(self, authenticated_api_client, local_currency):
         """Test creating an investment account"""
@@ -250,8 +251,8 @@ class TestRetirementAccountViewSet:
         response = authenticated_api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 1  
-        assert response.data[0]["employer"] == retirement_account.employer
+        assert len(response.data["results"]) == 1  
+        assert response.data["results"][0]["employer"] == retirement_account.employer
         
     def test_create_retirement_account(self, authenticated_api_client, local_currency):
         """Test creating a retirement account"""
@@ -346,4 +347,22 @@ class TestTotalAssetsAPIView:
         response = another_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK 
-        assert response.data["total_expenses"] == 0 
\ No newline at end of file
+        assert response.data["total_expenses"] == 0
+
+
+@pytest.mark.django_db
+def test_asset_list_resolves_local_currency_once(
+    authenticated_api_client, user, settings, django_assert_max_num_queries
+):
+    """amount_lcy_display must not look up the local currency once per row."""
+    settings.FAST_LIST_RENDERING = False  # render through the serializer's LocalCurrencyDisplayMixin
+    local_currency = CurrencyFactory(is_local=True, created_by=user)
+    LiquidAssetFactory.create_batch(5, created_by=user, currency=local_currency)
+
+    # savepoint + list + local currency + release
+    with django_assert_max_num_queries(4):
+        response = authenticated_api_client.get(reverse("api:assets:liquidasset-list"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data["results"]) == 5
+    assert all(row["amount_lcy_display"].startswith(f"{local_currency.code} ") for row in response.data["results"])
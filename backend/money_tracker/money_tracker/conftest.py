@@ -1,5 +1,10 @@
 import pytest
+from django.core.cache import cache
 
+from money_tracker.currencies.history import historical_rates
+from money_tracker.currencies.rates import rate_resolver
+from money_tracker.reports.tracking import check_monthly_rollups
+from money_tracker.reports.tracking import check_summaries
 from money_tracker.users.models import User
 from money_tracker.users.tests.factories import UserFactory
 
@@ -9,6 +14,30 @@ def _media_storage(settings, tmpdir) -> None:
     settings.MEDIA_ROOT = tmpdir.strpath
 
 
+@pytest.fixture(autouse=True)
+def _clear_caches() -> None:
+    # Database rollbacks between tests do not fire the invalidation signals.
+    cache.clear()
+    rate_resolver.clear()
+    rate_resolver.reset_stats()
+    historical_rates.clear()
+
+
+@pytest.fixture(autouse=True)
+def _financial_summaries_consistent(request):
+    # Every test that touches the database must leave the summary tables in step with the source tables.
+    uses_db = request.node.get_closest_marker("django_db") or {"db", "transactional_db"} & set(request.fixturenames)
+    if not uses_db:
+        yield
+        return
+    request.getfixturevalue("_django_db_helper")  # set up first so that the check runs before the rollback
+    yield
+    mismatches = check_summaries()
+    assert not mismatches, f"FinancialSummary is out of step with the source tables: {mismatches}"
+    mismatches = check_monthly_rollups()
+    assert not mismatches, f"MonthlyRollup is out of step with the source tables: {mismatches}"
+
+
 @pytest.fixture
 def user(db) -> User:
     return UserFactory()
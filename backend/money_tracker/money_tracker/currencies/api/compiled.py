@@ -0,0 +1,170 @@
+import decimal
+import re
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models.functions import Cast
+from rest_framework import ISO_8601
+from rest_framework import serializers
+from rest_framework.settings import api_settings
+
+from ..valuation import LIVE_PREFIX
+
+
+class CompiledReader:
+    """
+    Renders read-only list rows straight from .values() dicts.
+
+    Built by CompiledReadMixin.compile_reader() from a serializer's readable fields: each field
+    becomes a values() column and a formatter precomputed from the field's settings, so rows skip
+    model instances, bound field lookups and get_attribute(). Datetimes and decimals are formatted
+    by PostgreSQL where it produces the same text, which also spares parsing them into Python objects.
+    Output matches Serializer.to_representation().
+    """
+
+    def __init__(self, columns, plan):
+        self.columns = columns  # values() name -> SQL expression, or None for a plain column
+        self.plan = plan  # [(field name, row -> value)]
+
+    def values(self, queryset, *extra):
+        """The values() queryset the reader renders; `extra` columns (e.g. pagination keys) are added."""
+        plain = [column for column, expression in self.columns.items() if expression is None]
+        expressions = {column: expression for column, expression in self.columns.items() if expression is not None}
+        return queryset.values(*dict.fromkeys([*plain, *extra]), **expressions)
+
+    def render(self, rows):
+        plan = self.plan
+        return [{name: get(row) for name, get in plan} for row in rows]
+
+
+def _column(column, formatter=None):
+    if formatter is None:
+        return lambda row: row[column]
+
+    def get(row):
+        value = row[column]
+        return None if value is None else formatter(value)
+    return get
+
+
+# strftime directives with a to_char() equivalent producing the same text in the C locale
+TO_CHAR_PATTERNS = {
+    "%Y": "YYYY", "%y": "YY", "%m": "MM", "%b": "Mon", "%d": "DD",
+    "%H": "HH24", "%I": "HH12", "%M": "MI", "%S": "SS", "%p": "AM", "%%": "%",
+}
+
+
+def _to_char_pattern(output_format):
+    """The to_char() pattern of a strftime format, or None if it uses a directive without one."""
+    pattern = []
+    for directive, literal in re.findall(r"(%.)|([^%]+)", output_format):
+        if directive:
+            if directive not in TO_CHAR_PATTERNS:
+                return None
+            pattern.append(TO_CHAR_PATTERNS[directive])
+        elif '"' in literal or "\\" in literal:
+            return None
+        else:
+            pattern.append(f'"{literal}"')  # quoted so that letters are not read as patterns
+    return "".join(pattern)
+
+
+def _sql_formatter(field, column, model_field):
+    """An expression rendering `column` as field.to_representation() would, or None."""
+    if isinstance(field, serializers.DateTimeField):
+        output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+        tz = field.timezone if hasattr(field, "timezone") else field.default_timezone()
+        pattern = _to_char_pattern(output_format) if output_format and output_format.lower() != ISO_8601 else None
+        if pattern is None or getattr(tz, "key", None) is None:
+            return None
+        local = models.Func(models.F(column), models.Value(tz.key), template="(%(expressions)s)", arg_joiner=" AT TIME ZONE ")
+        return models.Func(local, models.Value(pattern), function="to_char", output_field=models.CharField())
+    if isinstance(field, serializers.DecimalField) and isinstance(model_field, models.DecimalField):
+        # numeric::text keeps the column's scale, which is what '{:f}' prints once quantized to it
+        coerce = getattr(field, "coerce_to_string", api_settings.COERCE_DECIMAL_TO_STRING)
+        same_scale = field.decimal_places == model_field.decimal_places and field.max_digits == model_field.max_digits
+        if coerce and same_scale and not field.localize and not field.normalize_output:
+            return Cast(models.F(column), models.TextField())
+    return None
+
+
+def _formatter(field):
+    """A value -> representation function equivalent to field.to_representation() for non-None values."""
+    if isinstance(field, serializers.DateTimeField):
+        output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+        if output_format is not None and output_format.lower() != ISO_8601:
+            tz = field.timezone if hasattr(field, "timezone") else field.default_timezone()
+            if tz is not None:
+                return lambda value: value.astimezone(tz).strftime(output_format)
+    elif isinstance(field, serializers.DecimalField):
+        coerce = getattr(field, "coerce_to_string", api_settings.COERCE_DECIMAL_TO_STRING)
+        if coerce and not field.localize and not field.normalize_output and field.decimal_places is not None:
+            quantum = decimal.Decimal(".1") ** field.decimal_places
+            context = decimal.getcontext().copy()
+            if field.max_digits is not None:
+                context.prec = field.max_digits
+            rounding = field.rounding
+            return lambda value: "{:f}".format(value.quantize(quantum, rounding=rounding, context=context))
+    elif isinstance(field, serializers.DateField):
+        if getattr(field, "format", api_settings.DATE_FORMAT) == ISO_8601:
+            return lambda value: value.isoformat()
+    elif isinstance(field, serializers.IntegerField):
+        return int
+    elif type(field) is serializers.CharField:
+        return str
+    elif isinstance(field, serializers.ReadOnlyField):
+        return None
+    return field.to_representation
+
+
+def related_value(path):
+    """A compiled method field that renders one related column as is, e.g. modified_by__username."""
+    def compile(serializer, queryset):
+        return {path: None}, _column(path)
+    return compile
+
+
+def lcy_display(lcy_field):
+    """A compiled LocalCurrencyDisplayMixin.format_lcy(obj, lcy_field), with the local currency resolved once."""
+    def compile(serializer, queryset):
+        local_currency = serializer.get_local_currency(None)
+        prefix = f"{local_currency.code} " if local_currency else ""
+        live = f"{LIVE_PREFIX}{lcy_field}"
+        columns = dict.fromkeys(("currency", lcy_field, live) if live in queryset.query.annotations else ("currency", lcy_field))
+
+        def get(row):
+            value = row.get(live)
+            if value is None:
+                value = row[lcy_field]
+            if row["currency"] and value is not None:
+                return f"{prefix}{value:.2f}"
+            return None
+        return columns, get
+    return compile
+
+
+def compile_field(serializer, name, field, queryset):
+    """({values() name: expression or None}, row -> value) for one readable field, or None if it cannot be compiled."""
+    if isinstance(field, serializers.SerializerMethodField):
+        spec = serializer.compiled_method_fields.get(name)
+        return spec(serializer, queryset) if spec else None
+    if field.source == "*" or isinstance(field, (serializers.ManyRelatedField, serializers.Serializer)):
+        return None
+    column = field.source.replace(".", "__")
+    root = column.split("__")[0]
+    model_field = None
+    if root not in queryset.query.annotations:
+        try:
+            model_field = queryset.model._meta.get_field(root)
+        except FieldDoesNotExist:
+            return None  # a property or method
+    if isinstance(field, serializers.RelatedField):
+        # values() yields the key, like the pk-only optimisation of PrimaryKeyRelatedField
+        if not isinstance(field, serializers.PrimaryKeyRelatedField) or field.pk_field is not None or "__" in column:
+            return None
+        return {column: None}, _column(column)
+    expression = _sql_formatter(field, column, model_field) if "__" not in column and model_field else None
+    if expression is not None:
+        alias = f"compiled_{name}"
+        return {alias: expression}, _column(alias)
+    return {column: None}, _column(column, _formatter(field))
@@ -0,0 +1,46 @@
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.permissions import SAFE_METHODS
+
+from .serializers import SparseFieldsetMixin
+
+
+class SparseFieldsFilter(BaseFilterBackend):
+    """
+    Loads only the columns a sparse fieldset renders (see SparseFieldsetMixin).
+    ?fields= becomes only() over the kept fields' columns and ?omit= defers the columns
+    no kept field reads; select_related is cut down to the relations still rendered.
+    Must come after OrderingFilter so that the ordering columns are kept.
+    """
+
+    # The row key and the keyset pagination default, read for every row of a page
+    always_loaded = ("id", "created_at")
+
+    def filter_queryset(self, request, queryset, view):
+        if request.method not in SAFE_METHODS:
+            return queryset
+        serializer = view.get_serializer()
+        if not isinstance(serializer, SparseFieldsetMixin) or not serializer.fields or not serializer.omitted_fields:
+            return queryset
+        kept = serializer.model_columns(serializer.fields)
+        omitted = serializer.model_columns(serializer.omitted_fields)
+        if kept is None or omitted is None:
+            return queryset
+
+        kept.update(self.always_loaded)
+        kept.update(field.lstrip("-") for field in queryset.query.order_by if isinstance(field, str))
+        relations = {column.split("__")[0] for column in kept if "__" in column}
+        queryset = queryset.select_related(None)
+        if relations:  # select_related() without arguments would follow every relation
+            queryset = queryset.select_related(*relations)
+        if request.query_params.get(serializer.fields_param):
+            return queryset.only(*kept)
+        deferred = {column for column in omitted - kept if "__" not in column or column.split("__")[0] in relations}
+        return queryset.defer(*deferred)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {"name": SparseFieldsetMixin.fields_param, "required": False, "in": "query",
+             "description": "Comma-separated fields to return; all others are left out.", "schema": {"type": "string"}},
+            {"name": SparseFieldsetMixin.omit_param, "required": False, "in": "query",
+             "description": "Comma-separated fields to leave out.", "schema": {"type": "string"}},
+        ]
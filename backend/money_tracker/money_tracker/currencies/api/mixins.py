@@ -0,0 +1,113 @@
+
+from django.conf import settings
+from django.utils.cache import patch_cache_control
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+from money_tracker.reports.versions import data_version
+
+from ..crossrates import cross_rates
+from ..models import ExchangeRate
+from .serializers import CompiledReadMixin
+
+
+class _NotModified(Exception):
+    pass
+
+
+class DisplayCurrencyMixin:
+    """
+    For totals views: ?currency=XXX reports the local-currency totals in another currency
+    the user holds. Conversion happens once per total, through the cached cross-rate matrix,
+    so it never adds per-row work.
+    """
+
+    display_currency_param = "currency"
+
+    def totals_response(self, request, totals):
+        """
+        Return `totals` (name -> LCY amount) as a 200 response, converted when requested.
+        Converted responses carry the target code under "currency".
+        """
+        code = request.query_params.get(self.display_currency_param)
+        if not code:
+            return Response(totals, status=status.HTTP_200_OK)
+
+        code = code.strip().upper()
+        matrix = cross_rates.for_user(request.user)
+        if matrix.local is None:
+            return Response({"currency": ["No local currency is defined."]}, status=status.HTTP_400_BAD_REQUEST)
+        if code not in matrix:
+            return Response({"currency": [f"Unknown currency '{code}'."]}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            converted = matrix.convert_array(list(totals.values()), matrix.local, code)
+        except ExchangeRate.DoesNotExist:
+            return Response({"currency": [f"No current exchange rate for {code}."]}, status=status.HTTP_400_BAD_REQUEST)
+
+        data = dict(zip(totals, converted))
+        data["currency"] = code
+        return Response(data, status=status.HTTP_200_OK)
+
+
+class CompiledListMixin:
+    """
+    For list endpoints: read-only pages are rendered from .values() rows by the serializer's
+    CompiledReader instead of through model instances and DRF fields. The response is the
+    same JSON; serializers whose fields cannot all be compiled use the regular path.
+    FAST_LIST_RENDERING = False turns it off.
+    """
+
+    def list(self, request, *args, **kwargs):
+        serializer = self.get_serializer()
+        if not getattr(settings, "FAST_LIST_RENDERING", True) or not isinstance(serializer, CompiledReadMixin):
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        reader = serializer.compile_reader(queryset)
+        if reader is None:
+            return super().list(request, *args, **kwargs)
+
+        # The paginator keys pages on its ordering columns and pk, read from the row dicts
+        ordering = [field.lstrip("-") for field in queryset.query.order_by if isinstance(field, str)]
+        if hasattr(self.paginator, "get_ordering"):
+            ordering += [field for field, _ in self.paginator.get_ordering(request, queryset, self)]
+        rows = reader.values(queryset, "pk", "created_at", *ordering)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(reader.render(page))
+        return Response(reader.render(rows))
+
+
+class ConditionalGetMixin:
+    """
+    For user data endpoints: GET responses carry an ETag derived from the user's data version
+    (money_tracker.reports.versions) and a matching If-None-Match is answered with 304 right after
+    authentication, before the view runs a query. Responses are private and revalidated on every use,
+    so browsers send If-None-Match by themselves.
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.etag = None
+        if request.method in ("GET", "HEAD") and request.user.is_authenticated:
+            self.etag = f'W/"{data_version(request.user.pk)}"'
+            if self._etag_matches(request.headers.get("If-None-Match", "")):
+                raise _NotModified
+
+    def _etag_matches(self, header):
+        etags = parse_etags(header)
+        return "*" in etags or self.etag.removeprefix("W/") in {etag.removeprefix("W/") for etag in etags}
+
+    def handle_exception(self, exc):
+        if isinstance(exc, _NotModified):
+            return Response(status=status.HTTP_304_NOT_MODIFIED)
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if getattr(self, "etag", None) and response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+            response["ETag"] = self.etag
+            patch_cache_control(response, private=True, no_cache=True)
+            patch_vary_headers(response, ("Cookie", "Authorization"))
+        return response
@@ -1,7 +1,100 @@
 from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
 from ..models import Currency, ExchangeRate
 from decimal import Decimal
 from django.core.validators import MinValueValidator
+from ..registry import local_currency_registry
+from ..valuation import LIVE_PREFIX
+from ..importer import FORMATS
+from .compiled import CompiledReader, compile_field
+
+
+class LocalCurrencyDisplayMixin:
+    """Formats *_lcy values with the owner's local currency code, resolved once per request."""
+
+    def get_local_currency(self, obj):
+        request = self.context.get("request")
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            return local_currency_registry.get(user, request=request)
+        return local_currency_registry.get(obj.created_by_id)
+
+    def format_lcy(self, obj, field):
+        """Format an LCY column, preferring its live_ annotation when the queryset was valued live."""
+        value = getattr(obj, f"{LIVE_PREFIX}{field}", None)
+        if value is None:
+            value = getattr(obj, field)
+        if obj.currency_id and value is not None:
+            local_currency = self.get_local_currency(obj)
+            if local_currency:
+                return f"{local_currency.code} {value:.2f}"
+            return f"{value:.2f}"  # Fallback if no local currency is defined
+        return None
+
+class SparseFieldsetMixin:
+    """
+    Sparse fieldsets for reads: ?fields=a,b keeps only the listed fields and ?omit=a,b drops them.
+    model_columns() tells SparseFieldsFilter which columns the kept fields read, so the
+    queryset can load just those. A field reads its source; a method field reads the columns
+    listed for it in `method_field_columns`.
+    """
+
+    fields_param = "fields"
+    omit_param = "omit"
+    method_field_columns = {}
+
+    def get_fields(self):
+        fields = super().get_fields()
+        self.omitted_fields = {}
+        request = self.context.get("request")
+        if request is None or request.method not in SAFE_METHODS:
+            return fields
+
+        keep = self._requested_fields(request, self.fields_param, fields)
+        omit = self._requested_fields(request, self.omit_param, fields)
+        for name in list(fields):
+            if (keep and name not in keep) or name in omit:
+                self.omitted_fields[name] = fields.pop(name)
+        return fields
+
+    @staticmethod
+    def _requested_fields(request, param, fields):
+        names = {name.strip() for name in request.query_params.get(param, "").split(",") if name.strip()}
+        unknown = sorted(names - fields.keys())
+        if unknown:
+            raise serializers.ValidationError({param: [f"Unknown field '{name}'." for name in unknown]})
+        return names
+
+    def model_columns(self, fields):
+        """Model column paths (as for only()/defer()) read by `fields`, or None if one of them cannot be told."""
+        columns = set()
+        for name, field in fields.items():
+            if name in self.method_field_columns:
+                columns.update(self.method_field_columns[name])
+            elif isinstance(field, serializers.SerializerMethodField) or (field.source or name) == "*":
+                return None
+            else:
+                columns.add((field.source or name).replace(".", "__"))
+        return columns
+
+class CompiledReadMixin:
+    """
+    Opts a serializer into the compiled read path of CompiledListMixin.
+    compile_reader() returns a CompiledReader for the readable fields, or None when one of them
+    cannot be compiled; method fields compile through the specs in `compiled_method_fields`.
+    """
+
+    compiled_method_fields = {}
+
+    def compile_reader(self, queryset):
+        columns, plan = {}, []
+        for field in self._readable_fields:
+            compiled = compile_field(self, field.field_name, field, queryset)
+            if compiled is None:
+                return None
+            columns.update(compiled[0])
+            plan.append((field.field_name, compiled[1]))
+        return CompiledReader(columns, plan)
 
 class CurrencySerializer(serializers.ModelSerializer):
     created_by = serializers.ReadOnlyField(source='created_by.username')
@@ -99,4 +192,9 @@ class ExchangeRateSerializer(serializers.ModelSerializer):
         else:
             raise serializers.ValidationError({"modified_by": "User must be authenticated to modify this record."})
 
-        return super().update(instance, validated_data)
\ No newline at end of file
+        return super().update(instance, validated_data)
+
+class ExchangeRateImportSerializer(serializers.Serializer):
+    file = serializers.FileField(help_text="CSV (currency,date,rate header), JSON array or JSON Lines file.")
+    format = serializers.ChoiceField(choices=FORMATS, required=False, help_text="Guessed from the file name if omitted.")
+    set_current = serializers.BooleanField(default=False, help_text="Make the newest rate of each imported currency current.")
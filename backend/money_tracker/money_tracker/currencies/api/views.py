@@ -1,7 +1,10 @@
 from ..models import Currency, ExchangeRate
 from rest_framework import viewsets
 from drf_spectacular.utils import extend_schema
-from .serializers import CurrencySerializer, ExchangeRateSerializer
+from .serializers import CurrencySerializer, ExchangeRateSerializer, ExchangeRateImportSerializer
+from .mixins import ConditionalGetMixin
+from ..importer import RateImporter, detect_format, read_rows
+from ..registry import local_currency_registry
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
@@ -9,10 +12,12 @@ from django_filters.rest_framework import DjangoFilterBackend
 from django.db import IntegrityError
 from rest_framework.exceptions import ValidationError as DRFValidationError
 from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
+import io
 from django.http import Http404
 import logging
-from django.shortcuts import get_object_or_404
-from django.core.exceptions import ObjectDoesNotExist, MultipleObjectsReturned, ValidationError as DjangoValidationError
+from django.core.exceptions import ObjectDoesNotExist, ValidationError as DjangoValidationError
 from django.db.models import ProtectedError
 
 
@@ -20,11 +25,12 @@ logger = logging.getLogger(__name__)
 # Create your views here.
 
 @extend_schema(tags=["Currencies"])
-class CurrencyViewSet(viewsets.ModelViewSet):
+class CurrencyViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     serializer_class = CurrencySerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['is_local']
+    ordering = ['-is_local', 'code']  # as Currency.Meta; pages are keyed on it (config.pagination)
     
     def get_queryset(self):
         if self.request.user.is_authenticated:
@@ -118,6 +124,26 @@ class ExchangeRateViewSet(viewsets.ModelViewSet):
             )
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    @extend_schema(request=ExchangeRateImportSerializer)
+    @action(detail=False, methods=["post"], url_path="import", parser_classes=[MultiPartParser],
+            serializer_class=ExchangeRateImportSerializer)
+    def bulk_import(self, request):
+        """Stream a CSV/JSON/JSON Lines file of (currency, date, rate) into the rate history."""
+        serializer = ExchangeRateImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.validated_data["file"]
+        try:
+            fmt = serializer.validated_data.get("format") or detect_format(upload.name)
+            stream = io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+            importer = RateImporter(request.user, set_current=serializer.validated_data["set_current"])
+            report = importer.run(read_rows(stream, fmt))
+        except DjangoValidationError as e:
+            logger.warning(f"Rejected exchange rate import by {request.user.username}: {e.messages[:3]}")
+            return Response({"errors": e.messages}, status=status.HTTP_400_BAD_REQUEST)
+        except UnicodeDecodeError:
+            return Response({"errors": ["The file must be UTF-8 encoded."]}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(report, status=status.HTTP_201_CREATED)
+
 @extend_schema(tags=["Local Currency"])
 class GetLocalCurrencyAPIView(APIView):
     """API to fetch the local currency code."""
@@ -127,17 +153,10 @@ class GetLocalCurrencyAPIView(APIView):
         if not user.is_authenticated:
             return Response({"detail":"Authenticated Required"}, status=status.HTTP_401_UNAUTHORIZED)
         try:
-            local_currency = get_object_or_404(Currency.objects.filter(created_by=user).only("code"), is_local=True)
+            local_currency = local_currency_registry.get(user, request=request)
+            if local_currency is None:
+                raise Http404
             return Response({"local_currency_code": local_currency.code}, status=status.HTTP_200_OK)
-        except MultipleObjectsReturned:
-            # Log the error and return a 500 response
-            logger.error(f"Multiple local currencies found for request by user: {request.user.username}")
-            return Response(
-                {
-                    "error": "Multiple local currencies found. Please contact support.",
-                },
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
         except Http404:
             # Log the error and return a 404 response
             logger.error(f"No local currency found for request by user: {request.user.username}")
@@ -1,3 +1,5 @@
+import contextlib
+
 from django.apps import AppConfig
 from django.utils.translation import gettext_lazy as _
 
@@ -6,4 +8,7 @@ class CurrenciesConfig(AppConfig):
     name = 'money_tracker.currencies'
     verbose_name = _("Currencies")
 
+    def ready(self):
+        with contextlib.suppress(ImportError):
+            import money_tracker.currencies.signals  # noqa: F401
     
\ No newline at end of file
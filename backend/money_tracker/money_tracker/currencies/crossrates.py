@@ -0,0 +1,172 @@
+import logging
+import time
+from decimal import ROUND_HALF_UP
+from decimal import Decimal
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+
+from .models import Currency
+from .models import ExchangeRate
+
+logger = logging.getLogger(__name__)
+
+CROSS_RATE_CACHE_KEY = "cross_rates:user:{user_id}"
+# Bumped when the local currency changes: it is part of every user's matrix
+CROSS_RATE_GENERATION_KEY = "cross_rates:generation"
+CENTS = Decimal("0.01")
+
+
+class CrossRateMatrix:
+    """
+    Conversion factors between every pair of a user's currencies.
+
+    `to_local[i]` is the current rate of currency i against the local currency
+    (1 for the local currency `local`, NaN when it has no current rate) and
+    `matrix[i, j] = to_local[i] / to_local[j]` converts an amount in currency i
+    into currency j. Factors are float64; converted amounts are exact to the cent
+    for any amount below ~10^12.
+    """
+
+    def __init__(self, codes, to_local, local=None):
+        self.codes = list(codes)
+        self.local = local
+        self.index = {code: i for i, code in enumerate(self.codes)}
+        self.to_local = np.asarray(to_local, dtype=np.float64)
+        self.matrix = np.divide.outer(self.to_local, self.to_local)
+
+    def __contains__(self, code):
+        return code in self.index
+
+    def __len__(self):
+        return len(self.codes)
+
+    def _position(self, currency):
+        code = currency if isinstance(currency, str) else currency.pk
+        try:
+            position = self.index[code]
+        except KeyError:
+            raise ExchangeRate.DoesNotExist(f"Currency {code} is not one of the user's currencies")
+        if np.isnan(self.to_local[position]):
+            raise ExchangeRate.DoesNotExist(f"No current exchange rate for currency {code}")
+        return position
+
+    def set_rate(self, code, rate):
+        """
+        Replace the rate of one currency in place, touching only its row and column (O(N)).
+        :param rate: the new rate against the local currency, or None if it has no current rate.
+        """
+        i = self.index[code]
+        value = np.nan if rate is None else float(rate)
+        self.to_local[i] = value
+        self.matrix[i, :] = value / self.to_local
+        self.matrix[:, i] = self.to_local / value
+
+    def rate(self, from_currency, to_currency):
+        """The factor converting one unit of from_currency into to_currency, as a float."""
+        return float(self.matrix[self._position(from_currency), self._position(to_currency)])
+
+    def convert(self, amount, from_currency, to_currency):
+        """
+        Convert a single amount, rounded half up to cents.
+        :raises ExchangeRate.DoesNotExist: if either currency is unknown or has no current rate.
+        """
+        return self._cents(float(amount) * self.rate(from_currency, to_currency))
+
+    @staticmethod
+    def _cents(value):
+        return Decimal(repr(float(value))).quantize(CENTS, rounding=ROUND_HALF_UP)
+
+    def convert_array(self, amounts, from_currencies, to_currency):
+        """
+        Convert a whole column of amounts with one vectorised multiplication.
+        :param from_currencies: a single currency for all amounts or a parallel sequence of currencies.
+        :return: list of Decimal amounts, each rounded half up to cents exactly as convert() rounds it.
+        """
+        amounts = np.asarray(amounts, dtype=np.float64)
+        target = self._position(to_currency)
+        if isinstance(from_currencies, (str, Currency)):
+            factors = self.matrix[self._position(from_currencies), target]
+        else:
+            positions = np.fromiter((self._position(c) for c in from_currencies), dtype=np.intp, count=len(amounts))
+            factors = self.matrix[positions, target]
+        return [self._cents(value) for value in amounts * factors]
+
+
+class CrossRateService:
+    """
+    Builds and caches a CrossRateMatrix per user over the currencies the user holds
+    plus the local currency. Matrices are kept in the shared cache and patched in
+    place by the ExchangeRate signals when a single rate changes; adding or removing
+    a currency drops the user's matrix so that the next call rebuilds it. Entries
+    remember the generation they were built in, so invalidate_all() drops every
+    user's matrix without enumerating keys.
+    """
+
+    def __init__(self, timeout=None):
+        self.timeout = timeout or getattr(settings, "CROSS_RATE_CACHE_TIMEOUT", 3600)
+
+    @staticmethod
+    def cache_key(user_id):
+        return CROSS_RATE_CACHE_KEY.format(user_id=user_id)
+
+    def for_user(self, user):
+        """Return the CrossRateMatrix of a user (or user id), building it with two queries on a cache miss."""
+        user_id = getattr(user, "pk", user)
+        key = self.cache_key(user_id)
+        cached = cache.get_many([key, CROSS_RATE_GENERATION_KEY])
+        generation = cached.get(CROSS_RATE_GENERATION_KEY, 0)
+        entry = cached.get(key)
+        if entry is not None and entry[0] == generation:
+            return entry[1]
+        matrix = self.build(user_id)
+        cache.set(key, (generation, matrix), timeout=self.timeout)
+        return matrix
+
+    def build(self, user_id):
+        currencies = list(
+            Currency.objects.filter(Q(created_by_id=user_id) | Q(is_local=True)).values_list("code", "is_local")
+        )
+        rates = dict(
+            ExchangeRate.objects.filter(currency__created_by_id=user_id, is_current=True).values_list("currency_id", "rate")
+        )
+        codes = sorted(code for code, _ in currencies)
+        local = next((code for code, is_local in currencies if is_local), None)
+        to_local = [1.0 if code == local else float(rates[code]) if code in rates else np.nan for code in codes]
+        logger.debug(f"Built a {len(codes)}x{len(codes)} cross-rate matrix for user {user_id}")
+        return CrossRateMatrix(codes, to_local, local=local)
+
+    def refresh_currency(self, currency_code, owner_id):
+        """
+        Patch the row and column of one currency in its owner's cached matrix from its current rate.
+        Does nothing (and runs no query) when the owner has no cached matrix.
+        """
+        key = self.cache_key(owner_id)
+        cached = cache.get_many([key, CROSS_RATE_GENERATION_KEY])
+        entry = cached.get(key)
+        if entry is None or entry[0] != cached.get(CROSS_RATE_GENERATION_KEY, 0):
+            return
+        generation, matrix = entry
+        if currency_code not in matrix:
+            cache.delete(key)
+            return
+        rate = (
+            ExchangeRate.objects.filter(currency_id=currency_code, is_current=True).values_list("rate", flat=True).first()
+        )
+        matrix.set_rate(currency_code, rate)
+        cache.set(key, (generation, matrix), timeout=self.timeout)
+
+    def invalidate(self, user_id):
+        cache.delete(self.cache_key(user_id))
+
+    def invalidate_all(self):
+        try:
+            cache.incr(CROSS_RATE_GENERATION_KEY)
+        except ValueError:
+            # Start at the current time in ms so that a lost key never repeats a generation
+            cache.add(CROSS_RATE_GENERATION_KEY, int(time.time() * 1000), timeout=None)
+
+
+cross_rates = CrossRateService()
@@ -0,0 +1,117 @@
+import threading
+import time
+from bisect import bisect_right
+from datetime import date, datetime
+from datetime import time as dt_time
+from decimal import Decimal
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import ExchangeRate
+
+
+class HistoricalRateService:
+    """
+    Answers "what was the rate of currency X at timestamp T": the most recent
+    ExchangeRate created at or before T.
+
+    The full rate history of a currency is loaded once, ordered by the
+    (currency, created_at) index, and kept in memory as parallel sorted arrays
+    that are searched with bisect. Series are dropped by the ExchangeRate
+    signals and expire after EXCHANGE_RATE_HISTORY_TTL seconds.
+    """
+
+    def __init__(self, ttl=None):
+        self.ttl = ttl if ttl is not None else getattr(settings, "EXCHANGE_RATE_HISTORY_TTL", 300)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _code(currency):
+        return currency if isinstance(currency, str) else currency.pk
+
+    @staticmethod
+    def _as_datetime(at):
+        """Dates are valued at the end of that day in the current timezone."""
+        if isinstance(at, datetime):
+            return at if timezone.is_aware(at) else timezone.make_aware(at)
+        if isinstance(at, date):
+            return timezone.make_aware(datetime.combine(at, dt_time.max))
+        raise TypeError(f"Expected a date or datetime, got {type(at).__name__}")
+
+    def rate_at(self, currency, at):
+        """
+        Return the rate of a Currency (or currency code) in effect at `at` (date or datetime).
+        The local currency always converts at 1.
+        :raises ExchangeRate.DoesNotExist: if no rate had been recorded by then.
+        """
+        return self.rates_at([(currency, at)])[0]
+
+    def rates_at(self, pairs):
+        """
+        Batch form of rate_at for many (currency, at) pairs.
+        Every series that is not already loaded is fetched in a single query.
+        :return: list of Decimal rates parallel to pairs.
+        """
+        pairs = list(pairs)
+        series = self.load(currency for currency, _ in pairs if not getattr(currency, "is_local", False))
+
+        rates = []
+        for currency, at in pairs:
+            if getattr(currency, "is_local", False):
+                rates.append(Decimal("1"))
+                continue
+            code = self._code(currency)
+            timestamps, values = series[code]
+            index = bisect_right(timestamps, self._as_datetime(at)) - 1
+            if index < 0:
+                raise ExchangeRate.DoesNotExist(f"No exchange rate for currency {code} as of {at}")
+            rates.append(values[index])
+        return rates
+
+    def load(self, currencies):
+        """
+        Load the history of every currency that is not cached yet, in one query.
+        :return: dict of currency code -> (timestamps, rates) for all requested currencies.
+        """
+        codes = {self._code(currency) for currency in currencies}
+        now = time.monotonic()
+        series = {}
+        with self._lock:
+            for code in codes:
+                entry = self._series.get(code)
+                if entry is not None and entry[2] >= now:
+                    series[code] = entry[:2]
+
+        pending = codes - series.keys()
+        if pending:
+            loaded = {code: ([], []) for code in pending}
+            rows = (
+                ExchangeRate.objects.filter(currency_id__in=pending)
+                .order_by("currency_id", "created_at")
+                .values_list("currency_id", "created_at", "rate")
+            )
+            for code, created_at, rate in rows.iterator(chunk_size=2000):
+                timestamps, values = loaded[code]
+                timestamps.append(created_at)
+                values.append(rate)
+
+            expires_at = now + self.ttl
+            with self._lock:
+                for code, (timestamps, values) in loaded.items():
+                    self._series[code] = (timestamps, values, expires_at)
+            series.update(loaded)
+
+        return series
+
+    def invalidate(self, currency):
+        with self._lock:
+            self._series.pop(self._code(currency), None)
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+
+historical_rates = HistoricalRateService()
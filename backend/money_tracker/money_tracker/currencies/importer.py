@@ -0,0 +1,243 @@
+import csv
+import json
+import logging
+import time
+from datetime import date
+from decimal import ROUND_HALF_UP
+from decimal import Decimal
+from decimal import InvalidOperation
+from functools import partial
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.db import transaction
+from django.utils import timezone
+
+from .crossrates import cross_rates
+from .history import historical_rates
+from .models import Currency
+from .models import ExchangeRate
+from .rates import rate_resolver
+from .tasks import revalue_lcy_columns
+from .valuation import lcy_values_changed
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("csv", "json", "jsonl")
+MIN_RATE = Decimal("0.1")
+MAX_RATE = Decimal("999999.99")  # max_digits=8, decimal_places=2
+MAX_REPORTED_ERRORS = 20
+
+
+def detect_format(filename):
+    """Guess the import format from a file name: .csv, .json, or .jsonl/.ndjson."""
+    suffix = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+    if suffix == "ndjson":
+        return "jsonl"
+    if suffix in FORMATS:
+        return suffix
+    raise ValidationError(f"Cannot tell the format of '{filename}'; expected one of: {', '.join(FORMATS)}.")
+
+
+def read_rows(stream, fmt):
+    """
+    Yield (line, currency, date, rate) tuples from a text stream.
+    csv needs a currency,date,rate header; jsonl holds one object per line and is read lazily;
+    json is a single array of {"currency", "date", "rate"} objects.
+    """
+    if fmt == "csv":
+        for line, row in enumerate(csv.DictReader(stream), start=2):
+            yield line, row.get("currency"), row.get("date"), row.get("rate")
+    elif fmt == "jsonl":
+        for line, text in enumerate(stream, start=1):
+            if text.strip():
+                yield (line, *_json_fields(json_loads(text, line)))
+    elif fmt == "json":
+        data = json_loads(stream.read())
+        if not isinstance(data, list):
+            raise ValidationError("Expected a JSON array of rate objects.")
+        for index, item in enumerate(data, start=1):
+            yield (index, *_json_fields(item))
+    else:
+        raise ValidationError(f"Unsupported format '{fmt}'; expected one of: {', '.join(FORMATS)}.")
+
+
+def json_loads(text, line=None):
+    try:
+        return json.loads(text)
+    except ValueError as e:
+        where = f"Line {line}: " if line else ""
+        raise ValidationError(f"{where}invalid JSON ({e}).")
+
+
+def _json_fields(item):
+    if not isinstance(item, dict):
+        return None, None, None
+    return item.get("currency"), item.get("date"), item.get("rate")
+
+
+class RateImporter:
+    """
+    Bulk loader for exchange rate history.
+
+    Rows are validated a chunk at a time (currency codes are resolved with one
+    query per chunk of unseen codes) and inserted with one INSERT per chunk. A rate
+    dated D is stored at the start of D. Within a chunk the last row for a currency
+    and day wins; days that already have a rate are left alone (ON CONFLICT DO NOTHING).
+    Imported rates are not current. With set_current, the newest rate of every
+    imported currency becomes current, using set-based updates. The whole import
+    runs in one transaction and is rolled back if any row is invalid.
+    """
+
+    def __init__(self, user, chunk_size=None, set_current=False):
+        self.user = user
+        self.chunk_size = chunk_size or getattr(settings, "RATE_IMPORT_CHUNK_SIZE", 5000)
+        self.set_current = set_current
+        self._currencies = {}  # code -> is_local, or None if unknown
+
+    def run(self, rows):
+        """
+        Import an iterable of (line, currency, date, rate) tuples, e.g. from read_rows().
+        :raises ValidationError: listing (at most MAX_REPORTED_ERRORS) invalid rows.
+        :return: dict of row counts, the currencies touched and the elapsed seconds.
+        """
+        started = time.perf_counter()
+        report = {"rows_read": 0, "inserted": 0, "existing": 0, "currencies": [], "current_updated": []}
+        errors = []
+        touched = set()
+
+        with transaction.atomic():
+            batch = []
+            for row in rows:
+                report["rows_read"] += 1
+                batch.append(row)
+                if len(batch) >= self.chunk_size:
+                    self._flush(batch, report, errors, touched)
+                    batch = []
+            self._flush(batch, report, errors, touched)
+
+            if errors:
+                transaction.set_rollback(True)
+            elif self.set_current and touched:
+                report["current_updated"] = self._move_current(touched)
+
+        if errors:
+            if len(errors) > MAX_REPORTED_ERRORS:
+                errors = [*errors[:MAX_REPORTED_ERRORS], f"... and {len(errors) - MAX_REPORTED_ERRORS} more errors."]
+            raise ValidationError(errors)
+
+        for code in touched:
+            historical_rates.invalidate(code)
+            transaction.on_commit(partial(historical_rates.invalidate, code))
+        if report["current_updated"]:
+            lcy_values_changed.send(sender=ExchangeRate, currencies=report["current_updated"])
+            owners = set(Currency.objects.filter(code__in=report["current_updated"]).values_list("created_by_id", flat=True))
+            for owner_id in owners:
+                cross_rates.invalidate(owner_id)
+        for code in report["current_updated"]:
+            rate_resolver.invalidate(code)
+            transaction.on_commit(partial(rate_resolver.invalidate, code))
+            if getattr(settings, "LCY_REVALUE_ON_RATE_CHANGE", True):
+                transaction.on_commit(partial(revalue_lcy_columns.delay, code))
+
+        report["currencies"] = sorted(touched)
+        report["seconds"] = round(time.perf_counter() - started, 3)
+        logger.info(f"Imported {report['inserted']} exchange rates for {len(touched)} currencies in {report['seconds']}s")
+        return report
+
+    def _flush(self, batch, report, errors, touched):
+        if not batch:
+            return
+        self._resolve_currencies({str(code).strip().upper() for _, code, _, _ in batch if code})
+
+        valid = {}
+        for line, code, day, rate in batch:
+            parsed = self._validate(line, code, day, rate, errors)
+            if parsed is not None:
+                valid[parsed[:2]] = parsed[2]  # last row for a currency and day wins
+        if errors or not valid:
+            return
+
+        inserted = self._insert(valid)
+        report["inserted"] += inserted
+        report["existing"] += len(valid) - inserted
+        touched.update(code for code, _ in valid)
+
+    def _insert(self, valid):
+        """
+        One INSERT ... SELECT FROM unnest(arrays) per chunk, skipping days that already
+        have a rate (unique_currency_per_day). bulk_create cannot be used because it
+        overwrites the auto_now_add created_at.
+        """
+        table = connection.ops.quote_name(ExchangeRate._meta.db_table)
+        codes, days, rates = [], [], []
+        for (code, day), rate in valid.items():
+            codes.append(code)
+            days.append(day.isoformat())
+            rates.append(str(rate))
+        # Arrays of text are far cheaper to adapt than Decimals and datetimes; a day starts at
+        # midnight in the current time zone, as with TruncDate in unique_currency_per_day.
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} (currency_id, rate, is_current, created_by_id, created_at, modified_at) "
+                f"SELECT v.currency_id, v.rate::numeric, FALSE, %s, v.day::date::timestamp AT TIME ZONE %s, NOW() "
+                f"FROM unnest(%s::varchar[], %s::text[], %s::text[]) AS v(currency_id, day, rate) "
+                f"ON CONFLICT DO NOTHING",
+                [self.user.pk, timezone.get_current_timezone_name(), codes, days, rates],
+            )
+            return cursor.rowcount
+
+    def _resolve_currencies(self, codes):
+        unseen = codes - self._currencies.keys()
+        if unseen:
+            found = dict(Currency.objects.filter(code__in=unseen).values_list("code", "is_local"))
+            for code in unseen:
+                self._currencies[code] = found.get(code)
+
+    def _validate(self, line, code, day, rate, errors):
+        code = str(code).strip().upper() if code else ""
+        if not code:
+            errors.append(f"Line {line}: currency is required.")
+            return None
+        is_local = self._currencies.get(code)
+        if is_local is None:
+            errors.append(f"Line {line}: unknown currency '{code}'.")
+            return None
+        if is_local:
+            errors.append(f"Line {line}: exchange rates cannot be assigned to a local currency.")
+            return None
+        try:
+            day = day if isinstance(day, date) else date.fromisoformat(str(day).strip())
+        except ValueError:
+            errors.append(f"Line {line}: invalid date '{day}', expected YYYY-MM-DD.")
+            return None
+        try:
+            rate = Decimal(str(rate).strip()).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        except (InvalidOperation, ValueError):
+            errors.append(f"Line {line}: invalid rate '{rate}'.")
+            return None
+        if not MIN_RATE <= rate <= MAX_RATE:
+            errors.append(f"Line {line}: rate must be between {MIN_RATE} and {MAX_RATE}.")
+            return None
+        return code, day, rate
+
+    def _move_current(self, codes):
+        """Make the newest rate of each currency current; return the codes whose current rate changed."""
+        latest = dict(
+            ExchangeRate.objects.filter(currency_id__in=codes)
+            .order_by("currency_id", "-created_at")
+            .distinct("currency_id")
+            .values_list("currency_id", "id")
+        )
+        current = dict(ExchangeRate.objects.filter(currency_id__in=codes, is_current=True).values_list("currency_id", "id"))
+        changed = sorted(code for code, rate_id in latest.items() if current.get(code) != rate_id)
+        if changed:
+            # Clear first: unique_current_rate_per_currency allows one current row per currency at any time
+            ExchangeRate.objects.filter(currency_id__in=changed, is_current=True).update(
+                is_current=False, modified_by=self.user
+            )
+            ExchangeRate.objects.filter(id__in=[latest[code] for code in changed]).update(
+                is_current=True, modified_by=self.user
+            )
+        return changed
@@ -0,0 +1,115 @@
+import random
+import time
+from decimal import Decimal
+from decimal import ROUND_HALF_UP
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import transaction
+from django.test.utils import override_settings
+
+from money_tracker.currencies.models import Currency
+from money_tracker.currencies.models import ExchangeRate
+from money_tracker.currencies.valuation import VALUATION_LIVE
+from money_tracker.currencies.valuation import VALUATION_STORED
+from money_tracker.currencies.valuation import revalue_currency
+from money_tracker.expenses.models import FixedExpense
+
+User = get_user_model()
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares stored and live LCY valuation on a synthetic FixedExpense table. "
+        "All generated data is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", required=True, help="Username or ID of the user owning the synthetic rows")
+        parser.add_argument("--rows", type=int, default=100000, help="Number of rows to generate")
+        parser.add_argument("--currencies", type=int, default=5, help="Number of foreign currencies to spread rows over")
+        parser.add_argument("--repeat", type=int, default=5, help="Timed runs per measurement; the best run is reported")
+        parser.add_argument("--page-size", type=int, default=100, help="Rows read by the list measurement")
+
+    def handle(self, *args, **options):
+        user_identifier = options["user"]
+        try:
+            if user_identifier.isdigit():
+                user = User.objects.get(pk=int(user_identifier))
+            else:
+                user = User.objects.get(username=user_identifier)
+        except User.DoesNotExist:
+            raise CommandError(f"User '{user_identifier}' not found.")
+
+        try:
+            with transaction.atomic():
+                self._run(user, options)
+                raise _Rollback
+        except _Rollback:
+            self.stdout.write("Synthetic data rolled back.")
+
+    def _run(self, user, options):
+        rows, repeat, page_size = options["rows"], options["repeat"], options["page_size"]
+        codes = [f"Z{i:02d}" for i in range(options["currencies"])]
+        if Currency.objects.filter(code__in=codes).exists():
+            raise CommandError(f"Benchmark currency codes {codes[0]}..{codes[-1]} already exist.")
+
+        local = Currency.objects.filter(is_local=True).first()
+        if local is None:
+            local = Currency.objects.create(code="ZLC", description="Benchmark local", is_local=True, created_by=user)
+        currencies = Currency.objects.bulk_create(
+            [Currency(code=code, description=f"Benchmark {code}", created_by=user) for code in codes]
+        )
+        rates = {c.code: Decimal(random.randint(50, 15000)) / 100 for c in currencies}
+        ExchangeRate.objects.bulk_create(
+            [ExchangeRate(currency=c, rate=rates[c.code], is_current=True, created_by=user) for c in currencies]
+        )
+
+        self.stdout.write(f"Generating {rows} rows over {len(currencies)} currencies...")
+        batch = []
+        for i in range(rows):
+            currency = currencies[i % len(currencies)]
+            amount = Decimal(random.randint(100, 1000000)) / 100
+            batch.append(FixedExpense(
+                expense_name=f"benchmark {i}", currency=currency, amount=amount, created_by=user,
+                amount_lcy=(amount * rates[currency.code]).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP),
+            ))
+            if len(batch) == 5000:
+                FixedExpense.objects.bulk_create(batch)
+                batch = []
+        FixedExpense.objects.bulk_create(batch)
+
+        queryset = FixedExpense.objects.filter(created_by=user)
+        results = []
+        for mode in (VALUATION_STORED, VALUATION_LIVE):
+            with override_settings(LCY_VALUATION_MODE=mode):
+                results.append((f"total ({mode})", self._best(repeat, queryset.total_lcy)))
+                results.append((
+                    f"list {page_size} rows ({mode})",
+                    self._best(repeat, lambda: list(queryset.valued().select_related("currency")[:page_size])),
+                ))
+
+        # Stored mode pays for a rate change with a rewrite of every affected row; live mode pays nothing.
+        target = currencies[0]
+        ExchangeRate.objects.filter(currency=target, is_current=True).update(rate=rates[target.code] + 1)
+        start = time.perf_counter()
+        report = revalue_currency(target.code)
+        results.append((f"rate change rewrite ({report['rows_updated']} rows, stored)", time.perf_counter() - start))
+
+        width = max(len(label) for label, _ in results)
+        for label, seconds in results:
+            self.stdout.write(f"{label.ljust(width)}  {seconds * 1000:10.2f} ms")
+
+    @staticmethod
+    def _best(repeat, func):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
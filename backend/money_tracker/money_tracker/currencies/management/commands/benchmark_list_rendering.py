@@ -0,0 +1,101 @@
+import random
+import time
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from money_tracker.currencies.models import Currency
+from money_tracker.expenses.api.serializers import FixedExpenseSerializer
+from money_tracker.expenses.models import FixedExpense
+
+User = get_user_model()
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares regular and compiled rendering of a synthetic FixedExpense list, in rows per second. "
+        "All generated data is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", required=True, help="Username or ID of the user owning the synthetic rows")
+        parser.add_argument("--rows", type=int, default=50000, help="Number of rows to generate and render")
+        parser.add_argument("--repeat", type=int, default=3, help="Timed runs per measurement; the best run is reported")
+
+    def handle(self, *args, **options):
+        user_identifier = options["user"]
+        try:
+            if user_identifier.isdigit():
+                user = User.objects.get(pk=int(user_identifier))
+            else:
+                user = User.objects.get(username=user_identifier)
+        except User.DoesNotExist:
+            raise CommandError(f"User '{user_identifier}' not found.")
+
+        try:
+            with transaction.atomic():
+                self._run(user, options)
+                raise _Rollback
+        except _Rollback:
+            self.stdout.write("Synthetic data rolled back.")
+
+    def _run(self, user, options):
+        rows, repeat = options["rows"], options["repeat"]
+        local = Currency.objects.filter(is_local=True).first()
+        if local is None:
+            local = Currency.objects.create(code="ZLC", description="Benchmark local", is_local=True, created_by=user)
+
+        self.stdout.write(f"Generating {rows} rows...")
+        batch = []
+        for i in range(rows):
+            amount = Decimal(random.randint(100, 1000000)) / 100
+            batch.append(FixedExpense(
+                expense_name=f"benchmark {i}", currency=local, amount=amount, amount_lcy=amount,
+                notes="benchmark row", created_by=user,
+            ))
+            if len(batch) == 5000:
+                FixedExpense.objects.bulk_create(batch)
+                batch = []
+        FixedExpense.objects.bulk_create(batch)
+
+        request = Request(APIRequestFactory().get("/"))
+        request.user = user
+        serializer = FixedExpenseSerializer(context={"request": request})
+        queryset = FixedExpense.objects.filter(created_by=user).select_related("currency", "created_by", "modified_by")
+        queryset = queryset.valued().order_by("-created_at", "-id")
+        reader = serializer.compile_reader(queryset)
+
+        def regular():
+            return FixedExpenseSerializer(queryset, many=True, context={"request": request}).data
+
+        def compiled():
+            return reader.render(reader.values(queryset, "pk", "created_at"))  # with the pagination keys
+
+        renderer = JSONRenderer()
+        if renderer.render(regular()) != renderer.render(compiled()):
+            raise CommandError("Compiled rendering differs from the regular serializer output.")
+
+        results = [("regular serializer", self._best(repeat, regular)), ("compiled reader", self._best(repeat, compiled))]
+        width = max(len(label) for label, _ in results)
+        for label, seconds in results:
+            self.stdout.write(f"{label.ljust(width)}  {seconds * 1000:10.2f} ms  {rows / seconds:12.0f} rows/s")
+        self.stdout.write(f"Speed-up: {results[0][1] / results[1][1]:.1f}x")
+
+    @staticmethod
+    def _best(repeat, func):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
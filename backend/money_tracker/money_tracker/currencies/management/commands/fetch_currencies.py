@@ -1,7 +1,17 @@
+import json
+import time
+from functools import partial
+
 import requests
 from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from money_tracker.currencies.crossrates import cross_rates
 from money_tracker.currencies.models import Currency
+from money_tracker.currencies.registry import local_currency_registry
+from money_tracker.reports.push import notify_all_data_changes, notify_data_change
+from money_tracker.reports.summary import invalidate_all_summaries, invalidate_summary
+from money_tracker.reports.versions import bump_data_version
 
 User = get_user_model()
 
@@ -16,6 +26,10 @@ class Command(BaseCommand):
             required=True,
             help="Username or ID of the user running this command"
         )
+        parser.add_argument(
+            '--from-file',
+            help="Read the {code: description} JSON from this file instead of the currency API"
+        )
 
     def handle(self, *args, **options):
         user_identifier = options['user']
@@ -30,31 +44,125 @@ class Command(BaseCommand):
         except User.DoesNotExist:
             raise CommandError(f"User '{user_identifier}' not found.")
 
-        self.stdout.write(f"Fetching currency codes using user: {user.username}...")
+        started = time.perf_counter()
+        if options['from_file']:
+            self.stdout.write(f"Loading currency codes from {options['from_file']} using user: {user.username}...")
+            try:
+                with open(options['from_file'], encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                raise CommandError(f"Could not read currency codes from {options['from_file']}: {e}")
+        else:
+            self.stdout.write(f"Fetching currency codes using user: {user.username}...")
+            try:
+                response = requests.get(CURRENCY_API_URL, timeout=30)
+                response.raise_for_status()
+                data = response.json()
+            except requests.RequestException as e:
+                self.stderr.write(self.style.ERROR(f"Error fetching currency codes: {e}"))
+                return
+        if not isinstance(data, dict):
+            raise CommandError("Expected a JSON object mapping currency codes to descriptions.")
+        fetched_in = time.perf_counter() - started
 
-        try:
-            response = requests.get(CURRENCY_API_URL)
-            response.raise_for_status()
-            data = response.json()
-
-            created, updated = 0, 0
-            for code, description in data.items():
-                try:
-                    obj = Currency.objects.get(code=code)
-                    obj.description = description
-                    obj.modified_by = user
-                    obj.save(update_fields=["description", "modified_by"])
-                    updated += 1
-                except Currency.DoesNotExist:
-                    obj = Currency.objects.create(
-                        code=code,
-                        description=description,
-                        created_by=user,
-                    )
-                    created += 1
+        started = time.perf_counter()
+        stats = self.sync(data, user)
+        synced_in = time.perf_counter() - started
 
-            self.stdout.write(self.style.SUCCESS(
-                f"Currency sync complete: {created} added, {updated} updated."
+        self.stdout.write(self.style.SUCCESS(
+            f"Currency sync complete: {stats['created']} added, {stats['updated']} updated."
+        ))
+        self.stdout.write(
+            f"{stats['received']} received, {stats['unchanged']} unchanged, {len(stats['skipped'])} skipped, "
+            f"{len(stats['truncated'])} truncated; fetch {fetched_in:.3f}s, sync {synced_in:.3f}s"
+        )
+        if stats['skipped']:
+            self.stderr.write(self.style.WARNING(
+                f"Skipped (code too long or no description): {', '.join(map(str, stats['skipped']))}"
+            ))
+        if stats['truncated']:
+            self.stderr.write(self.style.WARNING(
+                f"Descriptions cut to {Currency._meta.get_field('description').max_length} characters: "
+                f"{', '.join(stats['truncated'])}"
             ))
-        except requests.RequestException as e:
-            self.stderr.write(self.style.ERROR(f"Error fetching currency codes: {e}"))
\ No newline at end of file
+
+    def sync(self, data, user):
+        """
+        Upsert the given {code: description} mapping in one transaction.
+        Rows whose description already matches are not written at all.
+        :return: dict of row counts, and the codes that were skipped or had their description truncated.
+        """
+        code_length = Currency._meta.get_field("code").max_length
+        description_length = Currency._meta.get_field("description").max_length
+        incoming = {}
+        skipped = []
+        truncated = []
+        for code, description in data.items():
+            if not isinstance(description, str) or not description or len(code) > code_length:
+                skipped.append(code)
+                continue
+            if len(description) > description_length:
+                truncated.append(code)
+            incoming[code] = description[:description_length]
+
+        with transaction.atomic():
+            existing = {
+                code: (description, is_local, created_by_id)
+                for code, description, is_local, created_by_id in Currency.objects.select_for_update()
+                .filter(code__in=incoming)
+                .values_list("code", "description", "is_local", "created_by_id")
+            }
+            rows = []
+            created = updated = 0
+            for code, description in incoming.items():
+                if code not in existing:
+                    rows.append(Currency(code=code, description=description, created_by=user))
+                    created += 1
+                elif existing[code][0] != description:
+                    rows.append(Currency(code=code, description=description, created_by=user, modified_by=user))
+                    updated += 1
+
+            if rows:
+                Currency.objects.bulk_create(
+                    rows,
+                    update_conflicts=True,
+                    unique_fields=["code"],
+                    update_fields=["description", "modified_by", "modified_at"],
+                )
+                changed = [values for code, values in existing.items() if incoming[code] != values[0]]
+                self.invalidate(
+                    owner_ids={created_by_id for _, _, created_by_id in changed} | ({user.pk} if created else set()),
+                    local_owner_ids={created_by_id for _, is_local, created_by_id in changed if is_local},
+                )
+
+        return {
+            "received": len(data),
+            "created": created,
+            "updated": updated,
+            "unchanged": len(incoming) - created - updated,
+            "skipped": skipped,
+            "truncated": truncated,
+        }
+
+    def invalidate(self, owner_ids, local_owner_ids):
+        """
+        bulk_create sends no signals; do once per batch what the Currency post_save receivers
+        (currencies.signals, reports.signals) do per row, now and again once the transaction commits.
+        """
+        for owner_id in local_owner_ids:
+            local_currency_registry.invalidate(owner_id)
+            transaction.on_commit(partial(local_currency_registry.invalidate, owner_id))
+        if local_owner_ids:
+            # The local currency is named in every user's cross rates and summaries
+            cross_rates.invalidate_all()
+            transaction.on_commit(cross_rates.invalidate_all)
+            invalidate_all_summaries()
+            transaction.on_commit(invalidate_all_summaries)
+            transaction.on_commit(notify_all_data_changes)
+        for owner_id in owner_ids:
+            cross_rates.invalidate(owner_id)
+            invalidate_summary(owner_id)
+            transaction.on_commit(partial(invalidate_summary, owner_id))
+            bump_data_version(owner_id)
+            transaction.on_commit(partial(bump_data_version, owner_id))
+            transaction.on_commit(partial(notify_data_change, owner_id))
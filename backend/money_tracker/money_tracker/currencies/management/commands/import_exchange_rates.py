@@ -0,0 +1,62 @@
+import sys
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from money_tracker.currencies.importer import FORMATS
+from money_tracker.currencies.importer import RateImporter
+from money_tracker.currencies.importer import detect_format
+from money_tracker.currencies.importer import read_rows
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Bulk imports exchange rate history from a CSV, JSON or JSON Lines file of (currency, date, rate)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to import, or - to read from stdin")
+        parser.add_argument("--user", required=True, help="Username or ID of the user recorded as creator")
+        parser.add_argument("--format", choices=FORMATS, help="Input format; guessed from the file name by default")
+        parser.add_argument("--set-current", action="store_true", help="Make the newest rate of each imported currency current")
+        parser.add_argument("--chunk-size", type=int, help="Rows validated and inserted per chunk")
+
+    def handle(self, *args, **options):
+        user_identifier = options["user"]
+        try:
+            if user_identifier.isdigit():
+                user = User.objects.get(pk=int(user_identifier))
+            else:
+                user = User.objects.get(username=user_identifier)
+        except User.DoesNotExist:
+            raise CommandError(f"User '{user_identifier}' not found.")
+
+        path = options["path"]
+        try:
+            fmt = options["format"] or detect_format(path)
+        except ValidationError as e:
+            raise CommandError(e.messages[0])
+
+        importer = RateImporter(user, chunk_size=options["chunk_size"], set_current=options["set_current"])
+        try:
+            if path == "-":
+                report = importer.run(read_rows(sys.stdin, fmt))
+            else:
+                with open(path, encoding="utf-8-sig", newline="") as f:
+                    report = importer.run(read_rows(f, fmt))
+        except OSError as e:
+            raise CommandError(f"Could not read {path}: {e}")
+        except ValidationError as e:
+            for message in e.messages:
+                self.stderr.write(self.style.ERROR(message))
+            raise CommandError("Import aborted; no rates were saved.")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {report['inserted']} exchange rates for {len(report['currencies'])} currencies "
+            f"in {report['seconds']:.3f}s."
+        ))
+        self.stdout.write(f"{report['rows_read']} rows read, {report['existing']} already present.")
+        if report["current_updated"]:
+            self.stdout.write(f"Current rate updated for: {', '.join(report['current_updated'])}")
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.2 on 2026-10-18 05:40
+
+import django.db.models.functions.datetime
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('currencies', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='exchangerate',
+            name='unique_currency_per_day',
+        ),
+        migrations.AddIndex(
+            model_name='exchangerate',
+            index=models.Index(fields=['currency', 'created_at'], name='exchangerate_currency_asof_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='exchangerate',
+            constraint=models.UniqueConstraint(models.F('currency'), django.db.models.functions.datetime.TruncDate('created_at'), name='unique_currency_per_day'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.2 on 2026-10-18 05:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('currencies', '0003_exchangerate_history'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='exchangerate',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_current', True)), fields=('currency',), name='unique_current_rate_per_currency'),
+        ),
+    ]
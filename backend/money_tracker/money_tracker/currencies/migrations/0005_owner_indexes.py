@@ -0,0 +1,23 @@
+# Generated by Django 5.2.2 on 2026-10-18 06:13
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('currencies', '0004_exchangerate_unique_current'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='currency',
+            index=models.Index(fields=['created_by', '-is_local', 'code'], name='currency_owner_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exchangerate',
+            index=models.Index(fields=['created_by', '-created_at', '-id'], include=('currency', 'rate'), name='exchangerate_owner_idx'),
+        ),
+    ]
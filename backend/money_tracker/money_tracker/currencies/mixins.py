@@ -1,28 +1,64 @@
-from money_tracker.currencies.models import ExchangeRate
+from money_tracker.currencies.rates import rate_resolver
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP
 import logging
 logger = logging.getLogger(__name__)
 
+CENTS = Decimal("0.01")
+
+
+def to_cents(value):
+    """Quantizes an LCY amount to two decimal places, rounding half up."""
+    return Decimal(str(value)).quantize(CENTS, rounding=ROUND_HALF_UP)
+
 class CurrencyConversionMixin:
     def convert_to_lcy(self, amount, currency):
         """
-        Converts the given amount to the local currency using the exchange rate.
-        If the currency is local, the amount is returned as-is.
+        Converts the given amount to the local currency using the current exchange rate.
+        If the currency is local, the amount is returned unconverted.
+        Rates are resolved through the cached rate_resolver rather than a query per call.
         :param amount: Decimal, amount to convert.
         :param currency: Currency object, the foreign currency.
-        :return: Decimal, converted amount in local currency.
+        :return: Decimal, converted amount in local currency, quantized to two decimal places like convert_many.
         """
         if currency.is_local:
             # If the currency is local, no conversion is needed
-            return amount
+            return to_cents(amount)
         else:
             try:
-                exchange_rate = ExchangeRate.objects.get(currency=currency)
-                return Decimal(str(amount)) * exchange_rate.rate 
+                rate = rate_resolver.get_rate(currency)
+                return to_cents(Decimal(str(amount)) * rate)
             except ObjectDoesNotExist:
                 # Log the error and raise a ValidationError
                 logger.error(f"Missing exchange rate for currency {currency}")
                 raise ValidationError({"currency": f"No exchange rate found for currency {currency}"})
 
+    @classmethod
+    def convert_many(cls, amounts, currencies):
+        """
+        Converts many amounts to the local currency with one rate lookup for the whole batch.
+        Every foreign rate that is not already cached is fetched in a single IN query.
+        :param amounts: iterable of Decimal amounts.
+        :param currencies: a single Currency applied to every amount, or an iterable of
+            Currency objects parallel to amounts.
+        :return: list of Decimal amounts in local currency, quantized to two decimal places.
+        """
+        amounts = list(amounts)
+        if hasattr(currencies, "is_local"):
+            currencies = [currencies] * len(amounts)
+        else:
+            currencies = list(currencies)
+        if len(currencies) != len(amounts):
+            raise ValueError("amounts and currencies must be the same length.")
+
+        foreign = {currency.pk: currency for currency in currencies if not currency.is_local}
+        rates = rate_resolver.get_rates(foreign) if foreign else {}
+        missing = [str(foreign[code]) for code in foreign if code not in rates]
+        if missing:
+            logger.error(f"Missing exchange rate for currencies {', '.join(missing)}")
+            raise ValidationError({"currency": f"No exchange rate found for currency {', '.join(missing)}"})
 
+        return [
+            to_cents(amount if currency.is_local else Decimal(str(amount)) * rates[currency.pk])
+            for amount, currency in zip(amounts, currencies)
+        ]
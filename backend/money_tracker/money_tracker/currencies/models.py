@@ -7,7 +7,6 @@ from decimal import Decimal, ROUND_HALF_UP
 from django.db import transaction
 from django.db.utils import IntegrityError
 import logging
-from django.core.cache import cache
 from django.db.models.functions import TruncDate
 User = settings.AUTH_USER_MODEL
 logger = logging.getLogger(__name__)
@@ -72,7 +71,10 @@ class Currency(models.Model):
         ]
         indexes = [
             models.Index(fields=["is_local"]),
-            models.Index(fields=["code"])
+            models.Index(fields=["code"]),
+            models.Index(fields=["created_by", "-is_local", "code"], name="currency_owner_idx"),
+            # Delta sync reads the rows an owner changed after a watermark (money_tracker.reports.sync)
+            models.Index(fields=["created_by", "modified_at"], name="currency_sync_idx"),
         ]
         verbose_name_plural = "Currencies"
         ordering = ['-is_local', 'code']
@@ -89,12 +91,9 @@ class ExchangeRate(models.Model):
     modified_at = models.DateTimeField(auto_now=True)
 
     def __str__(self) -> str:
-        cache_key = "local_currency"
-        local_currency = cache.get(cache_key)
-        if local_currency is None:
-            local_currency = Currency.objects.filter(is_local=True).first()
-            cache.set(cache_key, local_currency, timeout=3600)  # Cache for an hour
+        from .registry import local_currency_registry  # avoid a circular import
 
+        local_currency = local_currency_registry.get(self.created_by_id)
         local_currency_description = local_currency.description if local_currency else "N/A"
         return (
             f"Exchange rate for {self.currency.description} "
@@ -140,6 +139,8 @@ class ExchangeRate(models.Model):
         except IntegrityError as e:
             if "unique_currency_per_day" in str(e):
                 raise ValidationError("Only one exchange rate per currency per day is allowed.")
+            elif "unique_current_rate_per_currency" in str(e):
+                raise ValidationError("Only one exchange rate can be marked as current per currency.")
             else:
                 raise ValidationError(f"An error occurred while saving the exchange rate: {str(e)}")
             
@@ -154,14 +155,21 @@ class ExchangeRate(models.Model):
         indexes = [
             models.Index(fields=["currency"]),
             models.Index(fields=["rate"]),
+            models.Index(fields=["currency", "created_at"], name="exchangerate_currency_asof_idx"),
+            models.Index(fields=["created_by", "-created_at", "-id"], include=["currency", "rate"], name="exchangerate_owner_idx"),
         ]
         ordering = ["-created_at"]
         verbose_name = "Exchange Rate"
         verbose_name_plural = "Exchange Rates"
         constraints = [
         models.UniqueConstraint(
-            fields=["currency"],
+            "currency",
+            TruncDate("created_at"),
             name="unique_currency_per_day",
-            condition=models.Q(created_at__date=TruncDate("created_at")),
-        )
+        ),
+        models.UniqueConstraint(
+            fields=["currency"],
+            condition=models.Q(is_current=True),
+            name="unique_current_rate_per_currency",
+        ),
     ]
\ No newline at end of file
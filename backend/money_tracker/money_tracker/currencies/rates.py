@@ -0,0 +1,146 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import ExchangeRate
+
+logger = logging.getLogger(__name__)
+
+RATE_CACHE_KEY = "exchange_rate:current:{code}"
+
+
+class ExchangeRateResolver:
+    """
+    Resolves the current exchange rate of a currency through two cache tiers:
+    a small process-local LRU in front of the shared (Redis) cache, falling back
+    to the database. Only rows with is_current=True are ever resolved.
+
+    Entries are invalidated by the ExchangeRate post_save/post_delete signals.
+    Local entries also expire after EXCHANGE_RATE_LOCAL_CACHE_TTL seconds so that
+    other worker processes pick up a new rate without a shared round trip per lookup.
+    """
+
+    def __init__(self, maxsize=None, local_ttl=None, shared_timeout=None):
+        self.maxsize = maxsize or getattr(settings, "EXCHANGE_RATE_LOCAL_CACHE_SIZE", 256)
+        self.local_ttl = local_ttl if local_ttl is not None else getattr(settings, "EXCHANGE_RATE_LOCAL_CACHE_TTL", 30)
+        self.shared_timeout = shared_timeout or getattr(settings, "EXCHANGE_RATE_CACHE_TIMEOUT", 3600)
+        self._local = OrderedDict()
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    @staticmethod
+    def cache_key(code):
+        return RATE_CACHE_KEY.format(code=code)
+
+    @staticmethod
+    def _code(currency):
+        return currency if isinstance(currency, str) else currency.pk
+
+    def get_rate(self, currency):
+        """
+        Return the current rate of the given Currency (or currency code) as a Decimal.
+        :raises ExchangeRate.DoesNotExist: if the currency has no current rate.
+        """
+        code = self._code(currency)
+        rates = self.get_rates([code])
+        if code not in rates:
+            raise ExchangeRate.DoesNotExist(f"No current exchange rate for currency {code}")
+        return rates[code]
+
+    def get_rates(self, currencies):
+        """
+        Resolve the current rates of many currencies at once.
+        Cache misses are loaded with a single IN query.
+        :return: dict of currency code -> Decimal; codes without a current rate are left out.
+        """
+        codes = {self._code(currency) for currency in currencies}
+        rates = {}
+
+        for code in codes:
+            rate = self._get_local(code)
+            if rate is not None:
+                self.local_hits += 1
+                rates[code] = rate
+
+        pending = codes - rates.keys()
+        if pending:
+            shared = cache.get_many([self.cache_key(code) for code in pending])
+            for code in list(pending):
+                rate = shared.get(self.cache_key(code))
+                if rate is not None:
+                    self.shared_hits += 1
+                    rates[code] = Decimal(rate)
+                    self._set_local(code, rates[code])
+                    pending.discard(code)
+
+        if pending:
+            self.misses += len(pending)
+            fetched = dict(
+                ExchangeRate.objects.filter(currency_id__in=pending, is_current=True)
+                .values_list("currency_id", "rate")
+            )
+            if fetched:
+                cache.set_many(
+                    {self.cache_key(code): str(rate) for code, rate in fetched.items()},
+                    timeout=self.shared_timeout,
+                )
+            for code, rate in fetched.items():
+                self._set_local(code, rate)
+            rates.update(fetched)
+
+        return rates
+
+    def invalidate(self, currency):
+        """Drop the cached rate of a currency from both tiers."""
+        code = self._code(currency)
+        with self._lock:
+            self._local.pop(code, None)
+        cache.delete(self.cache_key(code))
+
+    def clear(self):
+        """Empty the process-local tier."""
+        with self._lock:
+            self._local.clear()
+
+    def reset_stats(self):
+        self.local_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """Hit/miss counters of this process since the last reset."""
+        lookups = self.local_hits + self.shared_hits + self.misses
+        return {
+            "local_hits": self.local_hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "hit_ratio": (self.local_hits + self.shared_hits) / lookups if lookups else 0.0,
+            "local_size": len(self._local),
+        }
+
+    def _get_local(self, code):
+        with self._lock:
+            entry = self._local.get(code)
+            if entry is None:
+                return None
+            rate, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._local[code]
+                return None
+            self._local.move_to_end(code)
+            return rate
+
+    def _set_local(self, code, rate):
+        with self._lock:
+            self._local[code] = (rate, time.monotonic() + self.local_ttl)
+            self._local.move_to_end(code)
+            while len(self._local) > self.maxsize:
+                self._local.popitem(last=False)
+
+
+rate_resolver = ExchangeRateResolver()
@@ -0,0 +1,65 @@
+from collections import namedtuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import Currency
+
+LOCAL_CURRENCY_CACHE_KEY = "local_currency:user:{user_id}"
+
+LocalCurrency = namedtuple("LocalCurrency", ["code", "description"])
+
+
+class LocalCurrencyRegistry:
+    """
+    Per-user lookup of the local currency.
+    Results are kept in the shared cache (invalidated by the Currency post_save/post_delete
+    signals) and memoized on the request, so a list response resolves it at most once.
+    """
+
+    def __init__(self, timeout=None):
+        self.timeout = timeout or getattr(settings, "LOCAL_CURRENCY_CACHE_TIMEOUT", 3600)
+
+    @staticmethod
+    def cache_key(user_id):
+        return LOCAL_CURRENCY_CACHE_KEY.format(user_id=user_id)
+
+    def get(self, user, request=None):
+        """
+        Return the LocalCurrency(code, description) of a user (or user id), or None if the user has none.
+        :param request: optional request to memoize the result on for the rest of the request.
+        """
+        user_id = getattr(user, "pk", user)
+        memo = None
+        if request is not None:
+            memo = getattr(request, "_local_currencies", None)
+            if memo is None:
+                memo = {}
+                request._local_currencies = memo
+            if user_id in memo:
+                return memo[user_id]
+
+        local_currency = self._load(user_id)
+        if memo is not None:
+            memo[user_id] = local_currency
+        return local_currency
+
+    def invalidate(self, user_id):
+        cache.delete(self.cache_key(user_id))
+
+    def _load(self, user_id):
+        key = self.cache_key(user_id)
+        cached = cache.get(key)
+        if cached is None:
+            row = (
+                Currency.objects.filter(created_by_id=user_id, is_local=True)
+                .values_list("code", "description")
+                .first()
+            )
+            # An empty list records "no local currency" so misses are cached too.
+            cached = list(row) if row else []
+            cache.set(key, cached, timeout=self.timeout)
+        return LocalCurrency(*cached) if cached else None
+
+
+local_currency_registry = LocalCurrencyRegistry()
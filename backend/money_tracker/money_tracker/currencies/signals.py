@@ -0,0 +1,61 @@
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .crossrates import cross_rates
+from .history import historical_rates
+from .models import Currency
+from .models import ExchangeRate
+from .rates import rate_resolver
+from .registry import local_currency_registry
+from .tasks import revalue_lcy_columns
+
+
+@receiver(post_save, sender=ExchangeRate)
+@receiver(post_delete, sender=ExchangeRate)
+def invalidate_exchange_rate_cache(sender, instance, **kwargs):
+    """Drop the cached current rate now and again once the transaction commits."""
+    rate_resolver.invalidate(instance.currency_id)
+    historical_rates.invalidate(instance.currency_id)
+    transaction.on_commit(partial(rate_resolver.invalidate, instance.currency_id))
+
+
+@receiver(post_save, sender=ExchangeRate)
+@receiver(post_delete, sender=ExchangeRate)
+def refresh_cross_rates(sender, instance, **kwargs):
+    """Patch the owner's cached cross-rate matrix in place rather than rebuilding it."""
+    owner_id = instance.currency.created_by_id
+    cross_rates.refresh_currency(instance.currency_id, owner_id)
+    transaction.on_commit(partial(cross_rates.refresh_currency, instance.currency_id, owner_id))
+
+
+@receiver(post_save, sender=Currency)
+@receiver(post_delete, sender=Currency)
+def invalidate_local_currency_cache(sender, instance, **kwargs):
+    local_currency_registry.invalidate(instance.created_by_id)
+    transaction.on_commit(partial(local_currency_registry.invalidate, instance.created_by_id))
+
+
+@receiver(post_save, sender=Currency)
+@receiver(post_delete, sender=Currency)
+def invalidate_cross_rates(sender, instance, **kwargs):
+    """
+    Adding, removing or relabelling a currency changes the shape of the owner's matrix, so drop it.
+    The local currency is in every user's matrix, so changing it drops them all.
+    """
+    if instance.is_local:
+        cross_rates.invalidate_all()
+        transaction.on_commit(cross_rates.invalidate_all)
+    else:
+        cross_rates.invalidate(instance.created_by_id)
+
+
+@receiver(post_save, sender=ExchangeRate)
+def revalue_on_new_current_rate(sender, instance, **kwargs):
+    """Queue a revaluation of stored LCY columns once a new current rate is committed."""
+    if instance.is_current and getattr(settings, "LCY_REVALUE_ON_RATE_CHANGE", True):
+        transaction.on_commit(partial(revalue_lcy_columns.delay, instance.currency_id))
@@ -0,0 +1,15 @@
+from celery import shared_task
+from .valuation import revalue_currency
+import logging
+
+logger = logging.getLogger(__name__)
+
+@shared_task(bind=True)
+def revalue_lcy_columns(self, currency_code):
+    """Recompute stored *_lcy columns of every row in the currency after its current rate changed."""
+    def report_progress(progress):
+        if self.request.id and not self.request.is_eager:
+            self.update_state(state="PROGRESS", meta=progress)
+
+    result = revalue_currency(currency_code, progress=report_progress)
+    return f"Revaluation of {currency_code} completed. Updated {result['rows_updated']} rows."
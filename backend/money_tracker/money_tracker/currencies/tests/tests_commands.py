@@ -0,0 +1,104 @@
+import json
+import pytest
+from io import StringIO
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from money_tracker.reports.versions import data_version
+from money_tracker.users.tests.factories import UserFactory
+from ..models import Currency
+from ..registry import local_currency_registry
+
+
+@pytest.fixture
+def currencies_file(tmp_path):
+    def write(data):
+        path = tmp_path / "currencies.json"
+        path.write_text(json.dumps(data))
+        return str(path)
+    return write
+
+
+@pytest.mark.django_db
+def test_fetch_currencies_from_file_upserts_and_skips_unchanged(currencies_file, local_currency, user, django_assert_max_num_queries):
+    Currency.objects.create(code="USD", description="US Dollar", created_by=user)
+    Currency.objects.create(code="EUR", description="Euro", created_by=user)
+    path = currencies_file({"USD": "United States Dollar", "EUR": "Euro", "GBP": "British Pound", "TOOLONG": "x"})
+    out = StringIO()
+
+    with django_assert_max_num_queries(8):
+        call_command("fetch_currencies", "--user", user.username, "--from-file", path, stdout=out)
+
+    assert "1 added, 1 updated." in out.getvalue()
+    assert "4 received, 1 unchanged, 1 skipped" in out.getvalue()
+    usd = Currency.objects.get(code="USD")
+    assert usd.description == "United States Dollar"
+    assert usd.modified_by == user
+    assert Currency.objects.get(code="GBP").modified_by is None
+    assert not Currency.objects.filter(code="TOO").exists()
+
+
+@pytest.mark.django_db
+def test_fetch_currencies_rerun_writes_nothing(currencies_file, local_currency, user):
+    path = currencies_file({"USD": "US Dollar"})
+    call_command("fetch_currencies", "--user", user.username, "--from-file", path, stdout=StringIO())
+    modified_at = Currency.objects.get(code="USD").modified_at
+    out = StringIO()
+
+    call_command("fetch_currencies", "--user", user.username, "--from-file", path, stdout=out)
+
+    assert "0 added, 0 updated." in out.getvalue()
+    assert Currency.objects.get(code="USD").modified_at == modified_at
+
+
+@pytest.mark.django_db
+def test_fetch_currencies_invalidates_renamed_local_currency(currencies_file, local_currency, user):
+    assert local_currency_registry.get(user).description == local_currency.description
+    path = currencies_file({local_currency.code: "Renamed Shilling"})
+
+    call_command("fetch_currencies", "--user", user.username, "--from-file", path, stdout=StringIO())
+
+    assert local_currency_registry.get(user).description == "Renamed Shilling"
+
+
+@pytest.mark.django_db
+def test_fetch_currencies_changes_the_owners_data_version(currencies_file, local_currency, user):
+    other = UserFactory()
+    Currency.objects.create(code="USD", description="US Dollar", created_by=other)
+    before = data_version(other.pk), data_version(user.pk)
+    path = currencies_file({"USD": "United States Dollar"})
+
+    call_command("fetch_currencies", "--user", user.username, "--from-file", path, stdout=StringIO())
+
+    assert data_version(other.pk) != before[0]
+    assert data_version(user.pk) == before[1]
+
+
+@pytest.mark.django_db
+def test_fetch_currencies_renamed_local_currency_changes_every_data_version(currencies_file, local_currency, user):
+    other = UserFactory()
+    before = data_version(other.pk)
+    path = currencies_file({local_currency.code: "Renamed Shilling"})
+
+    call_command("fetch_currencies", "--user", user.username, "--from-file", path, stdout=StringIO())
+
+    assert data_version(other.pk) != before
+
+
+@pytest.mark.django_db
+def test_fetch_currencies_reports_skipped_and_truncated_codes(currencies_file, local_currency, user):
+    description_length = Currency._meta.get_field("description").max_length
+    path = currencies_file({"TOOLONG": "x", "XAU": "Gold " * description_length})
+    out, err = StringIO(), StringIO()
+
+    call_command("fetch_currencies", "--user", user.username, "--from-file", path, stdout=out, stderr=err)
+
+    assert "1 skipped, 1 truncated" in out.getvalue()
+    assert "TOOLONG" in err.getvalue()
+    assert "XAU" in err.getvalue()
+    assert len(Currency.objects.get(code="XAU").description) == description_length
+
+
+@pytest.mark.django_db
+def test_fetch_currencies_rejects_unreadable_file(tmp_path, user):
+    with pytest.raises(CommandError):
+        call_command("fetch_currencies", "--user", user.username, "--from-file", str(tmp_path / "missing.json"))
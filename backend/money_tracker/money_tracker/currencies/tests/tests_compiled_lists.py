@@ -0,0 +1,92 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from money_tracker.assets.models import Equity
+from money_tracker.assets.models import RetirementAccount
+from money_tracker.expenses.models import FixedExpense
+from money_tracker.income.models import EarnedIncome
+from money_tracker.liabilities.models import InterestType
+from money_tracker.liabilities.models import Loan
+
+from ..models import ExchangeRate
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def client(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def records(user, local_currency, foreign_currency):
+    ExchangeRate.objects.create(currency=foreign_currency, rate=Decimal("130.00"), is_current=True, created_by=user)
+    rent = FixedExpense.objects.create(
+        expense_name="rent", currency=local_currency, amount=1200, notes="flat", created_by=user,
+    )
+    FixedExpense.objects.create(
+        expense_name="hosting", currency=foreign_currency, amount=Decimal("12.50"), created_by=user,
+    )
+    rent.amount = 1300
+    rent.modified_by = user
+    rent.save()
+    EarnedIncome.objects.create(income_name="salary", currency=foreign_currency, amount=900, created_by=user)
+    Equity.objects.create(name="shop", currency=local_currency, amount=5000, ratio=Decimal("0.25"), created_by=user)
+    RetirementAccount.objects.create(name="pension", currency=foreign_currency, amount=40, created_by=user)
+    interest_type = InterestType.objects.create(code="SIMPLE", description="Simple", created_by=user)
+    Loan.objects.create(
+        source="bank", loan_date=date(2025, 1, 1), currency=foreign_currency, amount_taken=Decimal("1000.00"),
+        reason="car", interest_type=interest_type, repayment_date=date(2026, 1, 1), created_by=user,
+    )
+
+
+def regular_and_compiled(client, url, params=None):
+    with override_settings(FAST_LIST_RENDERING=False):
+        regular = client.get(url, params)
+    return regular, client.get(url, params)
+
+
+@pytest.mark.parametrize("url_name", [
+    "api:expenses:fixedexpense-list",
+    "api:income:earnedincome-list",
+    "api:assets:equity-list",
+    "api:assets:retirementaccount-list",
+    "api:liabilities:loan-list",
+])
+@pytest.mark.parametrize("mode", ["stored", "live"])
+def test_compiled_lists_render_the_same_json(client, records, url_name, mode):
+    with override_settings(LCY_VALUATION_MODE=mode):
+        regular, compiled = regular_and_compiled(client, reverse(url_name))
+
+    assert compiled.status_code == regular.status_code == 200
+    assert compiled.data["results"]
+    assert compiled.content == regular.content
+
+
+@pytest.mark.parametrize("params", [
+    {"fields": "id,amount,modified_by,amount_lcy_display"},
+    {"omit": "notes"},
+    {"ordering": "amount", "page_size": 1},
+])
+def test_compiled_lists_honour_query_parameters(client, records, params):
+    url = reverse("api:expenses:fixedexpense-list")
+    regular, compiled = regular_and_compiled(client, url, params)
+
+    assert compiled.content == regular.content
+    if compiled.data["next"]:
+        assert client.get(compiled.data["next"]).data["results"]
+
+
+def test_compiled_lists_read_no_model_instances(client, records, django_assert_max_num_queries):
+    with django_assert_max_num_queries(4) as queries:
+        client.get(reverse("api:expenses:fixedexpense-list"))
+
+    page = next(query["sql"] for query in queries.captured_queries if "expenses_fixedexpense" in query["sql"])
+    assert '"users_user"."password"' not in page
@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+from decimal import Decimal
+from ..crossrates import CrossRateMatrix, cross_rates
+from ..models import Currency, ExchangeRate
+from .factories import UserFactory
+
+
+def test_matrix_converts_between_any_pair():
+    matrix = CrossRateMatrix(["EUR", "KES", "USD"], [140.0, 1.0, 130.0])
+
+    assert matrix.convert(Decimal("100"), "USD", "EUR") == Decimal("92.86")
+    assert matrix.convert(Decimal("100"), "EUR", "KES") == Decimal("14000.00")
+    assert matrix.convert(Decimal("13000"), "KES", "USD") == Decimal("100.00")
+    assert matrix.rate("USD", "USD") == 1.0
+
+
+def test_matrix_converts_a_column_in_one_call():
+    matrix = CrossRateMatrix(["EUR", "KES", "USD"], [140.0, 1.0, 130.0])
+
+    assert matrix.convert_array([1, 2, 3], "USD", "KES") == [Decimal("130.00"), Decimal("260.00"), Decimal("390.00")]
+    assert matrix.convert_array([100, 1400, 130], ["USD", "KES", "USD"], "EUR") == [
+        Decimal("92.86"), Decimal("10.00"), Decimal("120.71")
+    ]
+
+
+def test_column_conversion_rounds_like_single_conversions():
+    matrix = CrossRateMatrix(["KES", "USD"], [1.0, 130.0])
+    amounts = [Decimal("0.125"), Decimal("2.675"), Decimal("1.005"), Decimal("16.25")]
+
+    # float64 half-to-even rounding gives 0.12, 2.67 and 1.00 for the first three
+    assert matrix.convert_array(amounts, "KES", "KES") == [
+        Decimal("0.13"), Decimal("2.68"), Decimal("1.01"), Decimal("16.25")
+    ]
+    assert matrix.convert_array(amounts, "KES", "USD") == [matrix.convert(amount, "KES", "USD") for amount in amounts]
+
+
+def test_set_rate_matches_a_full_rebuild():
+    matrix = CrossRateMatrix(["EUR", "KES", "USD"], [140.0, 1.0, 130.0])
+
+    matrix.set_rate("USD", Decimal("125.50"))
+
+    np.testing.assert_allclose(matrix.matrix, CrossRateMatrix(["EUR", "KES", "USD"], [140.0, 1.0, 125.5]).matrix)
+
+
+def test_missing_rates_raise():
+    matrix = CrossRateMatrix(["KES", "USD"], [1.0, np.nan])
+
+    with pytest.raises(ExchangeRate.DoesNotExist):
+        matrix.convert(1, "USD", "KES")
+    with pytest.raises(ExchangeRate.DoesNotExist):
+        matrix.convert(1, "KES", "GBP")
+
+
+@pytest.fixture
+def user_currencies(user):
+    Currency.objects.create(code="KES", description="Kenyan Shilling", is_local=True, created_by=user)
+    usd = Currency.objects.create(code="USD", description="US Dollar", created_by=user)
+    eur = Currency.objects.create(code="EUR", description="Euro", created_by=user)
+    ExchangeRate.objects.create(currency=usd, rate=Decimal("130.00"), is_current=True, created_by=user)
+    ExchangeRate.objects.create(currency=eur, rate=Decimal("140.00"), is_current=True, created_by=user)
+    return usd, eur
+
+
+@pytest.mark.django_db
+def test_for_user_is_cached(user, user_currencies, django_assert_num_queries):
+    with django_assert_num_queries(2):
+        matrix = cross_rates.for_user(user)
+    with django_assert_num_queries(0):
+        assert cross_rates.for_user(user).codes == matrix.codes == ["EUR", "KES", "USD"]
+
+
+@pytest.mark.django_db
+def test_rate_change_patches_the_cached_matrix(user, user_currencies):
+    usd, _ = user_currencies
+    cross_rates.for_user(user)
+    old = ExchangeRate.objects.get(currency=usd)
+    old.is_current = False
+    old.modified_by = user
+    old.save()
+
+    assert np.isnan(cross_rates.for_user(user).to_local[2])
+
+    ExchangeRate.objects.filter(pk=old.pk).update(created_at=old.created_at.replace(year=old.created_at.year - 1))
+    ExchangeRate.objects.create(currency=usd, rate=Decimal("120.00"), is_current=True, created_by=user)
+
+    assert cross_rates.for_user(user).convert(Decimal("12000"), "KES", "USD") == Decimal("100.00")
+
+
+@pytest.mark.django_db
+def test_new_currency_rebuilds_the_matrix(user, user_currencies):
+    cross_rates.for_user(user)
+
+    Currency.objects.create(code="GBP", description="Pound", created_by=user)
+
+    assert "GBP" in cross_rates.for_user(user)
+
+
+@pytest.mark.django_db
+def test_local_currency_changes_rebuild_every_users_matrix(user, user_currencies, django_assert_num_queries):
+    other = UserFactory()
+    Currency.objects.create(code="GBP", description="Pound", created_by=other)
+    cross_rates.for_user(other)
+
+    kes = Currency.objects.get(code="KES")
+    kes.description = "Kenya Shilling"
+    kes.modified_by = user
+    kes.save()
+
+    with django_assert_num_queries(2):
+        assert cross_rates.for_user(other).local == "KES"
@@ -0,0 +1,90 @@
+import pytest
+from datetime import timedelta
+from decimal import Decimal
+from django.utils import timezone
+from ..history import HistoricalRateService, historical_rates
+from ..models import Currency, ExchangeRate
+
+
+def create_rate(currency, rate, created_at, user, is_current=False):
+    """Create a rate and backdate it, freeing today's slot for the next one."""
+    exchange_rate = ExchangeRate.objects.create(currency=currency, rate=Decimal(rate), is_current=is_current, created_by=user)
+    ExchangeRate.objects.filter(pk=exchange_rate.pk).update(created_at=created_at)
+    return exchange_rate
+
+
+@pytest.fixture
+def rate_history(foreign_currency, user):
+    now = timezone.now()
+    create_rate(foreign_currency, "100.00", now - timedelta(days=30), user)
+    create_rate(foreign_currency, "110.00", now - timedelta(days=20), user)
+    create_rate(foreign_currency, "120.00", now - timedelta(days=10), user, is_current=True)
+    historical_rates.clear()
+    return now
+
+
+@pytest.mark.django_db
+def test_rate_at_returns_latest_rate_not_after_timestamp(foreign_currency, rate_history):
+    now = rate_history
+    assert historical_rates.rate_at(foreign_currency, now - timedelta(days=25)) == Decimal("100.00")
+    assert historical_rates.rate_at(foreign_currency, now - timedelta(days=20)) == Decimal("110.00")
+    assert historical_rates.rate_at(foreign_currency.code, now) == Decimal("120.00")
+
+
+@pytest.mark.django_db
+def test_rate_at_accepts_dates(foreign_currency, rate_history):
+    day = timezone.localdate(rate_history - timedelta(days=15))
+    assert historical_rates.rate_at(foreign_currency, day) == Decimal("110.00")
+
+
+@pytest.mark.django_db
+def test_rate_before_first_rate_raises(foreign_currency, rate_history):
+    with pytest.raises(ExchangeRate.DoesNotExist):
+        historical_rates.rate_at(foreign_currency, rate_history - timedelta(days=31))
+
+
+@pytest.mark.django_db
+def test_rates_at_batch_uses_one_query(foreign_currency, local_currency, user, rate_history, django_assert_num_queries):
+    eur = Currency.objects.create(code="EUR", description="Euro", created_by=user)
+    create_rate(eur, "150.00", rate_history - timedelta(days=5), user)
+    historical_rates.clear()
+    pairs = [
+        (foreign_currency, rate_history - timedelta(days=21)),
+        (eur, rate_history),
+        (local_currency, rate_history),
+        (foreign_currency, rate_history),
+    ]
+
+    with django_assert_num_queries(1):
+        rates = historical_rates.rates_at(pairs)
+        historical_rates.rates_at(pairs)
+
+    assert rates == [Decimal("100.00"), Decimal("150.00"), Decimal("1"), Decimal("120.00")]
+
+
+@pytest.mark.django_db
+def test_history_invalidated_by_new_rate(foreign_currency, user, rate_history):
+    historical_rates.rate_at(foreign_currency, rate_history)
+    ExchangeRate.objects.filter(currency=foreign_currency).update(is_current=False)
+    ExchangeRate.objects.create(currency=foreign_currency, rate=Decimal("130.00"), is_current=True, created_by=user)
+
+    assert historical_rates.rate_at(foreign_currency, timezone.now()) == Decimal("130.00")
+
+
+@pytest.mark.django_db
+def test_one_rate_per_currency_per_day(foreign_currency, user):
+    ExchangeRate.objects.create(currency=foreign_currency, rate=Decimal("1.00"), is_current=False, created_by=user)
+    with pytest.raises(Exception):
+        ExchangeRate.objects.create(currency=foreign_currency, rate=Decimal("2.00"), is_current=False, created_by=user)
+
+
+@pytest.mark.django_db
+def test_expired_series_is_reloaded(foreign_currency, rate_history):
+    expiring, lasting = HistoricalRateService(ttl=0), HistoricalRateService(ttl=300)
+    assert expiring.rate_at(foreign_currency, rate_history) == lasting.rate_at(foreign_currency, rate_history)
+
+    # update() sends no signal, so only expiry can make the services see the new rate
+    ExchangeRate.objects.filter(currency=foreign_currency, is_current=True).update(rate=Decimal("125.00"))
+
+    assert expiring.rate_at(foreign_currency, rate_history) == Decimal("125.00")
+    assert lasting.rate_at(foreign_currency, rate_history) == Decimal("120.00")
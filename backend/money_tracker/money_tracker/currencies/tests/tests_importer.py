@@ -0,0 +1,143 @@
+import io
+import json
+import pytest
+from datetime import date, timedelta
+from decimal import Decimal
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from ..history import historical_rates
+from ..importer import RateImporter, read_rows
+from ..models import Currency, ExchangeRate
+from ..rates import rate_resolver
+
+
+@pytest.fixture
+def currencies(user):
+    Currency.objects.create(code="KES", description="Kenyan Shilling", is_local=True, created_by=user)
+    return [
+        Currency.objects.create(code=code, description=code, created_by=user)
+        for code in ("USD", "EUR", "GBP")
+    ]
+
+
+def import_csv(user, text, **kwargs):
+    return RateImporter(user, **kwargs).run(read_rows(io.StringIO(text), "csv"))
+
+
+@pytest.mark.django_db
+def test_import_csv_stores_rates_on_their_dates(currencies, user):
+    report = import_csv(user, "currency,date,rate\nUSD,2024-01-01,129.5\nusd,2024-01-02,130.125\nEUR,2024-01-01,140\nUSD,2024-01-02,131\n")
+
+    assert report["rows_read"] == 4
+    assert report["inserted"] == 3
+    assert report["currencies"] == ["EUR", "USD"]
+    assert historical_rates.rate_at("USD", date(2024, 1, 1)) == Decimal("129.50")
+    assert historical_rates.rate_at("USD", date(2024, 1, 2)) == Decimal("131.00")  # last row for the day wins
+    assert not ExchangeRate.objects.filter(is_current=True).exists()
+
+
+@pytest.mark.django_db
+def test_reimport_skips_existing_days(currencies, user):
+    text = "currency,date,rate\nUSD,2024-01-01,129.5\nUSD,2024-01-02,130\n"
+    import_csv(user, text)
+
+    report = import_csv(user, text + "USD,2024-01-03,131\n")
+
+    assert report["inserted"] == 1
+    assert report["existing"] == 2
+    assert ExchangeRate.objects.count() == 3
+
+
+@pytest.mark.django_db
+def test_invalid_rows_roll_back_the_whole_import(currencies, user):
+    text = "currency,date,rate\nUSD,2024-01-01,129.5\nKES,2024-01-01,1\nXYZ,2024-01-01,1\nEUR,01/01/2024,1\nGBP,2024-01-01,0.01\n"
+
+    with pytest.raises(ValidationError) as excinfo:
+        import_csv(user, text, chunk_size=2)
+
+    assert excinfo.value.messages == [
+        "Line 3: exchange rates cannot be assigned to a local currency.",
+        "Line 4: unknown currency 'XYZ'.",
+        "Line 5: invalid date '01/01/2024', expected YYYY-MM-DD.",
+        "Line 6: rate must be between 0.1 and 999999.99.",
+    ]
+    assert not ExchangeRate.objects.exists()
+
+
+@pytest.mark.django_db
+def test_set_current_moves_the_current_flag_set_wise(currencies, user):
+    usd = currencies[0]
+    old = ExchangeRate.objects.create(currency=usd, rate=Decimal("100.00"), is_current=True, created_by=user)
+    ExchangeRate.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=30))
+    assert rate_resolver.get_rate(usd) == Decimal("100.00")
+    today = timezone.localdate()
+
+    report = import_csv(
+        user,
+        f"currency,date,rate\nUSD,{today - timedelta(days=2)},120\nUSD,{today - timedelta(days=1)},121\nEUR,{today},140\n",
+        set_current=True,
+    )
+
+    assert report["current_updated"] == ["EUR", "USD"]
+    assert dict(ExchangeRate.objects.filter(is_current=True).values_list("currency_id", "rate")) == {
+        "USD": Decimal("121.00"), "EUR": Decimal("140.00"),
+    }
+    assert rate_resolver.get_rate(usd) == Decimal("121.00")
+
+
+@pytest.mark.django_db
+def test_import_many_rates_in_few_queries(currencies, user, django_assert_max_num_queries):
+    start = date(2020, 1, 1)
+    lines = [
+        json.dumps({"currency": currency.code, "date": str(start + timedelta(days=day)), "rate": "100.5"})
+        for currency in currencies for day in range(1000)
+    ]
+
+    with django_assert_max_num_queries(8):
+        report = RateImporter(user, chunk_size=5000).run(read_rows(io.StringIO("\n".join(lines)), "jsonl"))
+
+    assert report["inserted"] == 3000
+
+
+@pytest.mark.django_db
+def test_import_endpoint(currencies, user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    upload = SimpleUploadedFile("rates.json", json.dumps([{"currency": "USD", "date": "2024-01-01", "rate": 130}]).encode())
+
+    response = client.post(reverse("api:currencies:exchangerate-bulk-import"), {"file": upload}, format="multipart")
+
+    assert response.status_code == 201
+    assert response.data["inserted"] == 1
+    assert ExchangeRate.objects.get().created_by == user
+
+
+@pytest.mark.django_db
+def test_import_endpoint_reports_errors(currencies, user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    upload = SimpleUploadedFile("rates.csv", b"currency,date,rate\nUSD,2024-01-01,abc\n")
+
+    response = client.post(reverse("api:currencies:exchangerate-bulk-import"), {"file": upload}, format="multipart")
+
+    assert response.status_code == 400
+    assert response.data["errors"] == ["Line 2: invalid rate 'abc'."]
+
+
+@pytest.mark.django_db
+def test_import_exchange_rates_command(tmp_path, currencies, user):
+    path = tmp_path / "rates.csv"
+    path.write_text("currency,date,rate\nUSD,2024-01-01,129.5\n")
+    out = io.StringIO()
+
+    call_command("import_exchange_rates", str(path), "--user", user.username, stdout=out)
+
+    assert "Imported 1 exchange rates for 1 currencies" in out.getvalue()
+    path.write_text("currency,date,rate\nUSD,2024-01-02,-1\n")
+    with pytest.raises(CommandError):
+        call_command("import_exchange_rates", str(path), "--user", user.username, stdout=out, stderr=io.StringIO())
@@ -28,7 +28,7 @@ class CurrencyConversionMixinTest(TestCase):
 
     def test_conversion_valid_rate(self):
         # Create a valid exchange rate
-        ExchangeRate.objects.create(currency=self.currency, rate=Decimal("1.2"), created_by=self.user)
+        ExchangeRate.objects.create(currency=self.currency, rate=Decimal("1.2"), is_current=True, created_by=self.user)
 
         # Test the conversion with a valid rate
         result = self.mixin.convert_to_lcy(Decimal("100.00"), self.currency)
@@ -42,4 +42,45 @@ class CurrencyConversionMixinTest(TestCase):
             self.mixin.convert_to_lcy(Decimal("100.00"), new_currency)
         
         # Check the error message
-        self.assertEqual(context.exception.message_dict["currency"][0], f"No exchange rate found for currency {new_currency}")
\ No newline at end of file
+        self.assertEqual(context.exception.message_dict["currency"][0], f"No exchange rate found for currency {new_currency}")
+
+class ConvertManyTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="testuser", password="password")
+        self.currency_local = Currency.objects.create(
+            code="KSH", description="Kenyan Shilling", is_local=True, created_by=self.user
+        )
+        self.usd = Currency.objects.create(code="USD", description="US Dollar", is_local=False, created_by=self.user)
+        self.eur = Currency.objects.create(code="EUR", description="Euro", is_local=False, created_by=self.user)
+        ExchangeRate.objects.create(currency=self.usd, rate=Decimal("129.45"), is_current=True, created_by=self.user)
+        ExchangeRate.objects.create(currency=self.eur, rate=Decimal("150.10"), is_current=True, created_by=self.user)
+        self.mixin = CurrencyConversionMixin()
+
+    def test_convert_many_mixed_currencies_single_query(self):
+        with self.assertNumQueries(1):
+            result = CurrencyConversionMixin.convert_many(
+                [Decimal("10.005"), Decimal("2"), Decimal("3.333")],
+                [self.currency_local, self.usd, self.eur],
+            )
+        self.assertEqual(result, [Decimal("10.01"), Decimal("258.90"), Decimal("500.28")])
+
+    def test_convert_many_single_currency(self):
+        result = CurrencyConversionMixin.convert_many([Decimal("1"), Decimal("0.5")], self.usd)
+        self.assertEqual(result, [Decimal("129.45"), Decimal("64.73")])
+
+    def test_convert_many_missing_rate(self):
+        gbp = Currency.objects.create(code="GBP", description="Pound Sterling", is_local=False, created_by=self.user)
+        with self.assertRaises(ValidationError) as context:
+            CurrencyConversionMixin.convert_many([Decimal("1"), Decimal("1")], [self.usd, gbp])
+        self.assertIn(str(gbp), context.exception.message_dict["currency"][0])
+
+    def test_single_and_batch_conversions_round_alike(self):
+        amounts = [Decimal("10.005"), Decimal("2.5"), Decimal("3.333")]
+        currencies = [self.currency_local, self.usd, self.eur]
+        single = [self.mixin.convert_to_lcy(amount, currency) for amount, currency in zip(amounts, currencies)]
+        self.assertEqual(single, CurrencyConversionMixin.convert_many(amounts, currencies))
+        self.assertEqual(single, [Decimal("10.01"), Decimal("323.63"), Decimal("500.28")])
+
+    def test_convert_many_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            CurrencyConversionMixin.convert_many([Decimal("1")], [self.usd, self.eur])
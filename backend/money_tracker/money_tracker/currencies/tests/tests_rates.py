@@ -0,0 +1,78 @@
+import pytest
+from decimal import Decimal
+from django.core.cache import cache
+from ..models import ExchangeRate
+from ..rates import ExchangeRateResolver, rate_resolver
+
+
+@pytest.fixture
+def current_rate(foreign_currency, user):
+    return ExchangeRate.objects.create(currency=foreign_currency, rate=Decimal("110.50"), is_current=True, created_by=user)
+
+
+@pytest.mark.django_db
+def test_resolver_counts_miss_then_local_hit(current_rate, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        assert rate_resolver.get_rate(current_rate.currency) == Decimal("110.50")
+        assert rate_resolver.get_rate(current_rate.currency) == Decimal("110.50")
+        assert rate_resolver.get_rate(current_rate.currency.code) == Decimal("110.50")
+
+    stats = rate_resolver.stats()
+    assert stats["misses"] == 1
+    assert stats["local_hits"] == 2
+
+
+@pytest.mark.django_db
+def test_resolver_falls_back_to_shared_cache(current_rate, django_assert_num_queries):
+    rate_resolver.get_rate(current_rate.currency)
+    rate_resolver.clear()
+
+    with django_assert_num_queries(0):
+        assert rate_resolver.get_rate(current_rate.currency) == Decimal("110.50")
+    assert rate_resolver.stats()["shared_hits"] == 1
+
+
+@pytest.mark.django_db
+def test_resolver_ignores_non_current_rates(foreign_currency, user):
+    ExchangeRate.objects.create(currency=foreign_currency, rate=Decimal("99.00"), is_current=False, created_by=user)
+
+    with pytest.raises(ExchangeRate.DoesNotExist):
+        rate_resolver.get_rate(foreign_currency)
+
+
+@pytest.mark.django_db
+def test_resolver_invalidated_when_rate_saved(current_rate, user):
+    rate_resolver.get_rate(current_rate.currency)
+
+    current_rate.is_current = False
+    current_rate.modified_by = user
+    current_rate.save()
+
+    assert cache.get(ExchangeRateResolver.cache_key(current_rate.currency_id)) is None
+    with pytest.raises(ExchangeRate.DoesNotExist):
+        rate_resolver.get_rate(current_rate.currency)
+
+
+@pytest.mark.django_db
+def test_resolver_invalidated_when_rate_deleted(current_rate, user):
+    current_rate.is_current = False
+    current_rate.modified_by = user
+    current_rate.save()
+    rate_resolver._set_local(current_rate.currency_id, Decimal("1.00"))
+
+    current_rate.delete()
+
+    with pytest.raises(ExchangeRate.DoesNotExist):
+        rate_resolver.get_rate(current_rate.currency)
+
+
+def test_resolver_evicts_least_recently_used():
+    resolver = ExchangeRateResolver(maxsize=2, local_ttl=60)
+    resolver._set_local("USD", Decimal("1"))
+    resolver._set_local("EUR", Decimal("2"))
+    resolver._get_local("USD")
+    resolver._set_local("GBP", Decimal("3"))
+
+    assert resolver._get_local("EUR") is None
+    assert resolver._get_local("USD") == Decimal("1")
+    assert resolver._get_local("GBP") == Decimal("3")
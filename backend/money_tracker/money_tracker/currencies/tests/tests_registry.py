@@ -0,0 +1,47 @@
+import pytest
+from decimal import Decimal
+from django.test import RequestFactory
+from ..models import Currency, ExchangeRate
+from ..registry import LocalCurrency, local_currency_registry
+
+
+@pytest.mark.django_db
+def test_registry_returns_users_local_currency(local_currency, user, another_user):
+    assert local_currency_registry.get(user) == LocalCurrency(local_currency.code, local_currency.description)
+    assert local_currency_registry.get(another_user) is None
+
+
+@pytest.mark.django_db
+def test_registry_caches_hits_and_misses(local_currency, user, another_user, django_assert_num_queries):
+    local_currency_registry.get(user)
+    local_currency_registry.get(another_user)
+
+    with django_assert_num_queries(0):
+        assert local_currency_registry.get(user.pk).code == local_currency.code
+        assert local_currency_registry.get(another_user) is None
+
+
+@pytest.mark.django_db
+def test_registry_memoizes_on_request(local_currency, user, django_assert_num_queries):
+    request = RequestFactory().get("/")
+    local_currency_registry.get(user, request=request)
+    local_currency_registry.invalidate(user.pk)
+
+    with django_assert_num_queries(0):
+        assert local_currency_registry.get(user, request=request).code == local_currency.code
+
+
+@pytest.mark.django_db
+def test_registry_invalidated_when_currency_saved(user):
+    assert local_currency_registry.get(user) is None
+
+    Currency.objects.create(code="KES", description="Kenyan Shilling", is_local=True, created_by=user)
+
+    assert local_currency_registry.get(user).code == "KES"
+
+
+@pytest.mark.django_db
+def test_exchange_rate_str_uses_creators_local_currency(local_currency, foreign_currency, user):
+    exchange_rate = ExchangeRate.objects.create(currency=foreign_currency, rate=Decimal("1.50"), is_current=True, created_by=user)
+
+    assert f"against local currency: {local_currency.description} " in str(exchange_rate)
@@ -0,0 +1,108 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from money_tracker.expenses.models import FixedExpense
+from money_tracker.liabilities.models import InterestType
+from money_tracker.liabilities.models import Loan
+
+URL = reverse("api:expenses:fixedexpense-list")
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def client(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def expense(user, local_currency):
+    return FixedExpense.objects.create(
+        expense_name="rent", currency=local_currency, amount=1200, notes="x" * 500, created_by=user,
+    )
+
+
+def page_query(queries):
+    return next(query["sql"] for query in queries.captured_queries if "expenses_fixedexpense" in query["sql"])
+
+
+def test_fields_prunes_the_response_and_the_select(client, expense, django_assert_max_num_queries):
+    with django_assert_max_num_queries(4) as queries:
+        response = client.get(URL, {"fields": "id,expense_name,amount,amount_lcy_display"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["results"] == [{
+        "id": expense.pk, "expense_name": "rent", "amount": "1200.00",
+        "amount_lcy_display": f"{expense.currency.code} 1200.00",
+    }]
+    sql = page_query(queries)
+    assert '"notes"' not in sql
+    assert "JOIN" not in sql
+
+
+def test_related_fields_keep_their_join(client, expense, django_assert_max_num_queries):
+    with django_assert_max_num_queries(4) as queries:
+        response = client.get(URL, {"fields": "id,created_by"})
+
+    assert response.data["results"] == [{"id": expense.pk, "created_by": expense.created_by.username}]
+    sql = page_query(queries)
+    assert '"users_user"."username"' in sql
+    assert '"users_user"."password"' not in sql
+
+
+def test_omit_defers_the_omitted_columns(client, expense, django_assert_max_num_queries):
+    with django_assert_max_num_queries(4) as queries:
+        response = client.get(URL, {"omit": "notes,modified_by"})
+
+    row = response.data["results"][0]
+    assert "notes" not in row and "modified_by" not in row
+    assert row["amount_lcy_display"] == f"{expense.currency.code} 1200.00"
+    sql = page_query(queries)
+    assert '"notes"' not in sql
+    assert "LEFT OUTER JOIN" not in sql
+
+
+def test_detail_and_ordering_honour_fields(client, user, expense, local_currency):
+    cheaper = FixedExpense.objects.create(expense_name="water", currency=local_currency, amount=30, created_by=user)
+
+    listed = client.get(URL, {"fields": "id", "ordering": "amount"})
+    detail = client.get(reverse("api:expenses:fixedexpense-detail", args=[expense.pk]), {"fields": "notes"})
+
+    assert listed.data["results"] == [{"id": cheaper.pk}, {"id": expense.pk}]
+    assert detail.data == {"notes": expense.notes}
+
+
+def test_writes_ignore_fields(client, expense):
+    url = reverse("api:expenses:fixedexpense-detail", args=[expense.pk])
+
+    response = client.patch(url + "?fields=id", {"amount": "1300.00"}, format="json")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["amount"] == "1300.00"
+
+
+def test_unknown_field(client, expense):
+    response = client.get(URL, {"fields": "id,salary"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data == {"fields": ["Unknown field 'salary'."]}
+
+
+def test_loans_support_sparse_fieldsets(client, user, local_currency):
+    interest_type = InterestType.objects.create(code="SIMPLE", description="Simple", created_by=user)
+    loan = Loan.objects.create(
+        source="bank", loan_date=date(2025, 1, 1), currency=local_currency, amount_taken=Decimal("1000.00"),
+        reason="car", interest_type=interest_type, repayment_date=date(2026, 1, 1), created_by=user,
+    )
+
+    response = client.get(reverse("api:liabilities:loan-list"), {"fields": "id,due_balance_lcy_display"})
+
+    display = f"{local_currency.code} {loan.due_balance_lcy:.2f}"
+    assert response.data["results"] == [{"id": loan.pk, "due_balance_lcy_display": display}]
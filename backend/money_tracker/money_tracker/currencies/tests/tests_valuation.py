@@ -0,0 +1,145 @@
+import pytest
+from io import StringIO
+from datetime import timedelta
+from decimal import Decimal
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from money_tracker.expenses.models import FixedExpense, VariableExpense
+from money_tracker.liabilities.models import InterestType, Loan
+from ..models import Currency, ExchangeRate
+from ..tasks import revalue_lcy_columns
+from ..valuation import revalue_currency
+from ..valuation import valuation_mode
+
+
+def replace_current_rate(currency, rate, user):
+    """Backdate the current rate and make `rate` the new current one."""
+    ExchangeRate.objects.filter(currency=currency).update(is_current=False, created_at=timezone.now() - timedelta(days=1))
+    return ExchangeRate.objects.create(currency=currency, rate=Decimal(rate), is_current=True, created_by=user)
+
+
+@pytest.fixture
+def foreign_rows(foreign_currency, local_currency, user):
+    ExchangeRate.objects.create(currency=foreign_currency, rate=Decimal("100.00"), is_current=True, created_by=user)
+    expenses = [
+        FixedExpense.objects.create(expense_name=f"rent {i}", currency=foreign_currency, amount=Decimal("10.25"), created_by=user)
+        for i in range(5)
+    ]
+    local_expense = VariableExpense.objects.create(expense_name="fuel", currency=local_currency, amount=Decimal("7.00"), created_by=user)
+    interest_type = InterestType.objects.create(code="SIMPLE", description="Simple Interest", created_by=user)
+    loan = Loan.objects.create(
+        source="Bank", loan_date=timezone.localdate(), currency=foreign_currency, amount_taken=Decimal("1000.00"),
+        reason="Car", interest_type=interest_type, repayment_date=timezone.localdate() + timedelta(days=365),
+        interest_rate=Decimal("10.00"), amount_paid=Decimal("100.00"), due_balance=Decimal("900.00"), created_by=user,
+    )
+    return expenses, local_expense, loan
+
+
+@pytest.mark.django_db
+def test_revalue_currency_updates_only_affected_rows(foreign_currency, foreign_rows, user):
+    expenses, local_expense, loan = foreign_rows
+    replace_current_rate(foreign_currency, "120.50", user)
+
+    report = revalue_currency(foreign_currency.code, chunk_size=2)
+
+    assert report["models"]["expenses.FixedExpense"] == 5
+    assert report["models"]["liabilities.Loan"] == 1
+    assert report["rows_updated"] == 6
+    assert set(FixedExpense.objects.values_list("amount_lcy", flat=True)) == {Decimal("1235.13")}
+    loan.refresh_from_db()
+    assert loan.amount_taken_lcy == Decimal("120500.00")
+    assert loan.interest_lcy == (loan.interest * Decimal("120.50")).quantize(Decimal("0.01"))
+    assert loan.due_balance_lcy == Decimal("108450.00")
+    local_expense.refresh_from_db()
+    assert local_expense.amount_lcy == Decimal("7.00")
+
+
+@pytest.mark.django_db
+def test_revalue_currency_is_idempotent(foreign_currency, foreign_rows, user):
+    replace_current_rate(foreign_currency, "120.50", user)
+    revalue_currency(foreign_currency.code)
+
+    assert revalue_currency(foreign_currency.code)["rows_updated"] == 0
+
+
+@pytest.mark.django_db
+def test_revalue_currency_reports_progress(foreign_currency, foreign_rows, user):
+    replace_current_rate(foreign_currency, "99.00", user)
+    reports = []
+
+    revalue_currency(foreign_currency.code, chunk_size=2, progress=lambda progress: reports.append(dict(progress)))
+
+    assert reports[-1]["tables_done"] == reports[-1]["tables"] == 11
+    assert any(report.get("current") == "expenses.FixedExpense" for report in reports)
+
+
+@pytest.mark.django_db
+def test_revalue_lcy_columns_task(settings, foreign_currency, foreign_rows, user):
+    settings.CELERY_TASK_ALWAYS_EAGER = True
+    replace_current_rate(foreign_currency, "101.00", user)
+
+    result = revalue_lcy_columns.delay(foreign_currency.code)
+
+    assert result.result == f"Revaluation of {foreign_currency.code} completed. Updated 6 rows."
+
+
+@pytest.mark.django_db
+def test_with_live_lcy_values_rows_at_the_current_rate(foreign_currency, foreign_rows, user):
+    expenses, local_expense, loan = foreign_rows
+    replace_current_rate(foreign_currency, "120.50", user)
+
+    live = FixedExpense.objects.with_live_lcy().get(pk=expenses[0].pk)
+    assert live.amount_lcy == Decimal("1025.00")  # stored column untouched
+    assert live.live_amount_lcy == Decimal("1235.13")
+    assert VariableExpense.objects.with_live_lcy().get(pk=local_expense.pk).live_amount_lcy == Decimal("7.00")
+    live_loan = Loan.objects.with_live_lcy().get(pk=loan.pk)
+    assert live_loan.live_amount_taken_lcy == Decimal("120500.00")
+    assert live_loan.live_due_balance_lcy == Decimal("108450.00")
+    assert FixedExpense.objects.with_live_lcy().count() == 5
+
+
+@pytest.mark.django_db
+def test_total_lcy_follows_valuation_mode(settings, foreign_currency, foreign_rows, user):
+    replace_current_rate(foreign_currency, "120.50", user)
+
+    settings.LCY_VALUATION_MODE = "stored"
+    assert FixedExpense.objects.total_lcy() == Decimal("5125.00")
+    settings.LCY_VALUATION_MODE = "live"
+    assert FixedExpense.objects.total_lcy() == Decimal("6175.65")
+    assert Loan.objects.total_lcy("amount_taken_lcy") == Decimal("120500.00")
+    assert FixedExpense.objects.none().total_lcy() == 0
+
+
+@pytest.mark.django_db
+def test_live_mode_list_and_totals_endpoints(settings, foreign_currency, foreign_rows, user):
+    settings.LCY_VALUATION_MODE = "live"
+    replace_current_rate(foreign_currency, "120.50", user)
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    response = client.get(reverse("api:expenses:fixedexpense-list"))
+    assert len(response.data["results"]) == 5
+    assert all(row["amount_lcy_display"].endswith("1235.13") for row in response.data["results"])
+
+    response = client.get(reverse("api:liabilities:totalliabilities"))
+    assert response.data["total_liabilities"] == Decimal("120500.00")
+
+
+def test_valuation_mode_rejects_unknown_values(settings):
+    settings.LCY_VALUATION_MODE = "cached"
+    with pytest.raises(ImproperlyConfigured):
+        valuation_mode()
+
+
+@pytest.mark.django_db
+def test_benchmark_lcy_valuation_rolls_back(user, local_currency):
+    out = StringIO()
+    call_command("benchmark_lcy_valuation", "--user", str(user.pk), "--rows", "50", "--currencies", "2", "--repeat", "1", stdout=out)
+
+    assert "total (live)" in out.getvalue()
+    assert "rate change rewrite (25 rows, stored)" in out.getvalue()
+    assert not FixedExpense.objects.exists()
+    assert not Currency.objects.filter(code__startswith="Z").exists()
@@ -31,7 +31,25 @@ def test_authenticated_user_can_access_currencies_list(api_client, foreign_curre
 
     # Assert: Ensure all currencies are returned
     assert response.status_code == status.HTTP_200_OK
-    assert len(response.data) == 2
+    assert len(response.data["results"]) == 2
+
+@pytest.mark.django_db
+def test_currencies_list_local_first_then_by_code_across_pages(authenticated_api_client, user):
+    for code, is_local in [("USD", False), ("ZAR", True), ("EUR", False), ("AUD", False), ("GBP", False)]:
+        Currency.objects.create(code=code, description=code, is_local=is_local, created_by=user)
+    url = reverse("api:currencies:currency-list")
+
+    listed = [row["code"] for row in authenticated_api_client.get(url).data["results"]]
+    pages, page_url = [], f"{url}?page_size=2"
+    while page_url:
+        response = authenticated_api_client.get(page_url)
+        pages.append([row["code"] for row in response.data["results"]])
+        page_url = response.data["next"]
+    back = authenticated_api_client.get(authenticated_api_client.get(response.data["previous"]).data["previous"])
+
+    assert listed == ["ZAR", "AUD", "EUR", "GBP", "USD"]
+    assert pages == [["ZAR", "AUD"], ["EUR", "GBP"], ["USD"]]
+    assert [row["code"] for row in back.data["results"]] == ["ZAR", "AUD"]
 
 @pytest.mark.django_db
 def test_unauthenticated_user_cannot_access_currencies_list(api_client, local_currency):
@@ -105,7 +123,7 @@ def test_authenticated_user_can_access_exchange_rates_list(api_client, exchange_
 
     # Assert: Ensure all exchange rates are returned
     assert response.status_code == status.HTTP_200_OK
-    assert len(response.data) == 1 # Only 2 exchange rates are being created 
+    assert len(response.data["results"]) == 1 # Only 2 exchange rates are being created 
        
 @pytest.mark.django_db
 def test_unauthenticated_user_cannot_access_exchange_rates_list(api_client):
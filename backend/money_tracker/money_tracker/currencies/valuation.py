@@ -0,0 +1,220 @@
+import logging
+from decimal import Decimal
+
+from django.apps import apps
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.db import models
+from django.db import transaction
+from django.db.models.functions import Coalesce
+from django.db.models.functions import Round
+from django.dispatch import Signal
+
+from .models import ExchangeRate
+
+logger = logging.getLogger(__name__)
+
+VALUATION_STORED = "stored"
+VALUATION_LIVE = "live"
+
+# Sent with currencies=[codes] after stored or live LCY values of those currencies changed in bulk
+lcy_values_changed = Signal()
+
+# Prefix of the annotations added by LCYQuerySet.with_live_lcy(), e.g. live_amount_lcy
+LIVE_PREFIX = "live_"
+
+# Stored local-currency columns of every financial model: model label -> [(amount field, lcy field)]
+LCY_COLUMNS = {
+    "assets.LiquidAsset": [("amount", "amount_lcy")],
+    "assets.Equity": [("amount", "amount_lcy")],
+    "assets.InvestmentAccount": [("amount", "amount_lcy")],
+    "assets.RetirementAccount": [("amount", "amount_lcy")],
+    "income.EarnedIncome": [("amount", "amount_lcy")],
+    "income.PortfolioIncome": [("amount", "amount_lcy")],
+    "income.PassiveIncome": [("amount", "amount_lcy")],
+    "expenses.FixedExpense": [("amount", "amount_lcy")],
+    "expenses.VariableExpense": [("amount", "amount_lcy")],
+    "expenses.DiscretionaryExpense": [("amount", "amount_lcy")],
+    "liabilities.Loan": [
+        ("amount_taken", "amount_taken_lcy"),
+        ("interest", "interest_lcy"),
+        ("amount_repay", "amount_repay_lcy"),
+        ("amount_paid", "amount_paid_lcy"),
+        ("due_balance", "due_balance_lcy"),
+    ],
+}
+
+
+def lcy_models():
+    """Yield (model, [(amount column, lcy column)]) for every financial model."""
+    for label, fields in LCY_COLUMNS.items():
+        model = apps.get_model(label)
+        yield model, [(model._meta.get_field(amount).column, model._meta.get_field(lcy).column) for amount, lcy in fields]
+
+
+def _revalue_sql(model, columns):
+    """
+    One set-based UPDATE ... FROM for an id range of a single currency.
+    ROUND(x, 2) rounds half away from zero, matching ROUND_HALF_UP on the non-negative amounts.
+    Rows whose stored values already match are skipped, which makes re-runs no-ops.
+    modified_at is stamped on the rows whose stored LCY values change, and only on those: delta
+    sync (money_tracker.reports.sync) must resend them, or clients keep the old values. The time
+    is the statement's, like auto_now, not that of an enclosing transaction's start.
+    """
+    table = connection.ops.quote_name(model._meta.db_table)
+    pk = connection.ops.quote_name(model._meta.pk.column)
+    currency = connection.ops.quote_name(model._meta.get_field("currency").column)
+    rate_table = connection.ops.quote_name(ExchangeRate._meta.db_table)
+    assignments = ", ".join(
+        f"{connection.ops.quote_name(lcy)} = ROUND(t.{connection.ops.quote_name(amount)} * r.rate, 2)" for amount, lcy in columns
+    )
+    stale = " OR ".join(
+        f"t.{connection.ops.quote_name(lcy)} IS DISTINCT FROM ROUND(t.{connection.ops.quote_name(amount)} * r.rate, 2)"
+        for amount, lcy in columns
+    )
+    return (
+        f"UPDATE {table} AS t SET {assignments}, modified_at = STATEMENT_TIMESTAMP() "
+        f"FROM {rate_table} AS r "
+        f"WHERE r.currency_id = t.{currency} AND r.is_current "
+        f"AND t.{currency} = %s AND t.{pk} > %s AND t.{pk} <= %s "
+        f"AND ({stale})"
+    )
+
+
+def revalue_currency(currency_code, chunk_size=None, progress=None):
+    """
+    Recompute the stored *_lcy columns of every row in `currency_code` from its current exchange rate.
+    Each table is walked in primary-key ranges of `chunk_size`, one short transaction per chunk.
+    :param progress: optional callable receiving a dict after every chunk.
+    :return: dict with the number of rows updated per model and in total.
+    """
+    chunk_size = chunk_size or getattr(settings, "LCY_REVALUATION_CHUNK_SIZE", 10000)
+    targets = list(lcy_models())
+    report = {"currency": currency_code, "tables": len(targets), "tables_done": 0, "rows_updated": 0, "models": {}}
+
+    for model, columns in targets:
+        table = connection.ops.quote_name(model._meta.db_table)
+        pk = connection.ops.quote_name(model._meta.pk.column)
+        currency = connection.ops.quote_name(model._meta.get_field("currency").column)
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT MIN({pk}), MAX({pk}) FROM {table} WHERE {currency} = %s", [currency_code])
+            low, high = cursor.fetchone()
+
+        updated = 0
+        if low is not None:
+            sql = _revalue_sql(model, columns)
+            for start in range(low - 1, high, chunk_size):
+                with transaction.atomic(), connection.cursor() as cursor:
+                    cursor.execute(sql, [currency_code, start, start + chunk_size])
+                    updated += cursor.rowcount
+                if progress:
+                    progress({**report, "current": model._meta.label, "rows_updated": report["rows_updated"] + updated})
+
+        report["models"][model._meta.label] = updated
+        report["rows_updated"] += updated
+        report["tables_done"] += 1
+        if progress:
+            progress(report)
+
+    logger.info(f"Revalued {report['rows_updated']} rows in currency {currency_code}")
+    if report["rows_updated"]:
+        lcy_values_changed.send(sender=ExchangeRate, currencies=[currency_code])
+    return report
+
+
+def valuation_mode():
+    """The configured LCY_VALUATION_MODE: VALUATION_STORED or VALUATION_LIVE."""
+    mode = getattr(settings, "LCY_VALUATION_MODE", VALUATION_STORED)
+    if mode not in (VALUATION_STORED, VALUATION_LIVE):
+        raise ImproperlyConfigured(f"LCY_VALUATION_MODE must be '{VALUATION_STORED}' or '{VALUATION_LIVE}', got {mode!r}")
+    return mode
+
+
+class LCYQuerySet(models.QuerySet):
+    """
+    QuerySet of the financial models listed in LCY_COLUMNS.
+    with_live_lcy() values rows at the current exchange rate in SQL, so reads can
+    reflect today's rates without rewriting the stored *_lcy columns.
+    """
+
+    def _lcy_columns(self):
+        return LCY_COLUMNS[self.model._meta.label]
+
+    def _with_current_rate(self):
+        if "current_rate" in self.query._filtered_relations:
+            return self
+        # unique_current_rate_per_currency guarantees the join adds at most one row
+        return self.alias(
+            current_rate=models.FilteredRelation(
+                "currency__exchange_rate", condition=models.Q(currency__exchange_rate__is_current=True)
+            )
+        )
+
+    @staticmethod
+    def _live_expression(amount_field, lcy_field):
+        output_field = models.DecimalField(max_digits=20, decimal_places=2)
+        rate = Coalesce(
+            "current_rate__rate",
+            models.Case(models.When(currency__is_local=True, then=models.Value(Decimal("1")))),
+            output_field=models.DecimalField(max_digits=8, decimal_places=2),
+        )
+        # Foreign rows without a current rate keep their stored value
+        return Coalesce(Round(models.F(amount_field) * rate, 2), models.F(lcy_field), output_field=output_field)
+
+    def with_live_lcy(self):
+        """Annotate live_<lcy field> for every stored LCY column of the model, valued at the current rate."""
+        queryset = self._with_current_rate()
+        return queryset.annotate(
+            **{f"{LIVE_PREFIX}{lcy}": self._live_expression(amount, lcy) for amount, lcy in self._lcy_columns()}
+        )
+
+    def valued(self):
+        """with_live_lcy() in live valuation mode, the queryset unchanged in stored mode."""
+        return self.with_live_lcy() if valuation_mode() == VALUATION_LIVE else self
+
+    def lcy_value(self, lcy_field="amount_lcy"):
+        """An LCY column in the configured valuation mode, as an expression to evaluate on valued_for_sum()."""
+        if valuation_mode() == VALUATION_LIVE:
+            amount_field = dict((lcy, amount) for amount, lcy in self._lcy_columns())[lcy_field]
+            return self._live_expression(amount_field, lcy_field)
+        return models.F(lcy_field)
+
+    def lcy_sum(self, lcy_field="amount_lcy"):
+        """Sum() of an LCY column in the configured valuation mode, to aggregate or annotate on valued_for_sum()."""
+        return models.Sum(self.lcy_value(lcy_field))
+
+    def valued_for_sum(self):
+        """The queryset lcy_sum() expressions must be evaluated on."""
+        return self._with_current_rate() if valuation_mode() == VALUATION_LIVE else self
+
+    def total_lcy(self, lcy_field="amount_lcy"):
+        """Sum of an LCY column in the configured valuation mode, 0 for an empty queryset."""
+        return self.valued_for_sum().aggregate(total=self.lcy_sum(lcy_field))["total"] or 0
+
+    def category_total(self, category, lcy_field="amount_lcy"):
+        """
+        A one-row values queryset {"category", "total"} for the configured valuation mode.
+        Queries of different models can be combined with union(all=True) into a single statement.
+        """
+        return (
+            self.valued_for_sum()
+            .order_by()
+            .annotate(category=models.Value(category, output_field=models.CharField()))
+            .values("category")
+            .annotate(total=self.lcy_sum(lcy_field))
+        )
+
+    def currency_totals(self, group, lcy_field="amount_lcy"):
+        """
+        A values queryset {"group", "currency", "native", "total", "count"} with one row per currency,
+        the LCY total in the configured valuation mode. Combines with union(all=True) like category_total().
+        """
+        amount_field = dict((lcy, amount) for amount, lcy in self._lcy_columns())[lcy_field]
+        return (
+            self.valued_for_sum()
+            .order_by()
+            .annotate(group=models.Value(group, output_field=models.CharField()), currency_code=models.F("currency_id"))
+            .values("group", "currency_code")
+            .annotate(native=models.Sum(amount_field), total=self.lcy_sum(lcy_field), count=models.Count("pk"))
+        )
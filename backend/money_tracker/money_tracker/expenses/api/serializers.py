@@ -1,14 +1,25 @@
 from rest_framework import serializers
 from ..models import FixedExpense, VariableExpense, DiscretionaryExpense
 from django.core.exceptions import ValidationError as DjangoValidationError
-from money_tracker.currencies.models import Currency, ExchangeRate
+from money_tracker.currencies.models import ExchangeRate
+from money_tracker.currencies.api.compiled import lcy_display, related_value
+from money_tracker.currencies.api.serializers import CompiledReadMixin, LocalCurrencyDisplayMixin, SparseFieldsetMixin
 
-class BaseExpenseSerializer(serializers.ModelSerializer):
+class BaseExpenseSerializer(CompiledReadMixin, SparseFieldsetMixin, LocalCurrencyDisplayMixin, serializers.ModelSerializer):
     created_by = serializers.ReadOnlyField(source='created_by.username')
     modified_by = serializers.SerializerMethodField()
     amount_lcy_display = serializers.SerializerMethodField()
     created_at = serializers.DateTimeField(format="%b %d, %Y %I:%M %p", read_only=True)
     modified_at = serializers.DateTimeField(format="%b %d, %Y %I:%M %p", read_only=True)
+    method_field_columns = {
+        "modified_by": ("modified_by", "modified_by__username"),
+        "amount_lcy_display": ("currency", "amount_lcy"),
+    }
+    compiled_method_fields = {
+        "modified_by": related_value("modified_by__username"),
+        "amount_lcy_display": lcy_display("amount_lcy"),
+    }
+
     class Meta:
         fields = [
             "id", "expense_name", "currency", "amount", "notes", "created_by", "created_at",
@@ -21,13 +32,7 @@ class BaseExpenseSerializer(serializers.ModelSerializer):
         return obj.modified_by.username if obj.modified_by else None
 
     def get_amount_lcy_display(self, obj):
-        if obj.currency and obj.amount_lcy is not None:
-            try:
-                local_currency = Currency.objects.get(is_local=True)
-                return f"{local_currency.code} {obj.amount_lcy:.2f}"
-            except Currency.DoesNotExist:
-                return f"{obj.amount_lcy:.2f}"  # Fallback if no local currency is defined
-        return None
+        return self.format_lcy(obj, "amount_lcy")
 
     def validate(self, data):
         """Ensure amount is non-negative and authentication is enforced."""
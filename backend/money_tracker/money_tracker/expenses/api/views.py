@@ -1,17 +1,19 @@
 from rest_framework import viewsets, filters, status
 from drf_spectacular.utils import extend_schema
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
-from django.db.models import Sum
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from ..models import FixedExpense, VariableExpense, DiscretionaryExpense
 from .serializers import FixedExpenseSerializer, VariableExpenseSerializer, DiscretionaryExpenseSerializer
 from rest_framework.exceptions import PermissionDenied
+from money_tracker.currencies.api.mixins import CompiledListMixin, ConditionalGetMixin, DisplayCurrencyMixin
+from money_tracker.currencies.api.filters import SparseFieldsFilter
+from money_tracker.reports.summary import group_totals
 
-class BaseExpenseViewSet(viewsets.ModelViewSet):
+class BaseExpenseViewSet(ConditionalGetMixin, CompiledListMixin, viewsets.ModelViewSet):
     """Base viewset for expense models."""
     permission_classes = [IsAuthenticated]
-    filter_backends = [filters.OrderingFilter, filters.SearchFilter]
+    filter_backends = [filters.OrderingFilter, filters.SearchFilter, SparseFieldsFilter]
     search_fields = ["expense_name", "currency__code"]
     ordering_fields = ["created_at", "amount"]
     ordering = ["-created_at"]
@@ -20,7 +22,7 @@ class BaseExpenseViewSet(viewsets.ModelViewSet):
         """Return expenses belonging to the authenticated user."""
         user = self.request.user
         if user.is_authenticated:
-            return self.queryset.filter(created_by=self.request.user)
+            return self.queryset.filter(created_by=self.request.user).valued()
         return self.queryset.none()
     
     # def get_queryset(self):
@@ -53,7 +55,7 @@ class DiscretionaryExpenseViewSet(BaseExpenseViewSet):
     serializer_class = DiscretionaryExpenseSerializer
 
 @extend_schema(tags=["Total Expenses"])
-class TotalExpensesAPIView(APIView):
+class TotalExpensesAPIView(ConditionalGetMixin, DisplayCurrencyMixin, APIView):
     """API endpoint to get the total expenses across all categories."""
     permission_classes = [IsAuthenticated]
     # def get(self, request):
@@ -70,15 +72,4 @@ class TotalExpensesAPIView(APIView):
         if not user.is_authenticated:
             return Response({"detail": "Authentication required."}, status=401)
 
-        fixed_expenses_total = FixedExpense.objects.filter(created_by=user).aggregate(total=Sum("amount"))["total"] or 0
-        variable_expenses_total = VariableExpense.objects.filter(created_by=user).aggregate(total=Sum("amount"))["total"] or 0
-        discretionary_expenses_total = DiscretionaryExpense.objects.filter(created_by=user).aggregate(total=Sum("amount"))["total"] or 0
-
-        total_expenses = fixed_expenses_total + variable_expenses_total + discretionary_expenses_total
-        
-        return Response({
-            "total_expenses": total_expenses,
-            "fixed_expenses": fixed_expenses_total,
-            "variable_expenses": variable_expenses_total,
-            "discretionary_expenses": discretionary_expenses_total,
-        }, status=status.HTTP_200_OK)
+        return self.totals_response(request, group_totals(user.pk, "expenses"))
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.2 on 2026-10-18 06:13
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('currencies', '0005_owner_indexes'),
+        ('expenses', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='discretionaryexpense',
+            options={'get_latest_by': '-created_at', 'ordering': ['id'], 'verbose_name': 'Discretionary Expense', 'verbose_name_plural': 'Discretionary Expenses'},
+        ),
+        migrations.AlterModelOptions(
+            name='fixedexpense',
+            options={'get_latest_by': '-created_at', 'ordering': ['id'], 'verbose_name': 'Fixed Expense', 'verbose_name_plural': 'Fixed Expenses'},
+        ),
+        migrations.AlterModelOptions(
+            name='variableexpense',
+            options={'get_latest_by': '-created_at', 'ordering': ['id'], 'verbose_name': 'Variable Expense', 'verbose_name_plural': 'Variable Expenses'},
+        ),
+        migrations.AddIndex(
+            model_name='discretionaryexpense',
+            index=models.Index(fields=['created_by', '-created_at', '-id'], include=('amount_lcy',), name='discretionaryexpense_owner_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='fixedexpense',
+            index=models.Index(fields=['created_by', '-created_at', '-id'], include=('amount_lcy',), name='fixedexpense_owner_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='variableexpense',
+            index=models.Index(fields=['created_by', '-created_at', '-id'], include=('amount_lcy',), name='variableexpense_owner_idx'),
+        ),
+    ]
@@ -2,6 +2,8 @@ from django.db import models
 from money_tracker.currencies.models import Currency
 from django.conf import settings
 from money_tracker.currencies.mixins import CurrencyConversionMixin
+from money_tracker.currencies.valuation import LCYQuerySet
+from money_tracker.reports.tracking import SummaryTrackedMixin
 from django.core.exceptions import ValidationError
 from django.db import transaction
 from decimal import Decimal, ROUND_HALF_UP
@@ -11,7 +13,7 @@ import logging
 User = settings.AUTH_USER_MODEL
 logger = logging.getLogger(__name__)
 
-class BaseExpense(models.Model, CurrencyConversionMixin):
+class BaseExpense(SummaryTrackedMixin, models.Model, CurrencyConversionMixin):
     """Abstract base model for all expense types."""
     expense_name = models.CharField(max_length=100, null=False, blank=False)
     currency = models.ForeignKey(
@@ -29,10 +31,18 @@ class BaseExpense(models.Model, CurrencyConversionMixin):
     )
     modified_at = models.DateTimeField(auto_now=True)
 
+    objects = LCYQuerySet.as_manager()
+
     class Meta:
         abstract = True
         ordering = ["id"]
         get_latest_by = "-created_at"
+        indexes = [
+            # Covers the owner's keyset-paginated list (newest first) and LCY totals
+            models.Index(fields=["created_by", "-created_at", "-id"], include=["amount_lcy"], name="%(class)s_owner_idx"),
+            # Delta sync reads the rows an owner changed after a watermark (money_tracker.reports.sync)
+            models.Index(fields=["created_by", "modified_at"], name="%(class)s_sync_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.expense_name} costing {self.currency.code} {self.amount}"
@@ -54,18 +64,18 @@ class BaseExpense(models.Model, CurrencyConversionMixin):
 # Concrete Expense Models
 class FixedExpense(BaseExpense):
     """Expenses incurred periodically (e.g., rent, utilities)."""
-    class Meta:
+    class Meta(BaseExpense.Meta):
         verbose_name = "Fixed Expense"
         verbose_name_plural = "Fixed Expenses"
 
 class VariableExpense(BaseExpense):
     """Expenses that vary with usage (e.g., electricity, shopping)."""
-    class Meta:
+    class Meta(BaseExpense.Meta):
         verbose_name = "Variable Expense"
         verbose_name_plural = "Variable Expenses"
 
 class DiscretionaryExpense(BaseExpense):
     """Non-essential expenses (e.g., entertainment, travel)."""
-    class Meta:
+    class Meta(BaseExpense.Meta):
         verbose_name = "Discretionary Expense"
         verbose_name_plural = "Discretionary Expenses"
@@ -0,0 +1,88 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from ..models import FixedExpense
+
+URL = reverse("api:expenses:fixedexpense-list")
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def client(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def expenses(user, local_currency):
+    rows = [
+        FixedExpense.objects.create(expense_name=f"rent {i}", currency=local_currency, amount=i + 1, created_by=user)
+        for i in range(7)
+    ]
+    # Three rows share a timestamp so that pages must break ties on id
+    tied = timezone.now() - timedelta(days=1)
+    for row in rows[2:5]:
+        row.created_at, row.modified_by = tied, user
+        row.save()
+    return sorted(FixedExpense.objects.filter(created_by=user), key=lambda row: (row.created_at, row.pk), reverse=True)
+
+
+def ids(response):
+    return [row["id"] for row in response.data["results"]]
+
+
+def test_pages_walk_newest_first_without_gaps_or_repeats(client, expenses, django_assert_max_num_queries):
+    seen = []
+    url = URL + "?page_size=3"
+    while url:
+        # savepoint + one page + local currency + release; never a COUNT(*)
+        with django_assert_max_num_queries(4) as queries:
+            response = client.get(url)
+        assert not any("COUNT(" in query["sql"] for query in queries.captured_queries)
+        seen += ids(response)
+        url = response.data["next"]
+
+    assert seen == [row.pk for row in expenses]
+
+
+def test_previous_link_returns_the_same_page(client, expenses):
+    first = client.get(URL, {"page_size": 3})
+    second = client.get(first.data["next"])
+    assert first.data["previous"] is None
+
+    back = client.get(second.data["previous"])
+
+    assert ids(back) == ids(first)
+    assert back.data["previous"] is None
+    assert client.get(back.data["next"]).data["results"] == second.data["results"]
+
+
+def test_estimated_total_is_opt_in(client, expenses):
+    assert "estimated_total" not in client.get(URL).data
+    assert isinstance(client.get(URL, {"total": "estimate"}).data["estimated_total"], int)
+
+
+def test_invalid_cursor(client):
+    assert client.get(URL, {"cursor": "not-a-cursor"}).status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.parametrize("ordering", ["amount", "-amount"])
+def test_pages_follow_the_requested_ordering(client, expenses, ordering):
+    seen = []
+    response = client.get(URL, {"page_size": 3, "ordering": ordering})
+    while True:
+        seen += ids(response)
+        if not response.data["next"]:
+            break
+        response = client.get(response.data["next"])
+
+    expected = sorted(expenses, key=lambda row: row.amount, reverse=ordering.startswith("-"))
+    assert seen == [row.pk for row in expected]
+    assert ids(client.get(response.data["previous"])) == seen[3:6]
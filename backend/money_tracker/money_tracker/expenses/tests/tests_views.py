@@ -8,6 +8,8 @@ from rest_framework.test import APITestCase
 from django.contrib.auth import get_user_model
 from ..models import FixedExpense
 from decimal import Decimal
+from money_tracker.currencies.models import Currency, ExchangeRate
+from .factories import FixedExpenseFactory
 
 User = get_user_model()
 
@@ -41,8 +43,8 @@ class TestExpenseViewSets:
         response = authenticated_api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
-        assert response.data[0]["id"] == fixed_expense.id
-        assert len(response.data) == 1  # Ensure only the user's expenses are returned
+        assert response.data["results"][0]["id"] == fixed_expense.id
+        assert len(response.data["results"]) == 1  # Ensure only the user's expenses are returned
 
     def test_create_expense_requires_authentication(self, api_client, authenticated_api_client, user, local_currency):
         """Ensure authentication is required to create an expense."""
@@ -128,4 +130,62 @@ class TestTotalExpensesAPIView:
         response = another_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK 
-        assert response.data["total_expenses"] == 0 
\ No newline at end of file
+        assert response.data["total_expenses"] == 0 
+
+
+@pytest.mark.django_db
+def test_expense_list_resolves_local_currency_once(
+    authenticated_api_client, user, settings, django_assert_max_num_queries
+):
+    """amount_lcy_display must not look up the local currency once per row."""
+    settings.FAST_LIST_RENDERING = False  # render through the serializers' LocalCurrencyDisplayMixin
+    currency = Currency.objects.create(code="KES", description="Kenyan Shilling", is_local=True, created_by=user)
+    FixedExpenseFactory.create_batch(5, created_by=user, currency=currency)
+
+    url = reverse("api:expenses:fixedexpense-list")
+    # savepoint + list + local currency + release
+    with django_assert_max_num_queries(4):
+        response = authenticated_api_client.get(url)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert all(row["amount_lcy_display"].startswith("KES ") for row in response.data["results"])
+
+
+@pytest.mark.django_db
+class TestTotalExpensesDisplayCurrency:
+    """Totals are summed in the local currency and converted once when ?currency= is given."""
+
+    @pytest.fixture
+    def currencies(self, user):
+        kes = Currency.objects.create(code="KES", description="Kenyan Shilling", is_local=True, created_by=user)
+        usd = Currency.objects.create(code="USD", description="US Dollar", created_by=user)
+        ExchangeRate.objects.create(currency=usd, rate=Decimal("130.00"), is_current=True, created_by=user)
+        FixedExpense.objects.create(expense_name="rent", currency=usd, amount=Decimal("10.00"), created_by=user)
+        VariableExpense.objects.create(expense_name="fuel", currency=kes, amount=Decimal("1300.00"), created_by=user)
+        return kes, usd
+
+    def test_totals_are_summed_in_local_currency(self, authenticated_api_client, currencies):
+        response = authenticated_api_client.get(reverse("api:expenses:totalexpenses"))
+
+        assert response.data["total_expenses"] == Decimal("2600.00")
+        assert "currency" not in response.data
+
+    def test_totals_converted_to_display_currency(self, authenticated_api_client, currencies, django_assert_max_num_queries):
+        url = reverse("api:expenses:totalexpenses")
+        authenticated_api_client.get(url, {"currency": "usd"})  # warm the cross-rate cache
+
+        # savepoint + three aggregates + release
+        with django_assert_max_num_queries(5):
+            response = authenticated_api_client.get(url, {"currency": "usd"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["currency"] == "USD"
+        assert response.data["total_expenses"] == Decimal("20.00")
+        assert response.data["fixed_expenses"] == Decimal("10.00")
+        assert response.data["discretionary_expenses"] == Decimal("0.00")
+
+    def test_unknown_display_currency_is_rejected(self, authenticated_api_client, currencies):
+        response = authenticated_api_client.get(reverse("api:expenses:totalexpenses"), {"currency": "XYZ"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["currency"] == ["Unknown currency 'XYZ'."]
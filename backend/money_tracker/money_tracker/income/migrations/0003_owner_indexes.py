@@ -0,0 +1,28 @@
+# Generated by Django 5.2.2 on 2026-10-18 06:13
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('currencies', '0005_owner_indexes'),
+        ('income', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='earnedincome',
+            index=models.Index(fields=['created_by', '-created_at', '-id'], include=('amount_lcy',), name='earnedincome_owner_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='passiveincome',
+            index=models.Index(fields=['created_by', '-created_at', '-id'], include=('amount_lcy',), name='passiveincome_owner_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='portfolioincome',
+            index=models.Index(fields=['created_by', '-created_at', '-id'], include=('amount_lcy',), name='portfolioincome_owner_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.2 on 2026-10-18 06:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('currencies', '0006_sync_indexes'),
+        ('income', '0003_owner_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='earnedincome',
+            index=models.Index(fields=['created_by', 'modified_at'], name='earnedincome_sync_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='passiveincome',
+            index=models.Index(fields=['created_by', 'modified_at'], name='passiveincome_sync_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='portfolioincome',
+            index=models.Index(fields=['created_by', 'modified_at'], name='portfolioincome_sync_idx'),
+        ),
+    ]
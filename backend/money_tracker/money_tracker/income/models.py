@@ -3,6 +3,8 @@ from money_tracker.currencies.models import Currency
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from money_tracker.currencies.mixins import CurrencyConversionMixin
+from money_tracker.currencies.valuation import LCYQuerySet
+from money_tracker.reports.tracking import SummaryTrackedMixin
 from django.db import transaction
 from django.db.utils import IntegrityError
 from django.utils import timezone
@@ -12,7 +14,7 @@ User = settings.AUTH_USER_MODEL
 logger = logging.getLogger(__name__)
 
 # Create your models here.
-class BaseIncome(models.Model, CurrencyConversionMixin):
+class BaseIncome(SummaryTrackedMixin, models.Model, CurrencyConversionMixin):
     income_name = models.CharField(max_length=100, null=False, blank=False)
     currency = models.ForeignKey(Currency, on_delete=models.PROTECT, null=False, blank=False)
     amount = models.DecimalField(max_digits=12, decimal_places=2)
@@ -23,11 +25,17 @@ class BaseIncome(models.Model, CurrencyConversionMixin):
     modified_by = models.ForeignKey(User, on_delete=models.PROTECT, related_name="%(class)s_modified_by", related_query_name="%(class)s_modified_by", null=True, blank=True)
     modified_at = models.DateTimeField(auto_now=True)
 
+    objects = LCYQuerySet.as_manager()
+
     class Meta:
         abstract = True
         indexes = [
             models.Index(fields=["income_name"]),
             models.Index(fields=["created_at"]),
+            # Covers the owner's keyset-paginated list (newest first) and LCY totals
+            models.Index(fields=["created_by", "-created_at", "-id"], include=["amount_lcy"], name="%(class)s_owner_idx"),
+            # Delta sync reads the rows an owner changed after a watermark (money_tracker.reports.sync)
+            models.Index(fields=["created_by", "modified_at"], name="%(class)s_sync_idx"),
         ]
         # CheckConstraint for non-negative amounts
         constraints = [
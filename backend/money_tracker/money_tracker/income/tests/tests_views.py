@@ -32,8 +32,8 @@ def test_authenticated_users_see_only_their_earned_income(authenticated_api_clie
     response = authenticated_api_client.get(url)
 
     assert response.status_code == status.HTTP_200_OK
-    assert len(response.data) == 1  # ✅ Ensures only EarnedIncome is fetched
-    assert response.data[0]["income_name"] == earned_income.income_name
+    assert len(response.data["results"]) == 1  # ✅ Ensures only EarnedIncome is fetched
+    assert response.data["results"][0]["income_name"] == earned_income.income_name
 
 def test_portfolio_income_list(authenticated_api_client, portfolio_income):
     """
@@ -42,8 +42,8 @@ def test_portfolio_income_list(authenticated_api_client, portfolio_income):
     url = reverse('api:income:portfolioincome-list')  # Replace with your actual URL name
     response = authenticated_api_client.get(url)
     assert response.status_code == status.HTTP_200_OK
-    assert len(response.data) == 1
-    assert response.data[0]["income_name"] == portfolio_income.income_name
+    assert len(response.data["results"]) == 1
+    assert response.data["results"][0]["income_name"] == portfolio_income.income_name
 
 def test_passive_income_list(authenticated_api_client, passive_income):
     """
@@ -52,8 +52,8 @@ def test_passive_income_list(authenticated_api_client, passive_income):
     url = reverse('api:income:passiveincome-list')  # Replace with your actual URL name
     response = authenticated_api_client.get(url)
     assert response.status_code == status.HTTP_200_OK
-    assert len(response.data) == 1
-    assert response.data[0]["income_name"] == passive_income.income_name
+    assert len(response.data["results"]) == 1
+    assert response.data["results"][0]["income_name"] == passive_income.income_name
 
 def test_create_earned_income_requires_authentication(authenticated_api_client, user, local_currency, api_client):
     """
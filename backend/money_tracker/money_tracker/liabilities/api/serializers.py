@@ -1,6 +1,8 @@
 from rest_framework import serializers
 from ..models import Loan, InterestType
-from money_tracker.currencies.models import Currency, ExchangeRate
+from money_tracker.currencies.models import ExchangeRate
+from money_tracker.currencies.api.compiled import lcy_display, related_value
+from money_tracker.currencies.api.serializers import CompiledReadMixin, LocalCurrencyDisplayMixin, SparseFieldsetMixin
 from django.core.exceptions import ValidationError as DjangoValidationError
 
 
@@ -36,7 +38,7 @@ class InterestTypeSerializer(serializers.ModelSerializer):
             validated_data["modified_by"] = request.user
         return super().update(instance, validated_data)
     
-class LoanSerializer(serializers.ModelSerializer):
+class LoanSerializer(CompiledReadMixin, SparseFieldsetMixin, LocalCurrencyDisplayMixin, serializers.ModelSerializer):
     created_by = serializers.ReadOnlyField(source='created_by.username')
     # created_by = serializers.PrimaryKeyRelatedField(read_only=True)  # Accepts user ID but does not allow editing
     amount_taken_lcy_display = serializers.SerializerMethodField()
@@ -47,6 +49,19 @@ class LoanSerializer(serializers.ModelSerializer):
     created_at = serializers.DateTimeField(format="%b %d, %Y %I:%M %p", read_only=True)
     modified_at = serializers.DateTimeField(format="%b %d, %Y %I:%M %p", read_only=True)
     modified_by = serializers.SerializerMethodField()
+    method_field_columns = {
+        "modified_by": ("modified_by", "modified_by__username"),
+        **{f"{lcy}_display": ("currency", lcy) for lcy in (
+            "amount_taken_lcy", "interest_lcy", "amount_repay_lcy", "amount_paid_lcy", "due_balance_lcy",
+        )},
+    }
+    compiled_method_fields = {
+        "modified_by": related_value("modified_by__username"),
+        **{f"{lcy}_display": lcy_display(lcy) for lcy in (
+            "amount_taken_lcy", "interest_lcy", "amount_repay_lcy", "amount_paid_lcy", "due_balance_lcy",
+        )},
+    }
+
     class Meta:
         model = Loan
         fields = [
@@ -62,49 +77,19 @@ class LoanSerializer(serializers.ModelSerializer):
         return obj.modified_by.username if obj.modified_by else None
     
     def get_amount_taken_lcy_display(self, obj):
-        if obj.currency and obj.amount_taken_lcy is not None:
-            try:
-                local_currency = Currency.objects.get(is_local=True)
-                return f"{local_currency.code} {obj.amount_taken_lcy:.2f}"
-            except Currency.DoesNotExist:
-                return f"{obj.amount_taken_lcy:.2f}"  # Fallback if no local currency is defined
-        return None
+        return self.format_lcy(obj, "amount_taken_lcy")
     
     def get_interest_lcy_display(self, obj):
-        if obj.currency and obj.interest_lcy is not None:
-            try:
-                local_currency = Currency.objects.get(is_local=True)
-                return f"{local_currency.code} {obj.interest_lcy:.2f}"
-            except Currency.DoesNotExist:
-                return f"{obj.interest_lcy:.2f}"  # Fallback if no local currency is defined
-        return None
+        return self.format_lcy(obj, "interest_lcy")
     
     def get_amount_repay_lcy_display(self, obj):
-        if obj.currency and obj.amount_repay_lcy is not None:
-            try:
-                local_currency = Currency.objects.get(is_local=True)
-                return f"{local_currency.code} {obj.amount_repay_lcy:.2f}"
-            except Currency.DoesNotExist:
-                return f"{obj.amount_repay_lcy:.2f}"  # Fallback if no local currency is defined
-        return None
+        return self.format_lcy(obj, "amount_repay_lcy")
     
     def get_amount_paid_lcy_display(self, obj):
-        if obj.currency and obj.amount_paid_lcy is not None:
-            try:
-                local_currency = Currency.objects.get(is_local=True)
-                return f"{local_currency.code} {obj.amount_paid_lcy:.2f}"
-            except Currency.DoesNotExist:
-                return f"{obj.amount_paid_lcy:.2f}"  # Fallback if no local currency is defined
-        return None
+        return self.format_lcy(obj, "amount_paid_lcy")
     
     def get_due_balance_lcy_display(self, obj):
-        if obj.currency and obj.due_balance_lcy is not None:
-            try:
-                local_currency = Currency.objects.get(is_local=True)
-                return f"{local_currency.code} {obj.due_balance_lcy:.2f}"
-            except Currency.DoesNotExist:
-                return f"{obj.due_balance_lcy:.2f}"  # Fallback if no local currency is defined
-        return None
+        return self.format_lcy(obj, "due_balance_lcy")
 
     def validate(self, data):
         """Perform cross-field validation and assign errors to specific fields."""
@@ -3,19 +3,22 @@ from drf_spectacular.utils import extend_schema
 from . serializers import LoanSerializer, InterestTypeSerializer
 from rest_framework import viewsets, status
 from rest_framework.views import APIView
-from django.db.models import Sum
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
+from money_tracker.currencies.api.mixins import CompiledListMixin, ConditionalGetMixin, DisplayCurrencyMixin
+from money_tracker.currencies.api.filters import SparseFieldsFilter
+from money_tracker.reports.summary import group_totals
 
 # Create your views here.
 @extend_schema(tags=["Loans"])
-class LoanViewSet(viewsets.ModelViewSet):
+class LoanViewSet(ConditionalGetMixin, CompiledListMixin, viewsets.ModelViewSet):
     queryset = Loan.objects.all().select_related("currency", "created_by", "modified_by", "interest_type")
     serializer_class = LoanSerializer
+    filter_backends = [SparseFieldsFilter]
     
     def get_queryset(self):
         if self.request.user.is_authenticated:
-            return self.queryset.filter(created_by=self.request.user)  # ✅ Only their own assets
+            return self.queryset.filter(created_by=self.request.user).valued()  # ✅ Only their own assets
         return self.queryset.none()
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
@@ -36,16 +39,11 @@ class InterestTypeViewSet(viewsets.ModelViewSet):
         serializer.save(modified_by=self.request.user)
 
 @extend_schema(tags=["Total Liabilities"])
-class TotalLiabilitiesAPIView(APIView):
+class TotalLiabilitiesAPIView(ConditionalGetMixin, DisplayCurrencyMixin, APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
         user = request.user
         if not user.is_authenticated:
             return Response({"detail":"Authenticated Required"}, status=status.HTTP_401_UNAUTHORIZED)
-        loan_total = Loan.objects.filter(created_by=user).aggregate(total=Sum('amount_taken_lcy'))['total'] or 0
-        
-
-        total_liabilities = loan_total 
-
-        return Response({"total_liabilities": total_liabilities, "loans": loan_total}, status=status.HTTP_200_OK)
\ No newline at end of file
+        return self.totals_response(request, group_totals(user.pk, "liabilities"))
\ No newline at end of file
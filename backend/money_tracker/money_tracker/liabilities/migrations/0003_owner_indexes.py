@@ -0,0 +1,20 @@
+# Generated by Django 5.2.2 on 2026-10-18 06:13
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('currencies', '0005_owner_indexes'),
+        ('liabilities', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='loan',
+            index=models.Index(fields=['created_by', '-created_at', '-id'], include=('amount_taken_lcy',), name='loan_owner_idx'),
+        ),
+    ]
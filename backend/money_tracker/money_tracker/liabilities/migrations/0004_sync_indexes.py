@@ -0,0 +1,20 @@
+# Generated by Django 5.2.2 on 2026-10-18 06:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('currencies', '0006_sync_indexes'),
+        ('liabilities', '0003_owner_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='loan',
+            index=models.Index(fields=['created_by', 'modified_at'], name='loan_sync_idx'),
+        ),
+    ]
@@ -2,6 +2,8 @@ from django.db import models
 from money_tracker.currencies.models import Currency
 from .mixins import InterestCalculationMixin
 from money_tracker.currencies.mixins import CurrencyConversionMixin
+from money_tracker.currencies.valuation import LCYQuerySet
+from money_tracker.reports.tracking import SummaryTrackedMixin
 from django.core.exceptions import ValidationError
 from django.db import transaction
 from django.utils import timezone
@@ -41,7 +43,7 @@ class InterestType(models.Model):
         verbose_name = "Interest Type"
         verbose_name_plural = "Interest Types"
 
-class Loan(models.Model, CurrencyConversionMixin, InterestCalculationMixin):
+class Loan(SummaryTrackedMixin, models.Model, CurrencyConversionMixin, InterestCalculationMixin):
     source = models.CharField(max_length=100, null=False, blank=False)
     loan_date = models.DateField(null=False, blank=False)
     currency = models.ForeignKey(Currency, on_delete=models.PROTECT, null=False, blank=False, related_name='lcurrency', related_query_name='lcurrency')
@@ -65,6 +67,8 @@ class Loan(models.Model, CurrencyConversionMixin, InterestCalculationMixin):
     created_at = models.DateTimeField(auto_now_add=True)
     modified_by = models.ForeignKey(User, on_delete=models.PROTECT, related_name='lmodifier', related_query_name='lmodifier', blank=True, null=True)
     modified_at = models.DateTimeField(auto_now=True)
+
+    objects = LCYQuerySet.as_manager()
     
     def __str__(self) -> str:
         return f"Loan from {self.source} for {self.reason} of amount {self.currency} {self.amount_taken} due on {self.created_at:%B %Y}"
@@ -88,9 +92,6 @@ class Loan(models.Model, CurrencyConversionMixin, InterestCalculationMixin):
 
         try:
             with transaction.atomic():
-                # Convert amount to local currency
-                self.amount_taken_lcy = Decimal(self.convert_to_lcy(self.amount_taken, self.currency)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-
                 # Calculate interest based on type
                 if self.interest_type.code == "COMPOUND":
                     self.interest = self.calculate_compound_interest(
@@ -103,14 +104,21 @@ class Loan(models.Model, CurrencyConversionMixin, InterestCalculationMixin):
 
                 # Round calculated values to ensure they fit max_digits=20 and decimal_places=2
                 self.interest = Decimal(self.interest).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-                self.interest_lcy = Decimal(self.convert_to_lcy(self.interest, self.currency)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
 
                 # Ensure total repayment amount is rounded properly
                 self.amount_repay = Decimal(self.amount_taken + self.interest).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-                self.amount_repay_lcy = Decimal(self.convert_to_lcy(self.amount_repay, self.currency)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
 
-                self.amount_paid_lcy = Decimal(self.convert_to_lcy(self.amount_paid, self.currency)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-                self.due_balance_lcy = Decimal(self.convert_to_lcy(self.due_balance, self.currency)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+                # Convert all amounts to local currency with a single rate lookup
+                (
+                    self.amount_taken_lcy,
+                    self.interest_lcy,
+                    self.amount_repay_lcy,
+                    self.amount_paid_lcy,
+                    self.due_balance_lcy,
+                ) = self.convert_many(
+                    [self.amount_taken, self.interest, self.amount_repay, self.amount_paid, self.due_balance],
+                    self.currency,
+                )
 
                 self.full_clean()
                 super().save(*args, **kwargs)
@@ -123,6 +131,12 @@ class Loan(models.Model, CurrencyConversionMixin, InterestCalculationMixin):
     class Meta:
         ordering = ['id']
         get_latest_by = "created_at"
+        indexes = [
+            # Covers the owner's keyset-paginated list (newest first) and LCY totals
+            models.Index(fields=["created_by", "-created_at", "-id"], include=["amount_taken_lcy"], name="loan_owner_idx"),
+            # Delta sync reads the rows an owner changed after a watermark (money_tracker.reports.sync)
+            models.Index(fields=["created_by", "modified_at"], name="loan_sync_idx"),
+        ]
         
     def loan_default(self):
         """Check if the loan is in default based on the due balance and repayment date."""
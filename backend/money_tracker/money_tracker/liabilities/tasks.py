@@ -1,6 +1,8 @@
 from celery import shared_task
 from django.utils import timezone
 from .models import Loan
+from money_tracker.reports.push import notify_data_change
+from money_tracker.reports.versions import bump_data_version
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,9 +18,15 @@ def check_loan_default():
     count = defaulted_loans.count()
     
     if count > 0:
-        defaulted_loans.update(in_default=True)
+        owners = set(defaulted_loans.values_list("created_by_id", flat=True))
+        # update() skips auto_now, so modified_at is set here for /api/sync/ to pick the loans up
+        defaulted_loans.update(in_default=True, modified_at=timezone.now())
+        # update() sends no post_save, so the owners' data versions are bumped and pushed here
+        for owner_id in owners:
+            bump_data_version(owner_id)
+            notify_data_change(owner_id)
         logger.info(f"Marked {count} loans as defaulted on {today}.")
     
     # TODO: Implement email notification for affected users
     
-    return f"Loan default check completed. Updated {defaulted_loans.count()} loans."
\ No newline at end of file
+    return f"Loan default check completed. Updated {count} loans."
\ No newline at end of file
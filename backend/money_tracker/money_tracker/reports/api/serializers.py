@@ -0,0 +1,93 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import serializers
+
+from ..monthly import add_months
+from ..monthly import months_between
+from ..summary import MONTHLY_GROUPS
+from ..transactions import TRANSACTION_TYPES
+
+MONTH_FORMAT = "%Y-%m"
+NET_WORTH_DEFAULT_DAYS = 90
+
+
+class MonthlyReportQuerySerializer(serializers.Serializer):
+    """Query parameters of the monthly report; the last 12 months by default."""
+    start = serializers.DateField(input_formats=[MONTH_FORMAT], required=False, help_text="First month, YYYY-MM")
+    end = serializers.DateField(input_formats=[MONTH_FORMAT], required=False, help_text="Last month, YYYY-MM")
+    group = serializers.ChoiceField(choices=MONTHLY_GROUPS, required=False, help_text="Only this group")
+
+    def validate(self, attrs):
+        end = attrs.get("end") or timezone.localdate().replace(day=1)
+        start = attrs.get("start") or add_months(end, -11)
+        if start > end:
+            raise serializers.ValidationError({"start": "The first month must not be after the last month."})
+        limit = getattr(settings, "MONTHLY_REPORT_MAX_MONTHS", 120)
+        if months_between(start, end) > limit:
+            raise serializers.ValidationError({"end": f"At most {limit} months can be requested at once."})
+        groups = (attrs["group"],) if attrs.get("group") else MONTHLY_GROUPS
+        return {"start": start, "end": end, "groups": groups}
+
+
+class NetWorthQuerySerializer(serializers.Serializer):
+    """Query parameters of the net worth history; the last 90 days by default."""
+    start = serializers.DateField(required=False, help_text="First day, YYYY-MM-DD")
+    end = serializers.DateField(required=False, help_text="Last day, YYYY-MM-DD")
+
+    def validate(self, attrs):
+        end = attrs.get("end") or timezone.localdate()
+        start = attrs.get("start") or end - timedelta(days=NET_WORTH_DEFAULT_DAYS - 1)
+        if start > end:
+            raise serializers.ValidationError({"start": "The first day must not be after the last day."})
+        limit = getattr(settings, "NET_WORTH_MAX_DAYS", 3660)
+        if (end - start).days + 1 > limit:
+            raise serializers.ValidationError({"end": f"At most {limit} days can be requested at once."})
+        return {"start": start, "end": end}
+
+
+class ForecastQuerySerializer(serializers.Serializer):
+    """Query parameters of the cash-flow forecast."""
+    months = serializers.IntegerField(required=False, default=12, min_value=1, help_text="Months to project")
+
+    def validate_months(self, value):
+        limit = getattr(settings, "CASH_FLOW_FORECAST_MAX_MONTHS", 120)
+        if value > limit:
+            raise serializers.ValidationError(f"At most {limit} months can be projected.")
+        return value
+
+
+class SyncQuerySerializer(serializers.Serializer):
+    """Query parameters of the delta sync."""
+    since = serializers.DateTimeField(
+        required=False, help_text="The watermark of the previous sync; everything is returned without it"
+    )
+
+
+class TransactionQuerySerializer(serializers.Serializer):
+    """Query parameters of the transaction feed; every income and expense type by default."""
+    type = serializers.MultipleChoiceField(
+        choices=list(TRANSACTION_TYPES), required=False, help_text="Only these types (repeatable)"
+    )
+    group = serializers.ChoiceField(choices=MONTHLY_GROUPS, required=False, help_text="Only income or expenses")
+
+    def validate(self, attrs):
+        types = [
+            category for category, (_, group) in TRANSACTION_TYPES.items()
+            if (not attrs.get("type") or category in attrs["type"]) and attrs.get("group") in (None, group)
+        ]
+        return {"types": types}
+
+
+class TransactionSerializer(serializers.Serializer):
+    """One row of the transaction feed, the same shape for every type."""
+    type = serializers.ChoiceField(choices=list(TRANSACTION_TYPES))
+    group = serializers.ChoiceField(choices=MONTHLY_GROUPS)
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    currency = serializers.CharField()
+    amount = serializers.DecimalField(max_digits=20, decimal_places=2)
+    amount_lcy = serializers.DecimalField(max_digits=20, decimal_places=2, source="lcy_amount")
+    notes = serializers.CharField(allow_null=True)
+    created_at = serializers.DateTimeField(format="%b %d, %Y %I:%M %p")
@@ -0,0 +1,161 @@
+from django.http import StreamingHttpResponse
+from drf_spectacular.utils import OpenApiResponse
+from drf_spectacular.utils import extend_schema
+from rest_framework import generics
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from config.pagination import FeedCursorPagination
+from money_tracker.currencies.api.mixins import ConditionalGetMixin
+
+from ..exposure import get_exposure
+from ..forecast import build_forecast
+from ..models import NetWorthSnapshot
+from ..monthly import monthly_series
+from ..push import event_stream
+from ..ratios import get_ratios
+from ..summary import get_summary
+from ..sync import SyncExpired
+from ..sync import build_sync
+from ..transactions import TransactionFeed
+from .renderers import EventStreamRenderer
+from .serializers import MONTH_FORMAT
+from .serializers import ForecastQuerySerializer
+from .serializers import MonthlyReportQuerySerializer
+from .serializers import NetWorthQuerySerializer
+from .serializers import SyncQuerySerializer
+from .serializers import TransactionQuerySerializer
+from .serializers import TransactionSerializer
+
+
+@extend_schema(tags=["Dashboard"])
+class DashboardSummaryAPIView(ConditionalGetMixin, APIView):
+    """Every dashboard total and the local currency in one response."""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        return Response(get_summary(request.user.pk), status=status.HTTP_200_OK)
+
+
+@extend_schema(tags=["Reports"])
+class CurrencyExposureAPIView(APIView):
+    """Native and LCY sums of income, assets, expenses and loans per currency."""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        return Response(get_exposure(request.user.pk), status=status.HTTP_200_OK)
+
+
+@extend_schema(tags=["Reports"], parameters=[ForecastQuerySerializer])
+class CashFlowForecastAPIView(APIView):
+    """Projected monthly cash flow from recurring earned income, fixed expenses and loan repayments (?months=N)."""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        query = ForecastQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        return Response(build_forecast(request.user.pk, query.validated_data["months"]), status=status.HTTP_200_OK)
+
+
+@extend_schema(tags=["Reports"], parameters=[MonthlyReportQuerySerializer])
+class MonthlyReportAPIView(APIView):
+    """Income and expense totals per month over a range of months (?start=YYYY-MM&end=YYYY-MM&group=)."""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        query = MonthlyReportQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        start, end, groups = query.validated_data["start"], query.validated_data["end"], query.validated_data["groups"]
+        return Response({
+            "start": f"{start:{MONTH_FORMAT}}",
+            "end": f"{end:{MONTH_FORMAT}}",
+            "months": monthly_series(request.user.pk, start, end, groups),
+        }, status=status.HTTP_200_OK)
+
+
+@extend_schema(tags=["Reports"])
+class FinancialRatiosAPIView(APIView):
+    """Debt-to-asset, liquidity, savings and equity ownership ratios with the figures behind them."""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        return Response(get_ratios(request.user.pk), status=status.HTTP_200_OK)
+
+
+@extend_schema(tags=["Reports"], parameters=[NetWorthQuerySerializer])
+class NetWorthReportAPIView(APIView):
+    """Daily net worth snapshots over a range of days (?start=YYYY-MM-DD&end=YYYY-MM-DD); days without a snapshot are omitted."""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        query = NetWorthQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        start, end = query.validated_data["start"], query.validated_data["end"]
+        rows = NetWorthSnapshot.objects.filter(user=request.user, date__gte=start, date__lte=end).values_list(
+            "date", "assets", "liabilities"
+        )
+        return Response({
+            "start": start,
+            "end": end,
+            "snapshots": [
+                {"date": day, "assets": assets, "liabilities": liabilities, "net_worth": assets - liabilities}
+                for day, assets, liabilities in rows
+            ],
+        }, status=status.HTTP_200_OK)
+
+
+@extend_schema(tags=["Sync"], parameters=[SyncQuerySerializer])
+class SyncAPIView(ConditionalGetMixin, APIView):
+    """
+    Delta sync: the records created or modified ("changed") and deleted after ?since=, per category.
+    Clients apply "deleted" and then "changed", and pass the returned watermark as the next ?since=.
+    Answers 410 when ?since= is older than the retained deletes; the client then syncs without it.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        query = SyncQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        try:
+            data = build_sync(request.user.pk, query.validated_data.get("since"), {"request": request})
+        except SyncExpired:
+            return Response(
+                {"detail": "The watermark is too old; sync again without since."}, status=status.HTTP_410_GONE
+            )
+        return Response(data, status=status.HTTP_200_OK)
+
+
+@extend_schema(tags=["Sync"], responses={200: OpenApiResponse(description="text/event-stream of version events")})
+class DataEventsAPIView(APIView):
+    """
+    Server-sent events telling the user's open sessions that their records or totals changed,
+    instead of polling: see money_tracker.reports.push.event_stream. Needs an ASGI server.
+    """
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [EventStreamRenderer, JSONRenderer]
+
+    def get(self, request):
+        response = StreamingHttpResponse(event_stream(request.user.pk), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"  # stops nginx from buffering the events
+        return response
+
+
+@extend_schema(tags=["Transactions"], parameters=[TransactionQuerySerializer])
+class TransactionFeedAPIView(ConditionalGetMixin, generics.ListAPIView):
+    """
+    Income and expense records of every type in one feed, newest first, as rows of one shape.
+    Cursor-paginated; see money_tracker.reports.transactions.TransactionFeed.
+    """
+    permission_classes = [IsAuthenticated]
+    serializer_class = TransactionSerializer
+    pagination_class = FeedCursorPagination
+    filter_backends = []
+
+    def get_queryset(self):
+        query = TransactionQuerySerializer(data=self.request.query_params)
+        query.is_valid(raise_exception=True)
+        return TransactionFeed(self.request.user.pk, query.validated_data["types"])
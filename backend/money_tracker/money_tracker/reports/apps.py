@@ -0,0 +1,13 @@
+import contextlib
+
+from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
+
+class ReportsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'money_tracker.reports'
+    verbose_name = _("Reports")
+
+    def ready(self):
+        with contextlib.suppress(ImportError):
+            import money_tracker.reports.signals  # noqa: F401
@@ -0,0 +1,56 @@
+from decimal import ROUND_HALF_UP
+from decimal import Decimal
+
+from django.apps import apps
+
+from money_tracker.currencies.registry import local_currency_registry
+
+from .summary import SUMMARY_GROUPS
+from .summary import get_cached_report
+
+SHARE = Decimal("0.0001")
+
+
+def currency_rows(user_id):
+    """(group, currency, native sum, LCY sum, count) per table and currency of a user, in a single UNION ALL query."""
+    queries = [
+        apps.get_model(label).objects.filter(created_by_id=user_id).currency_totals(group, lcy_field)
+        for group, (_, members) in SUMMARY_GROUPS.items()
+        for label, _, lcy_field in members
+    ]
+    rows = queries[0].union(*queries[1:], all=True)
+    return [(row["group"], row["currency_code"], row["native"], row["total"], row["count"]) for row in rows]
+
+
+def build_exposure(user_id):
+    """
+    How much of each group (income, assets, expenses, liabilities) is held in each currency:
+    native and LCY sums, record counts and the share of the group's LCY total.
+    """
+    empty = {"native": Decimal("0"), "lcy": Decimal("0"), "count": 0}
+    by_currency = {}
+    totals = {group: Decimal("0") for group in SUMMARY_GROUPS}
+    for group, code, native, lcy, count in currency_rows(user_id):
+        entry = by_currency.setdefault(code, {"currency": code, **{g: dict(empty) for g in SUMMARY_GROUPS}})
+        values = entry[group]
+        values["native"] += native or 0
+        values["lcy"] += lcy or 0
+        values["count"] += count
+        totals[group] += lcy or 0
+
+    for entry in by_currency.values():
+        for group in SUMMARY_GROUPS:
+            lcy = entry[group]["lcy"]
+            entry[group]["share"] = (lcy / totals[group]).quantize(SHARE, rounding=ROUND_HALF_UP) if totals[group] else Decimal("0")
+
+    local_currency = local_currency_registry.get(user_id)
+    return {
+        "local_currency": local_currency.code if local_currency else None,
+        "totals": totals,
+        "currencies": sorted(by_currency.values(), key=lambda entry: entry["currency"]),
+    }
+
+
+def get_exposure(user_id):
+    """The currency exposure of a user, cached and invalidated with the dashboard summary."""
+    return get_cached_report("currency_exposure", user_id, build_exposure)
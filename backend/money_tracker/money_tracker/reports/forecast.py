@@ -0,0 +1,107 @@
+from decimal import ROUND_HALF_UP
+from decimal import Decimal
+
+import numpy as np
+from django.apps import apps
+from django.utils import timezone
+
+from money_tracker.currencies.valuation import LIVE_PREFIX
+from money_tracker.currencies.valuation import VALUATION_LIVE
+from money_tracker.currencies.valuation import valuation_mode
+
+from .monthly import add_months
+from .monthly import months_between
+
+CENTS = Decimal("0.01")
+LOAN_FIELDS = ("due_balance_lcy", "amount_repay_lcy", "amount_paid_lcy")
+
+
+def project(months, monthly_income, monthly_expenses, outstanding, installments):
+    """
+    Project cash flow over `months` periods with whole-array operations, in integer cents,
+    so that every figure is exact and rounding happens once, when amounts enter as cents.
+
+    Earned income and fixed expenses recur every month. Each loan's outstanding balance is
+    repaid in equal monthly installments over its remaining term (installments[i] months,
+    at least 1), the last installment absorbing the remainder.
+    :param monthly_income: cents of earned income per month.
+    :param monthly_expenses: cents of fixed expenses per month.
+    :param outstanding: int array of the cents of each loan still to repay, in LCY.
+    :param installments: int array of the number of months left to repay each loan.
+    :return: dict of int64 arrays of cents of length `months`.
+    """
+    period = np.arange(months)
+    outstanding = np.asarray(outstanding, dtype=np.int64)
+    installments = np.maximum(np.asarray(installments, dtype=np.int64), 1)
+
+    installment = outstanding // installments
+    last = outstanding - installment * (installments - 1)
+    schedule = np.where(
+        period[None, :] < (installments - 1)[:, None],
+        installment[:, None],
+        np.where(period[None, :] == (installments - 1)[:, None], last[:, None], 0),
+    )
+    income = np.full(months, monthly_income, dtype=np.int64)
+    expenses = np.full(months, monthly_expenses, dtype=np.int64)
+    repayments = schedule.sum(axis=0, dtype=np.int64)
+    net = income - expenses - repayments
+    return {
+        "income": income,
+        "expenses": expenses,
+        "loan_repayments": repayments,
+        "net": net,
+        "cumulative_net": np.cumsum(net),
+    }
+
+
+def to_cents(amount):
+    """Whole cents of an LCY amount, rounded half up."""
+    return int((Decimal(amount) / CENTS).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+
+
+def _recurring_totals(user_id):
+    """(monthly earned income, monthly fixed expenses) in LCY cents, in a single query."""
+    income = apps.get_model("income", "EarnedIncome").objects.filter(created_by_id=user_id).category_total("income")
+    expenses = apps.get_model("expenses", "FixedExpense").objects.filter(created_by_id=user_id).category_total("expenses")
+    totals = {row["category"]: row["total"] or 0 for row in income.union(expenses, all=True)}
+    return to_cents(totals.get("income", 0)), to_cents(totals.get("expenses", 0))
+
+
+def _loan_terms(user_id, start):
+    """Outstanding LCY balances in cents and months left to repay of a user's loans, as int arrays."""
+    live = valuation_mode() == VALUATION_LIVE
+    Loan = apps.get_model("liabilities", "Loan")
+    fields = [f"{LIVE_PREFIX}{field}" if live else field for field in LOAN_FIELDS]
+    rows = list(Loan.objects.filter(created_by_id=user_id).valued().values_list(*fields, "repayment_date"))
+    if not rows:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    due, repay, paid = (np.array([to_cents(row[i]) for row in rows], dtype=np.int64) for i in range(3))
+    # due_balance is authoritative once set; otherwise what is left of the repayment amount
+    outstanding = np.where(due > 0, due, np.maximum(repay - paid, 0))
+    installments = np.fromiter((months_between(start, row[3]) for row in rows), dtype=np.int64, count=len(rows))
+    return outstanding, installments
+
+
+def build_forecast(user_id, months, start=None):
+    """
+    Month-by-month cash-flow forecast of a user for `months` months from `start`
+    (next month by default), in LCY. Runs two queries.
+    """
+    start = start or add_months(timezone.localdate(), 1)
+    monthly_income, monthly_expenses = _recurring_totals(user_id)
+    outstanding, installments = _loan_terms(user_id, start)
+    series = project(months, monthly_income, monthly_expenses, outstanding, installments)
+
+    columns = list(series)
+    periods = []
+    for offset, values in enumerate(zip(*(series[column].tolist() for column in columns))):
+        period = {"month": f"{add_months(start, offset):%Y-%m}"}
+        period.update((column, _lcy(value)) for column, value in zip(columns, values))
+        periods.append(period)
+    totals = {column: _lcy(series[column].sum()) for column in ("income", "expenses", "loan_repayments", "net")}
+    return {"start": f"{start:%Y-%m}", "months": months, "totals": totals, "periods": periods}
+
+
+def _lcy(cents):
+    """Decimal LCY amount of a whole number of cents."""
+    return Decimal(int(cents)) * CENTS
@@ -0,0 +1,43 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from money_tracker.reports.summary import invalidate_all_summaries
+from money_tracker.reports.tracking import check_monthly_rollups
+from money_tracker.reports.tracking import check_summaries
+from money_tracker.reports.tracking import rebuild_monthly_rollups
+from money_tracker.reports.tracking import rebuild_summaries
+
+
+class Command(BaseCommand):
+    help = "Recomputes the FinancialSummary and MonthlyRollup tables from the income, expense, asset and loan tables"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", type=int, action="append", dest="users", help="Only this user ID (repeatable)")
+        parser.add_argument("--check", action="store_true", help="Only report rows that differ from the source tables")
+
+    def handle(self, *args, **options):
+        user_ids = options["users"]
+        if options["check"]:
+            mismatches = check_summaries(user_ids) + check_monthly_rollups(user_ids)
+            for *key, stored, actual in mismatches:
+                user_id, category, *month = key
+                where = f" {month[0]:%Y-%m}" if month else ""
+                self.stdout.write(
+                    f"user {user_id} {category}{where}: stored {stored[0]} over {stored[1]}, "
+                    f"actual {actual[0]} over {actual[1]}"
+                )
+            if mismatches:
+                raise CommandError(f"{len(mismatches)} financial summary rows are out of date.")
+            self.stdout.write(self.style.SUCCESS("Financial summaries are consistent."))
+            return
+
+        started = time.perf_counter()
+        written = rebuild_summaries(user_ids)
+        months = rebuild_monthly_rollups(user_ids)
+        invalidate_all_summaries()
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt {written} financial summary rows and {months} monthly rollup rows "
+            f"in {time.perf_counter() - started:.3f}s."
+        ))
@@ -0,0 +1,69 @@
+# Generated by Django 5.2.2 on 2026-10-18 06:01
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+
+
+# (table, category, LCY column) of the tracked tables as of this migration; frozen, so that
+# later changes to money_tracker.reports.tracking do not change what this migration does
+TRACKED_TABLES = [
+    ('income_earnedincome', 'earned_income', 'amount_lcy'),
+    ('income_portfolioincome', 'portfolio_income', 'amount_lcy'),
+    ('income_passiveincome', 'passive_income', 'amount_lcy'),
+    ('assets_liquidasset', 'liquid_assets', 'amount_lcy'),
+    ('assets_equity', 'equities', 'amount_lcy'),
+    ('assets_investmentaccount', 'investment_accounts', 'amount_lcy'),
+    ('assets_retirementaccount', 'retirement_accounts', 'amount_lcy'),
+    ('expenses_fixedexpense', 'fixed_expenses', 'amount_lcy'),
+    ('expenses_variableexpense', 'variable_expenses', 'amount_lcy'),
+    ('expenses_discretionaryexpense', 'discretionary_expenses', 'amount_lcy'),
+    ('liabilities_loan', 'loans', 'amount_taken_lcy'),
+]
+
+
+def populate_summaries(apps, schema_editor):
+    quote = schema_editor.quote_name
+    totals = " UNION ALL ".join(
+        f"SELECT created_by_id AS user_id, '{category}' AS category, COALESCE(SUM({quote(lcy)}), 0) AS total, "
+        f"COUNT(*) AS count FROM {quote(table)} GROUP BY created_by_id"
+        for table, category, lcy in TRACKED_TABLES
+    )
+    schema_editor.execute(
+        "INSERT INTO reports_financialsummary (user_id, category, total, count, modified_at) "
+        f"SELECT user_id, category, total, count, NOW() FROM ({totals}) AS totals"
+    )
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('assets', '0002_initial'),
+        ('expenses', '0002_initial'),
+        ('income', '0002_initial'),
+        ('liabilities', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FinancialSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('category', models.CharField(max_length=32)),
+                ('total', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=20)),
+                ('count', models.IntegerField(default=0)),
+                ('modified_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='financial_summaries', related_query_name='financial_summary', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Financial Summary',
+                'verbose_name_plural': 'Financial Summaries',
+                'constraints': [models.UniqueConstraint(fields=('user', 'category'), name='unique_summary_per_user_category')],
+            },
+        ),
+        migrations.RunPython(populate_summaries, migrations.RunPython.noop),
+    ]
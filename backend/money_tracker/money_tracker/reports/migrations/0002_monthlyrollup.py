@@ -0,0 +1,64 @@
+# Generated by Django 5.2.2 on 2026-10-18 06:05
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+# (table, category) of the income and expense tables as of this migration; frozen, so that
+# later changes to money_tracker.reports.tracking do not change what this migration does
+MONTHLY_TABLES = [
+    ('income_earnedincome', 'earned_income'),
+    ('income_portfolioincome', 'portfolio_income'),
+    ('income_passiveincome', 'passive_income'),
+    ('expenses_fixedexpense', 'fixed_expenses'),
+    ('expenses_variableexpense', 'variable_expenses'),
+    ('expenses_discretionaryexpense', 'discretionary_expenses'),
+]
+
+
+def populate_rollups(apps, schema_editor):
+    quote = schema_editor.quote_name
+    totals = " UNION ALL ".join(
+        f"SELECT created_by_id AS user_id, '{category}' AS category, "
+        "DATE_TRUNC('month', created_at AT TIME ZONE %s)::date AS month, "
+        f"COALESCE(SUM(amount_lcy), 0) AS total, COUNT(*) AS count FROM {quote(table)} GROUP BY created_by_id, month"
+        for table, category in MONTHLY_TABLES
+    )
+    schema_editor.execute(
+        "INSERT INTO reports_monthlyrollup (user_id, category, month, total, count, modified_at) "
+        f"SELECT user_id, category, month, total, count, NOW() FROM ({totals}) AS totals",
+        [timezone.get_current_timezone_name()] * len(MONTHLY_TABLES),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0001_financialsummary'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MonthlyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('category', models.CharField(max_length=32)),
+                ('month', models.DateField(help_text='First day of the month')),
+                ('total', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=20)),
+                ('count', models.IntegerField(default=0)),
+                ('modified_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_rollups', related_query_name='monthly_rollup', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Monthly Rollup',
+                'verbose_name_plural': 'Monthly Rollups',
+                'ordering': ['month', 'category'],
+                'constraints': [models.UniqueConstraint(fields=('user', 'month', 'category'), name='unique_rollup_per_user_month_category')],
+            },
+        ),
+        migrations.RunPython(populate_rollups, migrations.RunPython.noop),
+    ]
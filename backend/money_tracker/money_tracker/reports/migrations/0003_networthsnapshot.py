@@ -0,0 +1,34 @@
+# Generated by Django 5.2.2 on 2026-10-18 06:08
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0002_monthlyrollup'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NetWorthSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('assets', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=20)),
+                ('liabilities', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=20)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='net_worth_snapshots', related_query_name='net_worth_snapshot', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Net Worth Snapshot',
+                'verbose_name_plural': 'Net Worth Snapshots',
+                'ordering': ['date'],
+                'get_latest_by': 'date',
+                'constraints': [models.UniqueConstraint(fields=('user', 'date'), name='unique_snapshot_per_user_date')],
+            },
+        ),
+    ]
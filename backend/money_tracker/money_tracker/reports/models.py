@@ -0,0 +1,102 @@
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import models
+
+User = settings.AUTH_USER_MODEL
+
+
+class FinancialSummary(models.Model):
+    """
+    Running stored-LCY total and row count of one category (e.g. earned_income, loans) per user.
+    Maintained incrementally by SummaryTrackedMixin; see money_tracker.reports.tracking.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="financial_summaries", related_query_name="financial_summary")
+    category = models.CharField(max_length=32)
+    total = models.DecimalField(max_digits=20, decimal_places=2, default=Decimal("0.00"))
+    count = models.IntegerField(default=0)
+    modified_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"{self.category} of user {self.user_id}: {self.total} over {self.count} records"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "category"], name="unique_summary_per_user_category"),
+        ]
+        verbose_name = "Financial Summary"
+        verbose_name_plural = "Financial Summaries"
+
+
+class MonthlyRollup(models.Model):
+    """
+    Stored-LCY total and row count of one income or expense category per user and calendar
+    month of created_at. Maintained incrementally by SummaryTrackedMixin like FinancialSummary.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="monthly_rollups", related_query_name="monthly_rollup")
+    category = models.CharField(max_length=32)
+    month = models.DateField(help_text="First day of the month")
+    total = models.DecimalField(max_digits=20, decimal_places=2, default=Decimal("0.00"))
+    count = models.IntegerField(default=0)
+    modified_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"{self.category} of user {self.user_id} in {self.month:%Y-%m}: {self.total} over {self.count} records"
+
+    class Meta:
+        constraints = [
+            # (user, month) leads so that a range of months is one index range scan
+            models.UniqueConstraint(fields=["user", "month", "category"], name="unique_rollup_per_user_month_category"),
+        ]
+        ordering = ["month", "category"]
+        verbose_name = "Monthly Rollup"
+        verbose_name_plural = "Monthly Rollups"
+
+
+class NetWorthSnapshot(models.Model):
+    """
+    A user's stored-LCY assets and liabilities at the end of a day, written in bulk by the
+    snapshot_net_worth task; net worth is assets less liabilities.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="net_worth_snapshots", related_query_name="net_worth_snapshot")
+    date = models.DateField()
+    assets = models.DecimalField(max_digits=20, decimal_places=2, default=Decimal("0.00"))
+    liabilities = models.DecimalField(max_digits=20, decimal_places=2, default=Decimal("0.00"))
+
+    @property
+    def net_worth(self):
+        return self.assets - self.liabilities
+
+    def __str__(self) -> str:
+        return f"Net worth of user {self.user_id} on {self.date}: {self.net_worth}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "date"], name="unique_snapshot_per_user_date"),
+        ]
+        ordering = ["date"]
+        get_latest_by = "date"
+        verbose_name = "Net Worth Snapshot"
+        verbose_name_plural = "Net Worth Snapshots"
+
+
+class Tombstone(models.Model):
+    """
+    A hard-deleted record of a user (category and primary key), written by the post_delete signals
+    so that delta sync can report deletes; see money_tracker.reports.sync. Pruned after
+    SYNC_TOMBSTONE_RETENTION_DAYS.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="tombstones", related_query_name="tombstone")
+    category = models.CharField(max_length=32)
+    object_id = models.CharField(max_length=64)
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        return f"{self.category} {self.object_id} of user {self.user_id}, deleted at {self.deleted_at}"
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "deleted_at"], name="tombstone_user_deleted_idx"),
+        ]
+        verbose_name = "Tombstone"
+        verbose_name_plural = "Tombstones"
@@ -0,0 +1,52 @@
+from decimal import Decimal
+
+from django.apps import apps
+
+from .summary import MONTHLY_GROUPS
+from .summary import SUMMARY_GROUPS
+
+
+def add_months(month, count):
+    """The first day of the month `count` months after (or before) the month of `month`."""
+    index = month.year * 12 + month.month - 1 + count
+    return month.replace(year=index // 12, month=index % 12 + 1, day=1)
+
+
+def months_between(start, end):
+    """Number of months from the month of start to the month of end, inclusive."""
+    return (end.year - start.year) * 12 + end.month - start.month + 1
+
+
+def monthly_series(user_id, start, end, groups=MONTHLY_GROUPS):
+    """
+    Per-month totals of a user from start to end (first days of months, inclusive), read from
+    MonthlyRollup with one range scan of its (user, month, category) index. Months without
+    records are present with zero totals.
+    :return: list of {"month": "YYYY-MM", <group>: {<total key>, <category>..., "count"}} in month order,
+        with "net" (income less expenses) when both groups are requested.
+    """
+    MonthlyRollup = apps.get_model("reports", "MonthlyRollup")
+    category_groups = {category: group for group in groups for _, category, _ in SUMMARY_GROUPS[group][1]}
+    rows = MonthlyRollup.objects.filter(
+        user_id=user_id, month__gte=start, month__lte=end, category__in=category_groups
+    ).values_list("month", "category", "total", "count")
+
+    series = {}
+    for offset in range(months_between(start, end)):
+        month = add_months(start, offset)
+        series[month] = {"month": f"{month:%Y-%m}"}
+        for group in groups:
+            total_key, members = SUMMARY_GROUPS[group]
+            series[month][group] = {total_key: Decimal("0"), **{category: Decimal("0") for _, category, _ in members}, "count": 0}
+
+    for month, category, total, count in rows:
+        group = category_groups[category]
+        values = series[month][group]
+        values[category] += total
+        values[SUMMARY_GROUPS[group][0]] += total
+        values["count"] += count
+
+    if "income" in groups and "expenses" in groups:
+        for entry in series.values():
+            entry["net"] = entry["income"]["total_income"] - entry["expenses"]["total_expenses"]
+    return list(series.values())
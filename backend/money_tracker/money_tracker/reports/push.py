@@ -0,0 +1,142 @@
+import asyncio
+import json
+import logging
+import threading
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from functools import cache
+
+import redis
+import redis.asyncio
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from .versions import data_version
+
+logger = logging.getLogger(__name__)
+
+USER_CHANNEL = "push:user:{user_id}"
+# Rate changes and revaluations change the totals of every user
+BROADCAST_CHANNEL = "push:all"
+
+
+class InMemoryPushBackend:
+    """Fans messages out to the subscribers of this process; for tests and single-process development."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)  # channel -> {(event loop, queue)}
+
+    def publish(self, channel, message):
+        with self._lock:
+            subscribers = list(self._subscribers[channel])
+        for loop, queue in subscribers:
+            loop.call_soon_threadsafe(queue.put_nowait, message)
+
+    @asynccontextmanager
+    async def subscribe(self, channels):
+        subscriber = (asyncio.get_running_loop(), asyncio.Queue())
+        with self._lock:
+            for channel in channels:
+                self._subscribers[channel].add(subscriber)
+        try:
+            yield _QueueSubscription(subscriber[1])
+        finally:
+            with self._lock:
+                for channel in channels:
+                    self._subscribers[channel].discard(subscriber)
+
+
+class _QueueSubscription:
+    def __init__(self, queue):
+        self.queue = queue
+
+    async def get(self, timeout):
+        """The next message, or None if none arrives within `timeout` seconds."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+
+class RedisPushBackend:
+    """Fans messages out through Redis pub/sub, to the subscribers of every web process."""
+
+    def __init__(self, url=None):
+        self.url = url or settings.REDIS_URL
+        self._client = redis.Redis.from_url(self.url)
+
+    def publish(self, channel, message):
+        try:
+            self._client.publish(channel, message)
+        except redis.RedisError:
+            # The write has committed; open streams just miss this change until their next reconnect
+            logger.warning("Could not publish to %s.", channel, exc_info=True)
+
+    @asynccontextmanager
+    async def subscribe(self, channels):
+        client = redis.asyncio.Redis.from_url(self.url)
+        pubsub = client.pubsub()
+        try:
+            await pubsub.subscribe(*channels)
+            yield _PubSubSubscription(pubsub)
+        finally:
+            await pubsub.aclose()
+            await client.aclose()
+
+
+class _PubSubSubscription:
+    def __init__(self, pubsub):
+        self.pubsub = pubsub
+
+    async def get(self, timeout):
+        """The next message, or None if none arrives within `timeout` seconds."""
+        message = await self.pubsub.get_message(ignore_subscribe_messages=True, timeout=timeout)
+        return None if message is None else message["data"]
+
+
+@cache
+def get_push_backend():
+    return import_string(settings.PUSH_BACKEND)()
+
+
+def notify_data_change(user_id):
+    """Tell the open event streams of a user that their records or totals changed."""
+    get_push_backend().publish(USER_CHANNEL.format(user_id=user_id), "changed")
+
+
+def notify_all_data_changes():
+    """Tell every open event stream that totals may have changed (rates, revaluations)."""
+    get_push_backend().publish(BROADCAST_CHANNEL, "changed")
+
+
+def _event(name, data):
+    return f"event: {name}\ndata: {json.dumps(data)}\n\n"
+
+
+async def event_stream(user_id):
+    """
+    Server-sent events for one user: a "version" event with the user's data version
+    (money_tracker.reports.versions) on connect and whenever it changes, and a comment every
+    PUSH_HEARTBEAT_SECONDS to keep proxies from closing the connection. The stream ends after
+    PUSH_STREAM_TIMEOUT_SECONDS; browsers reconnect by themselves, which re-authenticates them.
+    Clients refetch what they show when the version differs from the one they last saw.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.PUSH_STREAM_TIMEOUT_SECONDS
+    channels = [USER_CHANNEL.format(user_id=user_id), BROADCAST_CHANNEL]
+    async with get_push_backend().subscribe(channels) as subscription:
+        # Subscribed before the version is read, so that no change falls in between
+        version = await sync_to_async(data_version)(user_id)
+        yield f"retry: {settings.PUSH_RECONNECT_MILLISECONDS}\n" + _event("version", {"version": version})
+        while (remaining := deadline - loop.time()) > 0:
+            message = await subscription.get(timeout=min(settings.PUSH_HEARTBEAT_SECONDS, remaining))
+            if message is None:
+                yield ": keep-alive\n\n"
+                continue
+            # Bursts of writes publish once per row; the version read collapses them into one event
+            latest = await sync_to_async(data_version)(user_id)
+            if latest != version:
+                version = latest
+                yield _event("version", {"version": version})
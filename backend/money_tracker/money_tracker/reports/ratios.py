@@ -0,0 +1,91 @@
+from decimal import ROUND_HALF_UP
+from decimal import Decimal
+
+from django.apps import apps
+from django.db import models
+from django.db.models.functions import Greatest
+
+from .summary import SUMMARY_GROUPS
+from .summary import get_cached_report
+
+RATIO = Decimal("0.0001")
+ZERO = Decimal("0")
+
+
+def _adjusted_value(queryset, category):
+    """
+    The second figure aggregated per table: the outstanding balance of loans (due_balance once set,
+    otherwise what is left of amount_repay) and the owned share (amount x ratio) of equities.
+    """
+    output_field = models.DecimalField(max_digits=20, decimal_places=2)
+    if category == "loans":
+        due = queryset.lcy_value("due_balance_lcy")
+        remaining = Greatest(
+            queryset.lcy_value("amount_repay_lcy") - queryset.lcy_value("amount_paid_lcy"), models.Value(ZERO),
+            output_field=output_field,
+        )
+        return models.Case(models.When(due_balance_lcy__gt=0, then=due), default=remaining, output_field=output_field)
+    if category == "equities":
+        return models.ExpressionWrapper(queryset.lcy_value("amount_lcy") * models.F("ratio"), output_field=output_field)
+    return models.Value(ZERO, output_field=output_field)
+
+
+def ratio_inputs(user_id):
+    """
+    {category: (LCY total, adjusted value)} of every summary category of a user, from a single
+    UNION ALL query with one aggregate per table, in the configured valuation mode.
+    """
+    queries = []
+    for _, members in SUMMARY_GROUPS.values():
+        for label, category, lcy_field in members:
+            queryset = apps.get_model(label).objects.filter(created_by_id=user_id).valued_for_sum()
+            queries.append(
+                queryset.order_by()
+                .annotate(category=models.Value(category, output_field=models.CharField()))
+                .values("category")
+                .annotate(total=queryset.lcy_sum(lcy_field), adjusted=models.Sum(_adjusted_value(queryset, category)))
+            )
+    rows = queries[0].union(*queries[1:], all=True)
+    return {row["category"]: (row["total"] or ZERO, row["adjusted"] or ZERO) for row in rows}
+
+
+def _ratio(numerator, denominator):
+    return (numerator / denominator).quantize(RATIO, rounding=ROUND_HALF_UP) if denominator else None
+
+
+def build_ratios(user_id):
+    """
+    Debt-to-asset, liquidity and savings ratios of a user with the LCY figures they derive from.
+    A ratio is None when its denominator is zero.
+    """
+    inputs = ratio_inputs(user_id)
+    group_totals = {
+        group: sum((inputs.get(category, (ZERO, ZERO))[0] for _, category, _ in members), ZERO)
+        for group, (_, members) in SUMMARY_GROUPS.items()
+    }
+    liquid_assets = inputs.get("liquid_assets", (ZERO, ZERO))[0]
+    loan_balance = inputs.get("loans", (ZERO, ZERO))[1]
+    equities, equity_holdings = inputs.get("equities", (ZERO, ZERO))
+    return {
+        "ratios": {
+            "debt_to_asset": _ratio(group_totals["liabilities"], group_totals["assets"]),
+            "liquidity": _ratio(liquid_assets, loan_balance),
+            "savings_rate": _ratio(group_totals["income"] - group_totals["expenses"], group_totals["income"]),
+            "equity_ownership": _ratio(equity_holdings, equities),
+        },
+        "figures": {
+            "total_assets": group_totals["assets"],
+            "total_liabilities": group_totals["liabilities"],
+            "total_income": group_totals["income"],
+            "total_expenses": group_totals["expenses"],
+            "liquid_assets": liquid_assets,
+            "outstanding_loans": loan_balance,
+            "equities": equities,
+            "equity_holdings": equity_holdings,
+        },
+    }
+
+
+def get_ratios(user_id):
+    """The financial ratios of a user, cached and invalidated with the dashboard summary."""
+    return get_cached_report("financial_ratios", user_id, build_ratios)
@@ -0,0 +1,93 @@
+from functools import partial
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from money_tracker.currencies.models import Currency
+from money_tracker.currencies.models import ExchangeRate
+from money_tracker.currencies.valuation import lcy_values_changed
+
+from .push import notify_all_data_changes
+from .push import notify_data_change
+from .summary import SUMMARY_GROUPS
+from .summary import invalidate_all_summaries
+from .summary import invalidate_summary
+from .sync import record_tombstone
+from .tracking import rebuild_monthly_rollups
+from .tracking import rebuild_summaries
+from .tracking import users_holding
+from .versions import bump_data_version
+
+
+def invalidate_owner_summary(sender, instance, **kwargs):
+    """Drop the owner's cached dashboard summary now and again once the transaction commits."""
+    invalidate_summary(instance.created_by_id)
+    transaction.on_commit(partial(invalidate_summary, instance.created_by_id))
+
+
+def write_tombstone(sender, instance, **kwargs):
+    """Remember the delete for delta sync, in the deleting transaction."""
+    record_tombstone(instance)
+
+
+def bump_owner_data_version(sender, instance, **kwargs):
+    """Change the owner's data version (and so their ETags) now and again once the transaction commits."""
+    bump_data_version(instance.created_by_id)
+    transaction.on_commit(partial(bump_data_version, instance.created_by_id))
+
+
+def push_owner_change(sender, instance, **kwargs):
+    """Notify the owner's open event streams once the transaction commits (after the version bump)."""
+    transaction.on_commit(partial(notify_data_change, instance.created_by_id))
+
+
+for _, members in SUMMARY_GROUPS.values():
+    for label, _, _ in members:
+        model = apps.get_model(label)
+        post_save.connect(invalidate_owner_summary, sender=model, dispatch_uid=f"summary_save_{label}")
+        post_delete.connect(invalidate_owner_summary, sender=model, dispatch_uid=f"summary_delete_{label}")
+        post_save.connect(bump_owner_data_version, sender=model, dispatch_uid=f"version_save_{label}")
+        post_delete.connect(bump_owner_data_version, sender=model, dispatch_uid=f"version_delete_{label}")
+        post_delete.connect(write_tombstone, sender=model, dispatch_uid=f"tombstone_{label}")
+        post_save.connect(push_owner_change, sender=model, dispatch_uid=f"push_save_{label}")
+        post_delete.connect(push_owner_change, sender=model, dispatch_uid=f"push_delete_{label}")
+
+post_save.connect(invalidate_owner_summary, sender=Currency, dispatch_uid="summary_save_currency")
+post_delete.connect(invalidate_owner_summary, sender=Currency, dispatch_uid="summary_delete_currency")
+post_save.connect(bump_owner_data_version, sender=Currency, dispatch_uid="version_save_currency")
+post_delete.connect(bump_owner_data_version, sender=Currency, dispatch_uid="version_delete_currency")
+post_delete.connect(write_tombstone, sender=Currency, dispatch_uid="tombstone_currency")
+post_save.connect(push_owner_change, sender=Currency, dispatch_uid="push_save_currency")
+post_delete.connect(push_owner_change, sender=Currency, dispatch_uid="push_delete_currency")
+
+
+@receiver(post_save, sender=Currency)
+@receiver(post_delete, sender=Currency)
+def invalidate_summaries_on_local_currency_change(sender, instance, **kwargs):
+    """Every user's LCY displays and summaries name the local currency."""
+    if instance.is_local:
+        invalidate_all_summaries()
+        transaction.on_commit(invalidate_all_summaries)
+        transaction.on_commit(notify_all_data_changes)
+
+
+@receiver(post_save, sender=ExchangeRate)
+@receiver(post_delete, sender=ExchangeRate)
+@receiver(lcy_values_changed)
+def invalidate_summaries_on_rate_change(sender, **kwargs):
+    """Rate changes revalue rows of every user holding the currency."""
+    invalidate_all_summaries()
+    transaction.on_commit(invalidate_all_summaries)
+    transaction.on_commit(notify_all_data_changes)
+
+
+@receiver(lcy_values_changed)
+def rebuild_summaries_on_revaluation(sender, currencies=(), **kwargs):
+    """Bulk revaluation updates the stored LCY columns without save(); recompute the holders' summary and rollup rows."""
+    user_ids = users_holding(currencies) if currencies else []
+    if user_ids:
+        rebuild_summaries(user_ids)
+        rebuild_monthly_rollups(user_ids)
@@ -0,0 +1,69 @@
+import logging
+from datetime import date
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.db import connection
+
+from .summary import SUMMARY_GROUPS
+
+logger = logging.getLogger(__name__)
+
+
+def _balances_sql():
+    """
+    Per-user (assets, liabilities) over a user-id range: one grouped pass per table,
+    the same tables and stored LCY columns as the dashboard totals.
+    :return: SQL with four placeholders per table: the first and last user id of the range.
+    """
+    parts = []
+    for group in ("assets", "liabilities"):
+        for label, _, lcy_field in SUMMARY_GROUPS[group][1]:
+            model = apps.get_model(label)
+            table = connection.ops.quote_name(model._meta.db_table)
+            lcy = connection.ops.quote_name(model._meta.get_field(lcy_field).column)
+            value = f"SUM({lcy}), 0" if group == "assets" else f"0, SUM({lcy})"
+            parts.append(
+                f"SELECT created_by_id AS user_id, {value} FROM {table} "
+                f"WHERE created_by_id BETWEEN %s AND %s GROUP BY created_by_id"
+            )
+    return " UNION ALL ".join(parts), len(parts)
+
+
+def write_snapshots(first_user_id, last_user_id, day):
+    """
+    Write the `day` snapshot of every user with id in [first_user_id, last_user_id] that holds
+    an asset or a loan, with a single INSERT ... SELECT. Re-running a day overwrites its rows.
+    :param day: a date or an ISO date string.
+    :return: number of snapshot rows written.
+    """
+    day = day if isinstance(day, date) else date.fromisoformat(day)
+    NetWorthSnapshot = apps.get_model("reports", "NetWorthSnapshot")
+    table = connection.ops.quote_name(NetWorthSnapshot._meta.db_table)
+    balances, tables = _balances_sql()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} (user_id, date, assets, liabilities) "
+            f"SELECT user_id, %s, COALESCE(SUM(assets), 0), COALESCE(SUM(liabilities), 0) "
+            f"FROM ({balances}) AS balances (user_id, assets, liabilities) GROUP BY user_id "
+            f"ON CONFLICT (user_id, date) DO UPDATE SET assets = EXCLUDED.assets, liabilities = EXCLUDED.liabilities",
+            [day, *[first_user_id, last_user_id] * tables],
+        )
+        written = cursor.rowcount
+    logger.info(f"Wrote {written} net worth snapshots for {day} (users {first_user_id}-{last_user_id})")
+    return written
+
+
+def user_id_ranges(chunk_size):
+    """Split the user ids into consecutive (first, last) ranges of at most chunk_size users."""
+    ranges = []
+    ids = get_user_model().objects.order_by("pk").values_list("pk", flat=True)
+    chunk = []
+    for user_id in ids.iterator(chunk_size=chunk_size):
+        chunk.append(user_id)
+        if len(chunk) == chunk_size:
+            ranges.append((chunk[0], chunk[-1]))
+            chunk = []
+    if chunk:
+        ranges.append((chunk[0], chunk[-1]))
+    return ranges
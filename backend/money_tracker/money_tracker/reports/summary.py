@@ -0,0 +1,124 @@
+import logging
+import time
+from decimal import Decimal
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+
+from money_tracker.currencies.registry import local_currency_registry
+from money_tracker.currencies.valuation import VALUATION_STORED
+from money_tracker.currencies.valuation import valuation_mode
+
+logger = logging.getLogger(__name__)
+
+REPORT_CACHE_KEY = "{report}:user:{user_id}"
+# Per-user reports cached by get_cached_report() and dropped together by invalidate_summary()
+CACHED_REPORTS = ("dashboard_summary", "currency_exposure", "financial_ratios")
+# Bumped whenever stored LCY values may change for every user at once (rate changes, revaluations)
+SUMMARY_GENERATION_KEY = "dashboard_summary:generation"
+
+# Dashboard groups: group -> (total key, [(model label, category key, lcy field)]).
+# Keys match the responses of the per-app Total*APIView endpoints.
+SUMMARY_GROUPS = {
+    "income": ("total_income", [
+        ("income.EarnedIncome", "earned_income", "amount_lcy"),
+        ("income.PortfolioIncome", "portfolio_income", "amount_lcy"),
+        ("income.PassiveIncome", "passive_income", "amount_lcy"),
+    ]),
+    "assets": ("total_assets", [
+        ("assets.LiquidAsset", "liquid_assets", "amount_lcy"),
+        ("assets.Equity", "equities", "amount_lcy"),
+        ("assets.InvestmentAccount", "investment_accounts", "amount_lcy"),
+        ("assets.RetirementAccount", "retirement_accounts", "amount_lcy"),
+    ]),
+    "expenses": ("total_expenses", [
+        ("expenses.FixedExpense", "fixed_expenses", "amount_lcy"),
+        ("expenses.VariableExpense", "variable_expenses", "amount_lcy"),
+        ("expenses.DiscretionaryExpense", "discretionary_expenses", "amount_lcy"),
+    ]),
+    "liabilities": ("total_liabilities", [
+        ("liabilities.Loan", "loans", "amount_taken_lcy"),
+    ]),
+}
+# Groups of flows (rather than balances) that also keep monthly rollups
+MONTHLY_GROUPS = ("income", "expenses")
+
+
+def category_totals(user_id, groups=None):
+    """
+    Category totals of a user (all groups by default) in a single query.
+    Stored valuation reads the maintained FinancialSummary rows; live valuation runs a
+    UNION ALL of per-table aggregates at current rates.
+    :return: dict of category key -> Decimal, with every requested category present.
+    """
+    members = [member for group in (groups or SUMMARY_GROUPS) for member in SUMMARY_GROUPS[group][1]]
+    totals = {category: Decimal("0") for _, category, _ in members}
+    if valuation_mode() == VALUATION_STORED:
+        FinancialSummary = apps.get_model("reports", "FinancialSummary")
+        rows = FinancialSummary.objects.filter(user_id=user_id, category__in=totals).values_list("category", "total")
+        totals.update(rows)
+        return totals
+
+    queries = [
+        apps.get_model(label).objects.filter(created_by_id=user_id).category_total(category, lcy_field)
+        for label, category, lcy_field in members
+    ]
+    rows = queries[0].union(*queries[1:], all=True)
+    totals.update((row["category"], row["total"] or Decimal("0")) for row in rows)
+    return totals
+
+
+def group_totals(user_id, group):
+    """The totals of one SUMMARY_GROUPS group, shaped like its Total*APIView response."""
+    total_key, members = SUMMARY_GROUPS[group]
+    totals = category_totals(user_id, [group])
+    return {total_key: sum(totals.values(), Decimal("0")), **totals}
+
+
+def build_summary(user_id):
+    totals = category_totals(user_id)
+    summary = {}
+    for group, (total_key, members) in SUMMARY_GROUPS.items():
+        values = {category: totals[category] for _, category, _ in members}
+        summary[group] = {total_key: sum(values.values(), Decimal("0")), **values}
+    local_currency = local_currency_registry.get(user_id)
+    summary["local_currency"] = local_currency._asdict() if local_currency else None
+    return summary
+
+
+def get_cached_report(report, user_id, build):
+    """
+    build(user_id), cached per user until one of the user's records changes.
+    Entries remember the generation they were built in, so a rate change invalidates
+    every user's reports without enumerating keys.
+    :param report: one of CACHED_REPORTS.
+    """
+    key = REPORT_CACHE_KEY.format(report=report, user_id=user_id)
+    cached = cache.get_many([key, SUMMARY_GENERATION_KEY])
+    generation = cached.get(SUMMARY_GENERATION_KEY, 0)
+    entry = cached.get(key)
+    if entry is not None and entry[0] == generation:
+        return entry[1]
+
+    value = build(user_id)
+    cache.set(key, (generation, value), timeout=getattr(settings, "DASHBOARD_SUMMARY_CACHE_TIMEOUT", 300))
+    return value
+
+
+def get_summary(user_id):
+    """The dashboard summary of a user, cached like every report in CACHED_REPORTS."""
+    return get_cached_report("dashboard_summary", user_id, build_summary)
+
+
+def invalidate_summary(user_id):
+    """Drop every cached report of a user."""
+    cache.delete_many([REPORT_CACHE_KEY.format(report=report, user_id=user_id) for report in CACHED_REPORTS])
+
+
+def invalidate_all_summaries():
+    try:
+        cache.incr(SUMMARY_GENERATION_KEY)
+    except ValueError:
+        # Start at the current time in ms so that a lost key never repeats a generation (see versions.data_version)
+        cache.add(SUMMARY_GENERATION_KEY, int(time.time() * 1000), timeout=None)
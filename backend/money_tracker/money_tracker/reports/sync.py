@@ -0,0 +1,108 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from money_tracker.currencies.models import ExchangeRate
+from money_tracker.currencies.valuation import VALUATION_LIVE
+from money_tracker.currencies.valuation import valuation_mode
+
+from .models import Tombstone
+from .summary import SUMMARY_GROUPS
+
+# Synced categories: the SUMMARY_GROUPS categories plus currencies -> serializer of their rows
+SYNC_SERIALIZERS = {
+    "currencies": "money_tracker.currencies.api.serializers.CurrencySerializer",
+    "earned_income": "money_tracker.income.api.serializers.EarnedIncomeSerializer",
+    "portfolio_income": "money_tracker.income.api.serializers.PortfolioIncomeSerializer",
+    "passive_income": "money_tracker.income.api.serializers.PassiveIncomeSerializer",
+    "liquid_assets": "money_tracker.assets.api.serializers.LiquidAssetSerializer",
+    "equities": "money_tracker.assets.api.serializers.EquitySerializer",
+    "investment_accounts": "money_tracker.assets.api.serializers.InvestmentAccountSerializer",
+    "retirement_accounts": "money_tracker.assets.api.serializers.RetirementAccountSerializer",
+    "fixed_expenses": "money_tracker.expenses.api.serializers.FixedExpenseSerializer",
+    "variable_expenses": "money_tracker.expenses.api.serializers.VariableExpenseSerializer",
+    "discretionary_expenses": "money_tracker.expenses.api.serializers.DiscretionaryExpenseSerializer",
+    "loans": "money_tracker.liabilities.api.serializers.LoanSerializer",
+}
+# Model label -> category, for the tombstones written on delete
+SYNC_CATEGORIES = {
+    "currencies.Currency": "currencies",
+    **{label: category for _, members in SUMMARY_GROUPS.values() for label, category, _ in members},
+}
+
+
+class SyncExpired(Exception):
+    """The watermark is older than the retained tombstones; the client has to sync from scratch."""
+
+
+def record_tombstone(instance):
+    Tombstone.objects.create(
+        user_id=instance.created_by_id, category=SYNC_CATEGORIES[instance._meta.label], object_id=str(instance.pk)
+    )
+
+
+def tombstone_horizon():
+    """Tombstones older than this are pruned, so watermarks older than this cannot be served."""
+    return timezone.now() - timedelta(days=getattr(settings, "SYNC_TOMBSTONE_RETENTION_DAYS", 30))
+
+
+def prune_tombstones():
+    deleted, _ = Tombstone.objects.filter(deleted_at__lt=tombstone_horizon()).delete()
+    return deleted
+
+
+def _changed_rows(category, serializer_class, user_id, since, context, rated_currencies):
+    model = serializer_class.Meta.model
+    queryset = model.objects.filter(created_by_id=user_id)
+    if category != "currencies":
+        queryset = queryset.valued()
+    if since is not None:
+        changed = Q(modified_at__gt=since)
+        if rated_currencies:
+            # Live valuation revalues rows on a rate change without touching them
+            changed |= Q(currency__in=rated_currencies)
+        queryset = queryset.filter(changed)
+    queryset = queryset.order_by("modified_at", "pk")
+
+    serializer = serializer_class(context=context)
+    reader = serializer.compile_reader(queryset) if hasattr(serializer, "compile_reader") else None
+    if reader is not None:
+        return reader.render(reader.values(queryset))
+    queryset = queryset.select_related(*(name for name in ("currency", "created_by", "modified_by") if hasattr(model, name)))
+    return serializer_class(queryset, many=True, context=context).data
+
+
+def build_sync(user_id, since=None, context=None):
+    """
+    The records of a user changed (created or modified) and deleted after `since`, per category;
+    everything when `since` is None. Apply `deleted` before `changed`: a primary key may be
+    deleted and then reused, as currency codes are.
+    The returned watermark lags the clock by SYNC_WATERMARK_OVERLAP_SECONDS so that rows saved by
+    transactions still open now are picked up by the next sync; rows may therefore come twice.
+    :raises SyncExpired: if `since` is older than the retained tombstones.
+    """
+    now = timezone.now()
+    if since is not None and since < tombstone_horizon():
+        raise SyncExpired
+    watermark = now - timedelta(seconds=getattr(settings, "SYNC_WATERMARK_OVERLAP_SECONDS", 30))
+
+    rated_currencies = []
+    if since is not None and valuation_mode() == VALUATION_LIVE:
+        rated_currencies = list(
+            ExchangeRate.objects.filter(currency__created_by_id=user_id, modified_at__gt=since)
+            .values_list("currency_id", flat=True).distinct()
+        )
+    changed = {
+        category: _changed_rows(category, import_string(path), user_id, since, context or {}, rated_currencies)
+        for category, path in SYNC_SERIALIZERS.items()
+    }
+    deleted = {category: [] for category in SYNC_SERIALIZERS}
+    if since is not None:
+        tombstones = Tombstone.objects.filter(user_id=user_id, deleted_at__gt=since).order_by("deleted_at")
+        primary_keys = {category: import_string(path).Meta.model._meta.pk for category, path in SYNC_SERIALIZERS.items()}
+        for category, object_id in tombstones.values_list("category", "object_id"):
+            deleted[category].append(primary_keys[category].to_python(object_id))
+    return {"watermark": watermark, "full": since is None, "deleted": deleted, "changed": changed}
@@ -0,0 +1,33 @@
+from celery import group
+from celery import shared_task
+from django.conf import settings
+from django.utils import timezone
+from .snapshots import user_id_ranges, write_snapshots
+from .sync import prune_tombstones
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def snapshot_net_worth(day=None):
+    """Fan the daily net worth snapshot out over workers in chunks of user ids."""
+    day = day or timezone.localdate().isoformat()
+    ranges = user_id_ranges(getattr(settings, "NET_WORTH_SNAPSHOT_CHUNK_SIZE", 1000))
+    if ranges:
+        group(snapshot_net_worth_chunk.s(first, last, day) for first, last in ranges).apply_async()
+    return f"Net worth snapshot for {day} dispatched in {len(ranges)} chunks."
+
+
+@shared_task
+def snapshot_net_worth_chunk(first_user_id, last_user_id, day):
+    """Write the snapshots of one range of user ids."""
+    written = write_snapshots(first_user_id, last_user_id, day)
+    return f"Net worth snapshot for {day} completed. Wrote {written} snapshots."
+
+
+@shared_task
+def prune_sync_tombstones():
+    """Drop the tombstones older than SYNC_TOMBSTONE_RETENTION_DAYS."""
+    deleted = prune_tombstones()
+    return f"Pruned {deleted} tombstones."
@@ -0,0 +1,18 @@
+import pytest
+from rest_framework.test import APIClient
+
+from money_tracker.currencies.models import Currency
+
+
+@pytest.fixture
+def client(user):
+    """APIClient authenticated as the test user."""
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def kes(user):
+    """The local currency, owned by the test user."""
+    return Currency.objects.create(code="KES", description="Kenyan Shilling", is_local=True, created_by=user)
@@ -0,0 +1,92 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from money_tracker.currencies.models import Currency
+from money_tracker.currencies.models import ExchangeRate
+from money_tracker.expenses.models import FixedExpense
+from money_tracker.liabilities.models import InterestType
+from money_tracker.liabilities.models import Loan
+from money_tracker.liabilities.tasks import check_loan_default
+from money_tracker.users.tests.factories import UserFactory
+
+URL = reverse("api:expenses:fixedexpense-list")
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.parametrize("url", [
+    URL,
+    reverse("api:expenses:totalexpenses"),
+    reverse("api:reports:dashboard-summary"),
+    reverse("api:currencies:currency-list"),
+])
+def test_matching_etag_is_answered_before_any_query(client, kes, url, django_assert_max_num_queries):
+    first = client.get(url)
+    assert first.status_code == status.HTTP_200_OK
+    assert first["ETag"].startswith('W/"')
+    assert "no-cache" in first["Cache-Control"]
+
+    with django_assert_max_num_queries(2) as queries:  # the ATOMIC_REQUESTS savepoint and its release
+        second = client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+    assert second.status_code == status.HTTP_304_NOT_MODIFIED
+    assert second["ETag"] == first["ETag"]
+    assert not second.content
+    assert not any(query["sql"].startswith("SELECT") for query in queries.captured_queries)
+
+
+def test_writes_change_the_etag(client, user, kes):
+    etag = client.get(URL)["ETag"]
+
+    expense = FixedExpense.objects.create(expense_name="rent", currency=kes, amount=1200, created_by=user)
+    after_create = client.get(URL, HTTP_IF_NONE_MATCH=etag)
+    expense.delete()
+    after_delete = client.get(URL, HTTP_IF_NONE_MATCH=after_create["ETag"])
+
+    assert after_create.status_code == after_delete.status_code == status.HTTP_200_OK
+    assert len({etag, after_create["ETag"], after_delete["ETag"]}) == 3
+
+
+def test_other_users_writes_keep_the_etag(client, kes):
+    etag = client.get(URL)["ETag"]
+
+    other = UserFactory()
+    FixedExpense.objects.create(expense_name="rent", currency=kes, amount=1200, created_by=other)
+
+    assert client.get(URL, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_304_NOT_MODIFIED
+
+
+def test_rate_changes_change_every_etag(client, user, kes):
+    usd = Currency.objects.create(code="USD", description="US Dollar", created_by=UserFactory())
+    etag = client.get(URL)["ETag"]
+
+    ExchangeRate.objects.create(currency=usd, rate=Decimal("130.00"), is_current=True, created_by=usd.created_by)
+
+    assert client.get(URL, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_200_OK
+
+
+def test_loan_defaults_change_the_etag(client, user, kes):
+    interest_type = InterestType.objects.create(code="SIMPLE", description="Simple", created_by=user)
+    Loan.objects.create(
+        source="bank", loan_date=date(2020, 1, 1), currency=kes, amount_taken=Decimal("1000.00"), reason="car",
+        interest_type=interest_type, repayment_date=date(2021, 1, 1), due_balance=Decimal("500.00"), created_by=user,
+    )
+    url = reverse("api:liabilities:loan-list")
+    etag = client.get(url)["ETag"]
+
+    assert check_loan_default() == "Loan default check completed. Updated 1 loans."
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["results"][0]["in_default"] is True
+
+
+def test_writes_carry_no_etag(client, kes):
+    response = client.post(URL, {"expense_name": "rent", "currency": "KES", "amount": "10.00"}, format="json")
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert "ETag" not in response
@@ -0,0 +1,60 @@
+import pytest
+from decimal import Decimal
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from money_tracker.assets.models import LiquidAsset
+from money_tracker.currencies.models import Currency, ExchangeRate
+from money_tracker.expenses.models import FixedExpense
+from money_tracker.income.models import EarnedIncome, PassiveIncome
+from ..exposure import build_exposure
+
+URL = reverse("api:reports:currency-exposure")
+
+
+@pytest.fixture
+def records(user):
+    kes = Currency.objects.create(code="KES", description="Kenyan Shilling", is_local=True, created_by=user)
+    usd = Currency.objects.create(code="USD", description="US Dollar", created_by=user)
+    ExchangeRate.objects.create(currency=usd, rate=Decimal("130.00"), is_current=True, created_by=user)
+    EarnedIncome.objects.create(income_name="salary", currency=kes, amount=Decimal("1000.00"), created_by=user)
+    PassiveIncome.objects.create(income_name="rent", currency=usd, amount=Decimal("10.00"), created_by=user)
+    EarnedIncome.objects.create(income_name="consulting", currency=usd, amount=Decimal("20.00"), created_by=user)
+    FixedExpense.objects.create(expense_name="school", currency=kes, amount=Decimal("250.00"), created_by=user)
+    LiquidAsset.objects.create(source="Bank", name="savings", currency=usd, amount=Decimal("100.00"), created_by=user)
+    return kes, usd
+
+
+@pytest.mark.django_db
+def test_exposure_is_one_query(user, records, django_assert_num_queries):
+    build_exposure(user.pk)  # warms the local currency registry
+
+    with django_assert_num_queries(1):
+        exposure = build_exposure(user.pk)
+
+    assert exposure["local_currency"] == "KES"
+    assert exposure["totals"]["income"] == Decimal("4900.00")
+    kes, usd = exposure["currencies"]
+    assert kes["currency"] == "KES" and usd["currency"] == "USD"
+    assert usd["income"] == {"native": Decimal("30.00"), "lcy": Decimal("3900.00"), "count": 2, "share": Decimal("0.7959")}
+    assert usd["assets"]["share"] == Decimal("1.0000")
+    assert kes["expenses"] == {"native": Decimal("250.00"), "lcy": Decimal("250.00"), "count": 1, "share": Decimal("1.0000")}
+    assert usd["liabilities"] == {"native": Decimal("0"), "lcy": Decimal("0"), "count": 0, "share": Decimal("0")}
+
+
+@pytest.mark.django_db
+def test_exposure_endpoint_is_cached_until_a_write(client, user, records, django_assert_max_num_queries):
+    kes, _ = records
+    client.get(URL)
+
+    with django_assert_max_num_queries(2):  # savepoint + release only
+        response = client.get(URL)
+    assert response.status_code == status.HTTP_200_OK
+
+    EarnedIncome.objects.create(income_name="bonus", currency=kes, amount=Decimal("100.00"), created_by=user)
+    assert client.get(URL).data["currencies"][0]["income"]["lcy"] == Decimal("1100.00")
+
+
+@pytest.mark.django_db
+def test_exposure_requires_authentication():
+    assert APIClient().get(URL).status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,73 @@
+import time
+import numpy as np
+import pytest
+from datetime import date, timedelta
+from decimal import Decimal
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from money_tracker.currencies.models import Currency
+from money_tracker.expenses.models import FixedExpense, VariableExpense
+from money_tracker.income.models import EarnedIncome
+from money_tracker.liabilities.models import InterestType, Loan
+from ..forecast import build_forecast, project
+
+URL = reverse("api:reports:cash-flow-forecast")
+
+
+def test_project_spreads_loans_over_their_remaining_term():
+    series = project(4, 100000, 30000, outstanding=[10000, 5000], installments=[3, 0])
+
+    assert series["income"].tolist() == [100000] * 4
+    assert series["loan_repayments"].tolist() == [8333, 3333, 3334, 0]  # the overdue loan falls in month 1
+    assert series["net"].tolist() == [61667, 66667, 66666, 70000]
+    assert series["cumulative_net"].tolist() == [61667, 128334, 195000, 265000]
+
+
+def test_project_ten_years_of_hundreds_of_loans_is_fast():
+    rng = np.random.default_rng(0)
+    outstanding, installments = rng.integers(10_000, 100_000_000, 500), rng.integers(0, 200, 500)
+
+    started = time.perf_counter()
+    series = project(120, 25_000_000, 9_000_000, outstanding, installments)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.1
+    assert series["loan_repayments"].sum() == outstanding[installments <= 120].sum() + (
+        outstanding[installments > 120] // installments[installments > 120] * 120).sum()
+
+
+@pytest.mark.django_db
+def test_build_forecast(user):
+    kes = Currency.objects.create(code="KES", description="Kenyan Shilling", is_local=True, created_by=user)
+    EarnedIncome.objects.create(income_name="salary", currency=kes, amount=Decimal("1000.00"), created_by=user)
+    FixedExpense.objects.create(expense_name="rent", currency=kes, amount=Decimal("400.00"), created_by=user)
+    VariableExpense.objects.create(expense_name="food", currency=kes, amount=Decimal("999.00"), created_by=user)  # not recurring
+    interest_type = InterestType.objects.create(code="SIMPLE", description="Simple Interest", created_by=user)
+    loan = Loan.objects.create(
+        source="Bank", loan_date=date(2024, 12, 10), currency=kes, amount_taken=Decimal("300.00"), reason="Phone",
+        interest_type=interest_type, repayment_date=date(2025, 3, 10), created_by=user,
+    )
+
+    forecast = build_forecast(user.pk, 3, start=date(2025, 1, 1))
+
+    assert forecast["start"] == "2025-01"
+    assert [period["month"] for period in forecast["periods"]] == ["2025-01", "2025-02", "2025-03"]
+    installment = (loan.amount_repay_lcy / 3).quantize(Decimal("0.01"))
+    assert forecast["periods"][0]["loan_repayments"] == installment
+    assert forecast["totals"]["loan_repayments"] == loan.amount_repay_lcy
+    assert forecast["totals"]["income"] == Decimal("3000.00")
+    assert forecast["totals"]["net"] == Decimal("1800.00") - loan.amount_repay_lcy
+
+
+@pytest.mark.django_db
+def test_forecast_endpoint(client, settings):
+    response = client.get(URL, {"months": 24})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data["periods"]) == 24
+    assert response.data["start"] == f"{timezone.localdate().replace(day=1) + timedelta(days=31):%Y-%m}"
+
+    settings.CASH_FLOW_FORECAST_MAX_MONTHS = 12
+    assert client.get(URL, {"months": 24}).status_code == status.HTTP_400_BAD_REQUEST
+    assert client.get(URL, {"months": 0}).status_code == status.HTTP_400_BAD_REQUEST
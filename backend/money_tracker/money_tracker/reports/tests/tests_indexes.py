@@ -0,0 +1,82 @@
+import pytest
+from django.apps import apps
+from django.db import connection, transaction
+from django.db.models import Q, Sum
+from django.utils import timezone
+from money_tracker.currencies.models import Currency, ExchangeRate
+from ..summary import SUMMARY_GROUPS
+from ..transactions import TRANSACTION_TYPES, TransactionFeed
+
+OWNED = [(label, lcy_field) for _, members in SUMMARY_GROUPS.values() for label, _, lcy_field in members]
+
+
+def plan(queryset, hidden=()):
+    """
+    EXPLAIN of a queryset with sequential scans and sorts penalised, so that plans on tiny test
+    tables (whatever their statistics) use an index whenever one can produce the rows in order.
+    The `hidden` indexes are dropped for the EXPLAIN and restored by the rollback.
+    """
+    with transaction.atomic(), connection.cursor() as cursor:
+        for setting in ("enable_seqscan", "enable_bitmapscan", "enable_sort"):
+            cursor.execute(f"SET LOCAL {setting} = off")
+        for index in hidden:
+            cursor.execute(f"DROP INDEX {connection.ops.quote_name(index)}")
+        explained = queryset.explain()
+        transaction.set_rollback(True)
+    return explained
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("label, lcy_field", OWNED)
+def test_owner_list_pages_are_read_in_order_from_the_owner_index(user, label, lcy_field):
+    model = apps.get_model(label)
+    newest_first = model.objects.filter(created_by=user).order_by("-created_at", "-pk")
+    after = Q(created_at__lt=timezone.now()) | Q(created_at=timezone.now(), pk__lt=100)
+
+    for page in (newest_first[:51], newest_first.filter(after)[:51]):
+        explained = plan(page)
+        assert f"Index Scan using {model._meta.model_name}_owner_idx" in explained
+        assert "Sort" not in explained
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("label, lcy_field", OWNED)
+def test_owner_total_is_an_index_only_scan(user, label, lcy_field):
+    model = apps.get_model(label)
+    totals = model.objects.filter(created_by=user).order_by().values("created_by").annotate(total=Sum(lcy_field))
+    # Unvacuumed test tables make index-only scans cost as much as a scan of the narrower sync index
+    explained = plan(totals, hidden=[f"{model._meta.model_name}_sync_idx"])
+
+    assert f"Index Only Scan using {model._meta.model_name}_owner_idx" in explained
+
+
+@pytest.mark.django_db
+def test_currency_and_rate_lists_use_the_owner_indexes(user):
+    assert "Index Only Scan using currency_owner_idx" in plan(
+        Currency.objects.filter(created_by=user).values_list("is_local", "code")
+    )
+    explained = plan(
+        ExchangeRate.objects.filter(created_by=user).order_by("-created_at", "-pk").values_list("currency", "rate")[:51]
+    )
+    assert "Index Only Scan using exchangerate_owner_idx" in explained
+    assert "Sort" not in explained
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("label, lcy_field", OWNED)
+def test_changes_since_a_watermark_use_the_sync_index(user, label, lcy_field):
+    model = apps.get_model(label)
+    explained = plan(model.objects.filter(created_by=user, modified_at__gt=timezone.now()).order_by("modified_at", "pk"))
+
+    assert f"{model._meta.model_name}_sync_idx" in explained
+
+
+
+@pytest.mark.django_db
+def test_transaction_feed_pages_read_every_table_in_order_from_its_owner_index(user):
+    feed = TransactionFeed(user.pk)
+
+    for cursor in (None, (timezone.now(), "fixed_expenses", 100)):
+        explained = plan(feed.queryset(51, cursor))
+        for label, _ in TRANSACTION_TYPES.values():
+            assert f"Index Scan using {apps.get_model(label)._meta.model_name}_owner_idx" in explained
@@ -0,0 +1,97 @@
+import pytest
+from datetime import date, datetime
+from decimal import Decimal
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from money_tracker.expenses.models import VariableExpense
+from money_tracker.income.models import EarnedIncome
+from ..models import MonthlyRollup
+from ..monthly import add_months, monthly_series
+from ..tracking import check_monthly_rollups, month_of, rebuild_monthly_rollups
+
+URL = reverse("api:reports:monthly-report")
+
+
+def backdate(record, year, month, day=15):
+    """Move a record into another month; created_at is auto_now_add so this bypasses save()."""
+    moment = timezone.make_aware(datetime(year, month, day, 0, 30))
+    type(record).objects.filter(pk=record.pk).update(created_at=moment)
+
+
+def test_add_months():
+    assert add_months(date(2025, 11, 1), 3) == date(2026, 2, 1)
+    assert add_months(date(2025, 1, 31), -1) == date(2024, 12, 1)
+
+
+@pytest.mark.django_db
+def test_writes_maintain_the_rollup_of_the_current_month(user, kes):
+    salary = EarnedIncome.objects.create(income_name="salary", currency=kes, amount=Decimal("1000.00"), created_by=user)
+    VariableExpense.objects.create(expense_name="food", currency=kes, amount=Decimal("300.00"), created_by=user)
+    month = month_of(salary.created_at)
+
+    rows = MonthlyRollup.objects.filter(user=user, month=month).values_list("category", "total", "count")
+    assert sorted(rows) == [("earned_income", Decimal("1000.00"), 1), ("variable_expenses", Decimal("300.00"), 1)]
+
+    salary.delete()
+    assert MonthlyRollup.objects.get(user=user, category="earned_income").count == 0
+
+
+@pytest.mark.django_db
+def test_rebuild_backfills_by_month(user, kes, django_assert_num_queries):
+    january = EarnedIncome.objects.create(income_name="salary", currency=kes, amount=Decimal("1000.00"), created_by=user)
+    march = EarnedIncome.objects.create(income_name="salary", currency=kes, amount=Decimal("1100.00"), created_by=user)
+    rent = VariableExpense.objects.create(expense_name="rent", currency=kes, amount=Decimal("400.00"), created_by=user)
+    backdate(january, 2025, 1, 1)  # 00:30 on the 1st in Nairobi is still December in UTC
+    backdate(march, 2025, 3)
+    backdate(rent, 2025, 3)
+    assert check_monthly_rollups() != []
+
+    rebuild_monthly_rollups()
+    assert check_monthly_rollups() == []
+
+    with django_assert_num_queries(1):
+        series = monthly_series(user.pk, date(2025, 1, 1), date(2025, 3, 1))
+
+    assert [entry["month"] for entry in series] == ["2025-01", "2025-02", "2025-03"]
+    assert series[0]["income"]["earned_income"] == Decimal("1000.00")
+    assert series[1]["income"] == {
+        "total_income": Decimal("0"), "earned_income": Decimal("0"), "portfolio_income": Decimal("0"),
+        "passive_income": Decimal("0"), "count": 0,
+    }
+    assert series[2]["expenses"]["total_expenses"] == Decimal("400.00")
+    assert series[2]["net"] == Decimal("700.00")
+
+
+@pytest.mark.django_db
+def test_monthly_endpoint(client, user, kes):
+    EarnedIncome.objects.create(income_name="salary", currency=kes, amount=Decimal("1000.00"), created_by=user)
+
+    response = client.get(URL, {"group": "income"})
+
+    assert response.status_code == status.HTTP_200_OK
+    this_month = timezone.localdate().replace(day=1)
+    assert response.data["end"] == f"{this_month:%Y-%m}"
+    assert len(response.data["months"]) == 12
+    assert response.data["months"][-1]["income"]["total_income"] == Decimal("1000.00")
+    assert "expenses" not in response.data["months"][-1] and "net" not in response.data["months"][-1]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("params, field", [
+    ({"start": "2025-05", "end": "2025-04"}, "start"),
+    ({"start": "2025-13"}, "start"),
+    ({"start": "2000-01", "end": "2025-01"}, "end"),
+    ({"group": "assets"}, "group"),
+])
+def test_monthly_endpoint_rejects_bad_ranges(client, params, field):
+    response = client.get(URL, params)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert field in response.data
+
+
+@pytest.mark.django_db
+def test_monthly_endpoint_requires_authentication():
+    assert APIClient().get(URL).status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,105 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from asgiref.sync import sync_to_async
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from money_tracker.currencies.models import ExchangeRate
+from money_tracker.currencies.valuation import lcy_values_changed
+from money_tracker.expenses.models import FixedExpense
+from money_tracker.users.tests.factories import UserFactory
+
+from ..push import InMemoryPushBackend
+from ..push import event_stream
+
+URL = reverse("api:reports:data-events")
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def fast_streams(settings):
+    settings.PUSH_HEARTBEAT_SECONDS = 0.05
+    settings.PUSH_STREAM_TIMEOUT_SECONDS = 5
+
+
+def stream_events(user_id, during, count=2):
+    """The first `count` events of a user's stream, with `during` run after the first one."""
+    async def collect():
+        stream = event_stream(user_id)
+        events = [await anext(stream)]
+        await sync_to_async(during)()
+        while len(events) < count:
+            events.append(await anext(stream))
+        await stream.aclose()
+        return events
+    return async_to_sync(collect)()
+
+
+def version(event):
+    data = next(line for line in event.splitlines() if line.startswith("data: "))
+    return json.loads(data.removeprefix("data: "))["version"]
+
+
+def test_own_writes_push_a_new_version(user, kes, django_capture_on_commit_callbacks):
+    def write():
+        with django_capture_on_commit_callbacks(execute=True):
+            FixedExpense.objects.create(expense_name="rent", currency=kes, amount=1200, created_by=user)
+
+    first, second = stream_events(user.pk, write)
+
+    assert first.startswith("retry: ")
+    assert second.startswith("event: version")
+    assert version(first) != version(second)
+
+
+def test_other_users_writes_only_keep_the_stream_alive(user, kes, django_capture_on_commit_callbacks):
+    def write():
+        with django_capture_on_commit_callbacks(execute=True):
+            FixedExpense.objects.create(expense_name="rent", currency=kes, amount=1200, created_by=UserFactory())
+
+    _, second = stream_events(user.pk, write)
+
+    assert second == ": keep-alive\n\n"
+
+
+def test_revaluations_reach_every_stream(user, django_capture_on_commit_callbacks):
+    def revalue():
+        # As a rate import or revalue_lcy_columns does, for another user's currency
+        with django_capture_on_commit_callbacks(execute=True):
+            lcy_values_changed.send(sender=ExchangeRate, currencies=["USD"])
+
+    events = stream_events(user.pk, revalue)
+
+    assert events[1].startswith("event: version")
+
+
+def test_in_memory_backend_delivers_only_subscribed_channels():
+    backend = InMemoryPushBackend()
+
+    async def listen():
+        async with backend.subscribe(["a"]) as subscription:
+            await sync_to_async(backend.publish, thread_sensitive=False)("b", "ignored")
+            await sync_to_async(backend.publish, thread_sensitive=False)("a", "delivered")
+            return await subscription.get(timeout=1), await subscription.get(timeout=0.05)
+
+    assert async_to_sync(listen)() == ("delivered", None)
+    assert not any(backend._subscribers.values())
+
+
+def test_events_require_authentication():
+    response = APIClient().get(URL, HTTP_ACCEPT="text/event-stream")
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_events_are_an_unbuffered_event_stream(client):
+    response = client.get(URL, HTTP_ACCEPT="text/event-stream")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "text/event-stream"
+    assert response["X-Accel-Buffering"] == "no"
+    assert response.is_async
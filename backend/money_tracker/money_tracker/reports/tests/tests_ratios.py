@@ -0,0 +1,75 @@
+import pytest
+from datetime import timedelta
+from decimal import Decimal
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from money_tracker.assets.models import Equity, LiquidAsset
+from money_tracker.currencies.models import Currency
+from money_tracker.expenses.models import FixedExpense
+from money_tracker.income.models import EarnedIncome
+from money_tracker.liabilities.models import InterestType, Loan
+from ..ratios import build_ratios
+
+URL = reverse("api:reports:financial-ratios")
+
+
+@pytest.fixture
+def records(user):
+    kes = Currency.objects.create(code="KES", description="Kenyan Shilling", is_local=True, created_by=user)
+    EarnedIncome.objects.create(income_name="salary", currency=kes, amount=Decimal("4000.00"), created_by=user)
+    FixedExpense.objects.create(expense_name="rent", currency=kes, amount=Decimal("1000.00"), created_by=user)
+    LiquidAsset.objects.create(source="Bank", name="savings", currency=kes, amount=Decimal("6000.00"), created_by=user)
+    Equity.objects.create(name="Shop", currency=kes, amount=Decimal("4000.00"), ratio=Decimal("0.25"), created_by=user)
+    interest_type = InterestType.objects.create(code="SIMPLE", description="Simple Interest", created_by=user)
+    loan = Loan.objects.create(
+        source="Bank", loan_date=timezone.localdate(), currency=kes, amount_taken=Decimal("2000.00"), reason="Car",
+        interest_type=interest_type, repayment_date=timezone.localdate() + timedelta(days=365), created_by=user,
+    )
+    return kes, loan
+
+
+@pytest.mark.django_db
+def test_ratios_come_from_one_query(user, records, django_assert_num_queries):
+    _, loan = records
+
+    with django_assert_num_queries(1):
+        result = build_ratios(user.pk)
+
+    assert result["figures"]["outstanding_loans"] == loan.amount_repay_lcy  # nothing paid, due_balance unset
+    assert result["figures"]["equity_holdings"] == Decimal("1000.00")
+    assert result["ratios"] == {
+        "debt_to_asset": Decimal("0.2000"),
+        "liquidity": (Decimal("6000.00") / loan.amount_repay_lcy).quantize(Decimal("0.0001")),
+        "savings_rate": Decimal("0.7500"),
+        "equity_ownership": Decimal("0.2500"),
+    }
+
+
+@pytest.mark.django_db
+def test_ratios_without_denominators_are_none(user):
+    assert build_ratios(user.pk)["ratios"] == {
+        "debt_to_asset": None, "liquidity": None, "savings_rate": None, "equity_ownership": None,
+    }
+
+
+@pytest.mark.django_db
+def test_ratios_endpoint_is_cached_until_a_write(client, user, records, django_assert_max_num_queries):
+    kes, _ = records
+    assert client.get(URL).data["ratios"]["savings_rate"] == Decimal("0.7500")
+
+    with django_assert_max_num_queries(2):  # savepoint + release only
+        client.get(URL)
+
+    FixedExpense.objects.create(expense_name="school", currency=kes, amount=Decimal("1000.00"), created_by=user)
+    assert client.get(URL).data["ratios"]["savings_rate"] == Decimal("0.5000")
+
+
+@pytest.mark.django_db
+def test_ratios_endpoint_in_live_mode(settings, client, records):
+    settings.LCY_VALUATION_MODE = "live"
+
+    response = client.get(URL)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["figures"]["equity_holdings"] == Decimal("1000.00")
@@ -0,0 +1,93 @@
+import pytest
+from datetime import date, timedelta
+from decimal import Decimal
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from money_tracker.assets.models import LiquidAsset
+from money_tracker.currencies.models import Currency
+from money_tracker.liabilities.models import InterestType, Loan
+from money_tracker.users.tests.factories import UserFactory
+from ..models import NetWorthSnapshot
+from ..snapshots import user_id_ranges, write_snapshots
+from ..tasks import snapshot_net_worth
+
+URL = reverse("api:reports:net-worth-report")
+
+
+@pytest.fixture
+def holdings(user):
+    kes = Currency.objects.create(code="KES", description="Kenyan Shilling", is_local=True, created_by=user)
+    LiquidAsset.objects.create(source="Bank", name="savings", currency=kes, amount=Decimal("8000.00"), created_by=user)
+    LiquidAsset.objects.create(source="Sacco", name="shares", currency=kes, amount=Decimal("2000.00"), created_by=user)
+    interest_type = InterestType.objects.create(code="SIMPLE", description="Simple Interest", created_by=user)
+    Loan.objects.create(
+        source="Bank", loan_date=timezone.localdate(), currency=kes, amount_taken=Decimal("3000.00"), reason="Car",
+        interest_type=interest_type, repayment_date=timezone.localdate() + timedelta(days=365), created_by=user,
+    )
+    return kes
+
+
+@pytest.mark.django_db
+def test_write_snapshots_is_one_query_and_idempotent(user, holdings, django_assert_num_queries):
+    other = UserFactory()  # holds nothing, gets no snapshot
+    first, last = min(user.pk, other.pk), max(user.pk, other.pk)
+
+    with django_assert_num_queries(1):
+        assert write_snapshots(first, last, date(2026, 1, 31)) == 1
+    LiquidAsset.objects.get(created_by=user, source="Sacco").delete()
+    assert write_snapshots(first, last, "2026-01-31") == 1
+
+    snapshot = NetWorthSnapshot.objects.get(user=user)
+    assert (snapshot.assets, snapshot.liabilities, snapshot.net_worth) == (
+        Decimal("8000.00"), Decimal("3000.00"), Decimal("5000.00"),
+    )
+
+
+@pytest.mark.django_db
+def test_user_id_ranges():
+    ids = sorted(UserFactory().pk for _ in range(5))
+
+    assert user_id_ranges(2) == [(ids[0], ids[1]), (ids[2], ids[3]), (ids[4], ids[4])]
+
+
+@pytest.mark.django_db
+def test_snapshot_task_fans_out_over_chunks(settings, user, holdings):
+    settings.CELERY_TASK_ALWAYS_EAGER = True
+    settings.NET_WORTH_SNAPSHOT_CHUNK_SIZE = 1
+    UserFactory.create_batch(2)
+
+    result = snapshot_net_worth.delay("2026-02-01")
+
+    assert result.result == "Net worth snapshot for 2026-02-01 dispatched in 3 chunks."
+    assert NetWorthSnapshot.objects.get().date == date(2026, 2, 1)
+
+
+@pytest.mark.django_db
+def test_net_worth_endpoint_reads_snapshots(client, user, holdings):
+    today = timezone.localdate()
+    write_snapshots(user.pk, user.pk, today - timedelta(days=100))
+    write_snapshots(user.pk, user.pk, today - timedelta(days=1))
+    write_snapshots(user.pk, user.pk, today)
+
+    response = client.get(URL)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [row["date"] for row in response.data["snapshots"]] == [today - timedelta(days=1), today]
+    assert response.data["snapshots"][-1]["net_worth"] == Decimal("7000.00")
+
+    response = client.get(URL, {"start": (today - timedelta(days=100)).isoformat(), "end": today.isoformat()})
+    assert len(response.data["snapshots"]) == 3
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("params, field", [
+    ({"start": "2026-02-02", "end": "2026-02-01"}, "start"),
+    ({"start": "2026-02"}, "start"),
+    ({"start": "1990-01-01", "end": "2026-01-01"}, "end"),
+])
+def test_net_worth_endpoint_rejects_bad_ranges(client, params, field):
+    response = client.get(URL, params)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert field in response.data
@@ -0,0 +1,94 @@
+import pytest
+from decimal import Decimal
+from datetime import timedelta
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from money_tracker.currencies.models import Currency, ExchangeRate
+from money_tracker.currencies.valuation import revalue_currency
+from money_tracker.expenses.models import FixedExpense
+from money_tracker.income.models import EarnedIncome, PassiveIncome
+from money_tracker.liabilities.models import InterestType, Loan
+from ..summary import category_totals
+
+
+@pytest.fixture
+def records(user):
+    kes = Currency.objects.create(code="KES", description="Kenyan Shilling", is_local=True, created_by=user)
+    usd = Currency.objects.create(code="USD", description="US Dollar", created_by=user)
+    ExchangeRate.objects.create(currency=usd, rate=Decimal("130.00"), is_current=True, created_by=user)
+    EarnedIncome.objects.create(income_name="salary", currency=kes, amount=Decimal("1000.00"), created_by=user)
+    PassiveIncome.objects.create(income_name="rent", currency=usd, amount=Decimal("10.00"), created_by=user)
+    FixedExpense.objects.create(expense_name="school", currency=kes, amount=Decimal("250.00"), created_by=user)
+    interest_type = InterestType.objects.create(code="SIMPLE", description="Simple Interest", created_by=user)
+    Loan.objects.create(
+        source="Bank", loan_date=timezone.localdate(), currency=kes, amount_taken=Decimal("5000.00"), reason="Car",
+        interest_type=interest_type, repayment_date=timezone.localdate() + timedelta(days=365), created_by=user,
+    )
+    return kes, usd
+
+
+@pytest.mark.django_db
+def test_category_totals_come_from_one_query(user, records, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        totals = category_totals(user.pk)
+
+    assert len(totals) == 11
+    assert totals["earned_income"] == Decimal("1000.00")
+    assert totals["passive_income"] == Decimal("1300.00")
+    assert totals["equities"] == Decimal("0")
+
+
+@pytest.mark.django_db
+def test_summary_endpoint(client, user, records):
+    response = client.get(reverse("api:reports:dashboard-summary"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["local_currency"] == {"code": "KES", "description": "Kenyan Shilling"}
+    assert response.data["income"] == {
+        "total_income": Decimal("2300.00"), "earned_income": Decimal("1000.00"),
+        "portfolio_income": Decimal("0"), "passive_income": Decimal("1300.00"),
+    }
+    assert response.data["expenses"]["total_expenses"] == Decimal("250.00")
+    assert response.data["assets"]["total_assets"] == Decimal("0")
+    assert response.data["liabilities"] == {"total_liabilities": Decimal("5000.00"), "loans": Decimal("5000.00")}
+
+
+@pytest.mark.django_db
+def test_summary_is_cached_until_a_write(client, user, records, django_assert_max_num_queries):
+    url = reverse("api:reports:dashboard-summary")
+    client.get(url)
+
+    # savepoint + release only
+    with django_assert_max_num_queries(2):
+        client.get(url)
+
+    EarnedIncome.objects.create(income_name="bonus", currency=records[0], amount=Decimal("500.00"), created_by=user)
+    assert client.get(url).data["income"]["earned_income"] == Decimal("1500.00")
+
+
+@pytest.mark.django_db
+def test_summary_is_invalidated_by_a_revaluation(client, user, records):
+    _, usd = records
+    url = reverse("api:reports:dashboard-summary")
+    client.get(url)
+    ExchangeRate.objects.filter(currency=usd).update(rate=Decimal("140.00"))  # no signals
+
+    revalue_currency(usd.code)
+
+    assert client.get(url).data["income"]["passive_income"] == Decimal("1400.00")
+
+
+@pytest.mark.django_db
+def test_summary_follows_live_valuation_mode(settings, client, user, records):
+    settings.LCY_VALUATION_MODE = "live"
+    _, usd = records
+    ExchangeRate.objects.filter(currency=usd).update(rate=Decimal("140.00"))
+
+    assert client.get(reverse("api:reports:dashboard-summary")).data["income"]["passive_income"] == Decimal("1400.00")
+
+
+@pytest.mark.django_db
+def test_summary_requires_authentication():
+    assert APIClient().get(reverse("api:reports:dashboard-summary")).status_code == status.HTTP_401_UNAUTHORIZED
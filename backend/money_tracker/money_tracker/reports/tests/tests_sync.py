@@ -0,0 +1,142 @@
+from datetime import date
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from money_tracker.currencies.models import Currency
+from money_tracker.currencies.models import ExchangeRate
+from money_tracker.currencies.valuation import revalue_currency
+from money_tracker.expenses.models import FixedExpense
+from money_tracker.income.models import EarnedIncome
+from money_tracker.liabilities.models import InterestType
+from money_tracker.liabilities.models import Loan
+from money_tracker.liabilities.tasks import check_loan_default
+from money_tracker.users.tests.factories import UserFactory
+
+from ..models import Tombstone
+from ..sync import prune_tombstones
+
+URL = reverse("api:reports:sync")
+
+pytestmark = pytest.mark.django_db
+
+
+def sync(client, since=None):
+    response = client.get(URL, {"since": since} if since else {})
+    assert response.status_code == status.HTTP_200_OK
+    return response.data
+
+
+def test_full_sync_returns_every_record_in_list_format(client, user, kes):
+    expense = FixedExpense.objects.create(expense_name="rent", currency=kes, amount=1200, created_by=user)
+    FixedExpense.objects.create(expense_name="rent", currency=kes, amount=1, created_by=UserFactory())
+
+    data = sync(client)
+
+    assert data["full"] is True
+    assert [row["id"] for row in data["changed"]["fixed_expenses"]] == [expense.pk]
+    assert [row["code"] for row in data["changed"]["currencies"]] == ["KES"]
+    assert data["changed"]["fixed_expenses"][0] == client.get(
+        reverse("api:expenses:fixedexpense-detail", args=[expense.pk])
+    ).data
+    assert all(not rows for rows in data["deleted"].values())
+
+
+def test_delta_sync_returns_changes_and_deletes_after_the_watermark(client, user, kes):
+    kept = FixedExpense.objects.create(expense_name="rent", currency=kes, amount=1200, created_by=user)
+    removed = EarnedIncome.objects.create(income_name="salary", currency=kes, amount=5000, created_by=user)
+    since = timezone.now()
+
+    kept.amount = 1300
+    kept.modified_by = user
+    kept.save()
+    removed_pk = removed.pk
+    removed.delete()
+
+    data = sync(client, since)
+
+    assert data["full"] is False
+    assert [row["amount"] for row in data["changed"]["fixed_expenses"]] == ["1300.00"]
+    assert data["changed"]["currencies"] == []
+    assert data["deleted"]["earned_income"] == [removed_pk]
+    assert Tombstone.objects.get(user=user).category == "earned_income"
+
+
+def test_loan_defaults_reach_the_next_delta_sync(client, user, kes):
+    interest_type = InterestType.objects.create(code="SIMPLE", description="Simple", created_by=user)
+    loan = Loan.objects.create(
+        source="bank", loan_date=date(2020, 1, 1), currency=kes, amount_taken=Decimal("1000.00"), reason="car",
+        interest_type=interest_type, repayment_date=date(2021, 1, 1), due_balance=Decimal("500.00"), created_by=user,
+    )
+    since = timezone.now()
+
+    check_loan_default()
+
+    changed = sync(client, since)["changed"]["loans"]
+    assert [(row["id"], row["in_default"]) for row in changed] == [(loan.pk, True)]
+
+
+def test_stored_revaluations_resend_only_the_revalued_rows(client, user, kes):
+    usd = Currency.objects.create(code="USD", description="US Dollar", created_by=user)
+    ExchangeRate.objects.create(currency=usd, rate=Decimal("100.00"), is_current=True, created_by=user)
+    hosting = FixedExpense.objects.create(expense_name="hosting", currency=usd, amount=10, created_by=user)
+    FixedExpense.objects.create(expense_name="rent", currency=kes, amount=1200, created_by=user)
+    since = timezone.now()
+
+    ExchangeRate.objects.filter(currency=usd).update(rate=Decimal("130.00"))
+    revalue_currency("USD")
+
+    changed = sync(client, since)["changed"]["fixed_expenses"]
+    assert [(row["id"], row["amount_lcy_display"]) for row in changed] == [(hosting.pk, "KES 1300.00")]
+
+    # A re-run changes no stored value, so it touches no row
+    since = timezone.now()
+    revalue_currency("USD")
+    assert sync(client, since)["changed"]["fixed_expenses"] == []
+
+
+def test_nothing_changed_after_a_later_watermark(client, user, kes):
+    FixedExpense.objects.create(expense_name="rent", currency=kes, amount=1200, created_by=user)
+
+    data = sync(client, timezone.now())
+
+    assert all(not rows for rows in data["changed"].values())
+
+
+def test_the_watermark_overlaps_the_clock(client, settings):
+    settings.SYNC_WATERMARK_OVERLAP_SECONDS = 30
+    before = timezone.now()
+
+    watermark = client.get(URL).data["watermark"]
+
+    assert watermark <= before
+    assert watermark >= before - timedelta(seconds=31)
+
+
+def test_currency_deletes_are_reported_by_code(client, user):
+    usd = Currency.objects.create(code="USD", description="US Dollar", created_by=user)
+    since = timezone.now()
+    usd.delete()
+
+    assert sync(client, since)["deleted"]["currencies"] == ["USD"]
+
+
+def test_watermarks_older_than_the_retained_tombstones_are_gone(client, settings):
+    settings.SYNC_TOMBSTONE_RETENTION_DAYS = 30
+
+    response = client.get(URL, {"since": timezone.now() - timedelta(days=31)})
+
+    assert response.status_code == status.HTTP_410_GONE
+
+
+def test_prune_drops_only_expired_tombstones(user):
+    old = Tombstone.objects.create(user=user, category="loans", object_id="1")
+    Tombstone.objects.filter(pk=old.pk).update(deleted_at=timezone.now() - timedelta(days=31))
+    recent = Tombstone.objects.create(user=user, category="loans", object_id="2")
+
+    assert prune_tombstones() == 1
+    assert list(Tombstone.objects.values_list("pk", flat=True)) == [recent.pk]
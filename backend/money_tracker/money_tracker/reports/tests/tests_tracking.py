@@ -0,0 +1,128 @@
+import pytest
+from decimal import Decimal
+from django.core.management import CommandError, call_command
+from money_tracker.currencies.models import Currency, ExchangeRate
+from money_tracker.currencies.valuation import revalue_currency
+from money_tracker.income.models import EarnedIncome
+from money_tracker.users.tests.factories import UserFactory
+from ..models import FinancialSummary
+from ..summary import group_totals
+from ..tracking import check_summaries, rebuild_monthly_rollups, rebuild_summaries
+
+
+def summary_row(user, category="earned_income"):
+    row = FinancialSummary.objects.filter(user=user, category=category).first()
+    return (row.total, row.count) if row else None
+
+
+@pytest.fixture
+def currencies(user):
+    kes = Currency.objects.create(code="KES", description="Kenyan Shilling", is_local=True, created_by=user)
+    usd = Currency.objects.create(code="USD", description="US Dollar", created_by=user)
+    ExchangeRate.objects.create(currency=usd, rate=Decimal("130.00"), is_current=True, created_by=user)
+    return kes, usd
+
+
+@pytest.mark.django_db
+def test_create_update_and_delete_apply_deltas(user, currencies):
+    kes, usd = currencies
+    salary = EarnedIncome.objects.create(income_name="salary", currency=kes, amount=Decimal("1000.00"), created_by=user)
+    bonus = EarnedIncome.objects.create(income_name="bonus", currency=usd, amount=Decimal("10.00"), created_by=user)
+    assert summary_row(user) == (Decimal("2300.00"), 2)
+
+    salary.amount = Decimal("1200.00")
+    salary.modified_by = user
+    salary.save()
+    assert summary_row(user) == (Decimal("2500.00"), 2)
+
+    bonus.delete()
+    assert summary_row(user) == (Decimal("1200.00"), 1)
+
+
+@pytest.mark.django_db
+def test_changing_the_owner_moves_the_record(user, currencies):
+    kes, _ = currencies
+    other = UserFactory()
+    salary = EarnedIncome.objects.create(income_name="salary", currency=kes, amount=Decimal("1000.00"), created_by=user)
+
+    salary.created_by = other
+    salary.modified_by = other
+    salary.save()
+
+    assert summary_row(user) == (Decimal("0.00"), 0)
+    assert summary_row(other) == (Decimal("1000.00"), 1)
+
+
+@pytest.mark.django_db
+def test_updates_and_deletes_lock_the_row_they_read(user, currencies, django_assert_max_num_queries):
+    kes, _ = currencies
+    salary = EarnedIncome.objects.create(income_name="salary", currency=kes, amount=Decimal("1000.00"), created_by=user)
+    bonus = EarnedIncome.objects.create(income_name="bonus", currency=kes, amount=Decimal("10.00"), created_by=user)
+
+    salary.amount = Decimal("1200.00")
+    salary.modified_by = user
+    with django_assert_max_num_queries(20) as saved:
+        salary.save()
+    with django_assert_max_num_queries(20) as deleted:
+        bonus.delete()
+
+    for queries in (saved, deleted):
+        # The previous values are read under the lock, inside the transaction that applies the delta
+        statements = [query["sql"] for query in queries.captured_queries]
+        read = next(index for index, sql in enumerate(statements) if sql.endswith("FOR UPDATE"))
+        assert any(sql.startswith("SAVEPOINT") for sql in statements[:read])
+    assert summary_row(user) == (Decimal("1200.00"), 1)
+
+
+@pytest.mark.django_db
+def test_totals_are_read_from_the_summary(user, currencies, django_assert_num_queries):
+    kes, _ = currencies
+    EarnedIncome.objects.create(income_name="salary", currency=kes, amount=Decimal("1000.00"), created_by=user)
+
+    with django_assert_num_queries(1):
+        totals = group_totals(user.pk, "income")
+
+    assert totals == {
+        "total_income": Decimal("1000.00"), "earned_income": Decimal("1000.00"),
+        "portfolio_income": Decimal("0"), "passive_income": Decimal("0"),
+    }
+
+
+@pytest.mark.django_db
+def test_rebuild_recovers_from_bulk_updates(user, currencies):
+    kes, _ = currencies
+    EarnedIncome.objects.create(income_name="salary", currency=kes, amount=Decimal("1000.00"), created_by=user)
+    EarnedIncome.objects.filter(created_by=user).update(amount_lcy=Decimal("900.00"))  # bypasses save()
+    assert check_summaries() == [
+        (user.pk, "earned_income", (Decimal("1000.00"), 1), (Decimal("900.00"), 1)),
+    ]
+
+    assert rebuild_summaries([user.pk]) == 1
+    assert check_summaries() == []
+    rebuild_monthly_rollups([user.pk])
+    assert summary_row(user) == (Decimal("900.00"), 1)
+
+
+@pytest.mark.django_db
+def test_revaluation_rebuilds_the_holders_summaries(user, currencies):
+    _, usd = currencies
+    EarnedIncome.objects.create(income_name="bonus", currency=usd, amount=Decimal("10.00"), created_by=user)
+    ExchangeRate.objects.filter(currency=usd).update(rate=Decimal("140.00"))  # no signals
+
+    revalue_currency(usd.code)
+
+    assert summary_row(user) == (Decimal("1400.00"), 1)
+
+
+@pytest.mark.django_db
+def test_rebuild_summaries_command(user, currencies, capsys):
+    kes, _ = currencies
+    EarnedIncome.objects.create(income_name="salary", currency=kes, amount=Decimal("1000.00"), created_by=user)
+    FinancialSummary.objects.all().delete()
+
+    with pytest.raises(CommandError, match="1 financial summary rows are out of date"):
+        call_command("rebuild_summaries", "--check")
+    call_command("rebuild_summaries")
+    call_command("rebuild_summaries", "--check", "--user", str(user.pk))
+
+    assert "Financial summaries are consistent." in capsys.readouterr().out
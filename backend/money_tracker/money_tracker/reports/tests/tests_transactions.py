@@ -0,0 +1,103 @@
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from money_tracker.currencies.models import Currency
+from money_tracker.currencies.models import ExchangeRate
+from money_tracker.expenses.models import DiscretionaryExpense
+from money_tracker.expenses.models import FixedExpense
+from money_tracker.income.models import EarnedIncome
+from money_tracker.income.models import PassiveIncome
+from money_tracker.users.tests.factories import UserFactory
+
+URL = reverse("api:reports:transactions")
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def records(user, kes):
+    """(type, id) of seven records, newest first; three share one created_at and ids repeat across tables."""
+    made = [
+        ("earned_income", EarnedIncome.objects.create(income_name="salary", currency=kes, amount=5000, created_by=user)),
+        ("fixed_expenses", FixedExpense.objects.create(expense_name="rent", currency=kes, amount=1200, created_by=user)),
+        ("passive_income", PassiveIncome.objects.create(income_name="rent in", currency=kes, amount=300, created_by=user)),
+        ("fixed_expenses", FixedExpense.objects.create(expense_name="power", currency=kes, amount=80, created_by=user)),
+        ("discretionary_expenses", DiscretionaryExpense.objects.create(
+            expense_name="cinema", currency=kes, amount=15, notes="friday", created_by=user,
+        )),
+        ("earned_income", EarnedIncome.objects.create(income_name="bonus", currency=kes, amount=700, created_by=user)),
+        ("fixed_expenses", FixedExpense.objects.create(expense_name="water", currency=kes, amount=20, created_by=user)),
+    ]
+    tied = timezone.now()
+    for _, record in made[1:4]:
+        record.created_at, record.modified_by = tied, user
+        record.save()
+    EarnedIncome.objects.create(income_name="not mine", currency=kes, amount=1, created_by=UserFactory())
+
+    ordered = sorted(made, key=lambda item: (item[1].created_at, item[0], item[1].pk), reverse=True)
+    return [(category, record.pk) for category, record in ordered]
+
+
+def test_feed_merges_every_type_newest_first_in_one_shape(client, records):
+    response = client.get(URL)
+
+    assert response.status_code == status.HTTP_200_OK
+    rows = response.data["results"]
+    assert [(row["type"], row["id"]) for row in rows] == records
+    assert set(rows[0]) == {"type", "group", "id", "name", "currency", "amount", "amount_lcy", "notes", "created_at"}
+    cinema = next(row for row in rows if row["name"] == "cinema")
+    assert cinema["group"] == "expenses"
+    assert (cinema["currency"], cinema["amount"], cinema["amount_lcy"]) == ("KES", "15.00", "15.00")
+    assert cinema["notes"] == "friday"
+
+
+def test_pages_walk_the_feed_without_gaps_or_repeats(client, records, django_assert_max_num_queries):
+    seen, pages, url = [], [], f"{URL}?page_size=2"
+    while url:
+        with django_assert_max_num_queries(3):  # the merge, plus the ATOMIC_REQUESTS savepoint and its release
+            page = client.get(url).data
+        pages.append(page)
+        seen += [(row["type"], row["id"]) for row in page["results"]]
+        url = page["next"]
+
+    assert seen == records
+    assert len(pages) == 4
+    back = client.get(pages[2]["previous"]).data
+    assert back["results"] == pages[1]["results"]
+    assert client.get(back["previous"]).data["results"] == pages[0]["results"]
+
+
+def test_feed_can_be_narrowed_by_type_and_group(client, records):
+    expenses = client.get(URL, {"group": "expenses"}).data["results"]
+    earned = client.get(f"{URL}?type=earned_income&type=passive_income").data["results"]
+    fixed = client.get(URL, {"type": "fixed_expenses", "page_size": 2})
+
+    assert [(row["type"], row["id"]) for row in expenses] == [item for item in records if item[0].endswith("expenses")]
+    assert {row["type"] for row in earned} == {"earned_income", "passive_income"}
+    assert len(earned) == 3
+    rest = client.get(fixed.data["next"]).data["results"]
+    assert [(row["type"], row["id"]) for row in [*fixed.data["results"], *rest]] == [
+        item for item in records if item[0] == "fixed_expenses"
+    ]
+    assert client.get(URL, {"type": "loans"}).status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_invalid_cursor_is_not_found(client):
+    assert client.get(URL, {"cursor": "not-a-cursor"}).status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_live_valuation_values_foreign_rows_at_the_current_rate(client, user, kes, settings):
+    usd = Currency.objects.create(code="USD", description="US Dollar", created_by=user)
+    ExchangeRate.objects.create(currency=usd, rate=Decimal("100.00"), is_current=True, created_by=user)
+    FixedExpense.objects.create(expense_name="hosting", currency=usd, amount=10, created_by=user)
+    ExchangeRate.objects.filter(currency=usd).update(rate=Decimal("130.00"))
+    settings.LCY_VALUATION_MODE = "live"
+
+    row = client.get(URL).data["results"][0]
+
+    assert (row["currency"], row["amount_lcy"]) == ("USD", "1300.00")
+
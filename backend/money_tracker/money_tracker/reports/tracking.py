@@ -0,0 +1,216 @@
+import logging
+from decimal import Decimal
+
+from django.apps import apps as global_apps
+from django.db import connection
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Now
+from django.utils import timezone
+
+from .summary import MONTHLY_GROUPS
+from .summary import SUMMARY_GROUPS
+
+logger = logging.getLogger(__name__)
+
+# model label -> (summary category, stored LCY field)
+TRACKED = {
+    label: (category, lcy_field)
+    for _, members in SUMMARY_GROUPS.values()
+    for label, category, lcy_field in members
+}
+# categories that also keep MonthlyRollup rows, keyed by the month of created_at
+MONTHLY_CATEGORIES = {category for group in MONTHLY_GROUPS for _, category, _ in SUMMARY_GROUPS[group][1]}
+
+
+def _add(model_name, lookup, amount, count):
+    """Add amount and count to the row matching lookup with F-expressions, creating the row on first use."""
+    model = global_apps.get_model("reports", model_name)
+    changes = {"total": F("total") + amount, "count": F("count") + count, "modified_at": Now()}
+    if not model.objects.filter(**lookup).update(**changes):
+        model.objects.get_or_create(**lookup)
+        model.objects.filter(**lookup).update(**changes)
+
+
+def apply_delta(user_id, category, amount, count):
+    """Add amount and count to a user's FinancialSummary row."""
+    _add("FinancialSummary", {"user_id": user_id, "category": category}, amount, count)
+
+
+def apply_monthly_delta(user_id, category, month, amount, count):
+    """Add amount and count to a user's MonthlyRollup row of the month starting on `month`."""
+    _add("MonthlyRollup", {"user_id": user_id, "category": category, "month": month}, amount, count)
+
+
+def month_of(moment):
+    """First day of the month of a datetime, in the current time zone."""
+    return timezone.localtime(moment).date().replace(day=1)
+
+
+class SummaryTrackedMixin:
+    """
+    Keeps the owner's FinancialSummary row, and for income and expenses the MonthlyRollup row
+    of the record's month, in step with every save and delete of a record.
+    Must precede models.Model in the bases. Queryset update()/delete() and raw SQL bypass it,
+    like the rest of the save() logic; rebuild_summaries() recomputes from scratch.
+    """
+
+    def _summary_target(self):
+        """(category, stored LCY field) of this model."""
+        return TRACKED[self._meta.label]
+
+    def _stored_summary_values(self, lcy_field):
+        """
+        (owner id, stored LCY value, created_at) of this record as saved, or None. The row stays
+        locked until the transaction ends, so concurrent writers apply their deltas one after another.
+        """
+        rows = type(self)._base_manager.select_for_update().filter(pk=self.pk)
+        return rows.values_list("created_by_id", lcy_field, "created_at").first()
+
+    def _apply_summary_delta(self, category, user_id, created_at, amount, count):
+        apply_delta(user_id, category, amount, count)
+        if category in MONTHLY_CATEGORIES:
+            apply_monthly_delta(user_id, category, month_of(created_at), amount, count)
+
+    def save_base(self, *args, **kwargs):
+        category, lcy_field = self._summary_target()
+        with transaction.atomic():
+            previous = None
+            if not self._state.adding and not kwargs.get("raw"):
+                previous = self._stored_summary_values(lcy_field)
+            super().save_base(*args, **kwargs)
+            if kwargs.get("raw"):
+                return
+            value = getattr(self, lcy_field) or Decimal("0")
+            if previous is None:
+                self._apply_summary_delta(category, self.created_by_id, self.created_at, value, 1)
+            elif previous[0] != self.created_by_id or previous[2] != self.created_at:
+                self._apply_summary_delta(category, previous[0], previous[2], -previous[1], -1)
+                self._apply_summary_delta(category, self.created_by_id, self.created_at, value, 1)
+            elif previous[1] != value:
+                self._apply_summary_delta(category, self.created_by_id, self.created_at, value - previous[1], 0)
+
+    def delete(self, *args, **kwargs):
+        category, lcy_field = self._summary_target()
+        with transaction.atomic():
+            stored = self._stored_summary_values(lcy_field)
+            result = super().delete(*args, **kwargs)
+            if stored is not None:
+                self._apply_summary_delta(category, stored[0], stored[2], -stored[1], -1)
+        return result
+
+
+def _aggregate_sql(apps, user_ids, monthly=False):
+    """
+    UNION ALL of (user_id, category[, month], total, count) per tracked table, all users by default.
+    :return: (sql, params).
+    """
+    parts, params = [], []
+    for label, (category, lcy_field) in TRACKED.items():
+        if monthly and category not in MONTHLY_CATEGORIES:
+            continue
+        model = apps.get_model(label)
+        table = connection.ops.quote_name(model._meta.db_table)
+        lcy = connection.ops.quote_name(model._meta.get_field(lcy_field).column)
+        month = "DATE_TRUNC('month', created_at AT TIME ZONE %s)::date AS month, " if monthly else ""
+        parts.append(
+            f"SELECT created_by_id AS user_id, '{category}' AS category, {month}COALESCE(SUM({lcy}), 0) AS total, "
+            f"COUNT(*) AS count FROM {table} {'WHERE created_by_id = ANY(%s)' if user_ids is not None else ''} "
+            f"GROUP BY created_by_id{', month' if monthly else ''}"
+        )
+        if monthly:
+            params.append(timezone.get_current_timezone_name())
+        if user_ids is not None:
+            params.append(list(user_ids))
+    return " UNION ALL ".join(parts), params
+
+
+def _rebuild(model, user_ids, apps, monthly=False):
+    table = connection.ops.quote_name(model._meta.db_table)
+    columns = "user_id, category, month, total, count" if monthly else "user_id, category, total, count"
+    sql, params = _aggregate_sql(apps, user_ids, monthly)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"LOCK TABLE {table} IN EXCLUSIVE MODE")
+        if user_ids is None:
+            cursor.execute(f"DELETE FROM {table}")
+        else:
+            cursor.execute(f"DELETE FROM {table} WHERE user_id = ANY(%s)", [list(user_ids)])
+        cursor.execute(
+            f"INSERT INTO {table} ({columns}, modified_at) SELECT {columns}, NOW() FROM ({sql}) AS totals", params
+        )
+        return cursor.rowcount
+
+
+def rebuild_summaries(user_ids=None, apps=global_apps):
+    """
+    Recompute FinancialSummary rows from the source tables in set-based SQL, all users by default.
+    The summary table is locked against concurrent deltas (reads continue) for the duration,
+    so deltas committed after the rebuild are applied on top of it.
+    :return: number of summary rows written.
+    """
+    written = _rebuild(apps.get_model("reports", "FinancialSummary"), user_ids, apps)
+    logger.info(f"Rebuilt {written} financial summary rows")
+    return written
+
+
+def rebuild_monthly_rollups(user_ids=None, apps=global_apps):
+    """
+    Recompute MonthlyRollup rows with a DATE_TRUNC('month') GROUP BY over the income and
+    expense tables, all users by default; locked like rebuild_summaries().
+    :return: number of rollup rows written.
+    """
+    written = _rebuild(apps.get_model("reports", "MonthlyRollup"), user_ids, apps, monthly=True)
+    logger.info(f"Rebuilt {written} monthly rollup rows")
+    return written
+
+
+def users_holding(currencies):
+    """Ids of users with at least one tracked record in any of the given currency codes."""
+    parts = []
+    for label in TRACKED:
+        model = global_apps.get_model(label)
+        table = connection.ops.quote_name(model._meta.db_table)
+        currency = connection.ops.quote_name(model._meta.get_field("currency").column)
+        parts.append(f"SELECT created_by_id FROM {table} WHERE {currency} = ANY(%s)")
+    with connection.cursor() as cursor:
+        cursor.execute(" UNION ".join(parts), [list(currencies)] * len(parts))
+        return [row[0] for row in cursor.fetchall()]
+
+
+def _mismatches(actual, stored):
+    empty = (Decimal("0"), 0)
+    mismatches = []
+    for key in sorted(actual.keys() | stored.keys(), key=str):
+        if stored.get(key, empty) != actual.get(key, empty):
+            mismatches.append((*key, stored.get(key, empty), actual.get(key, empty)))
+    return mismatches
+
+
+def _compare(model, user_ids, keys, monthly=False):
+    sql, params = _aggregate_sql(global_apps, user_ids, monthly)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        actual = {tuple(row[:-2]): (row[-2], row[-1]) for row in cursor.fetchall()}
+    rows = model.objects.all()
+    if user_ids is not None:
+        rows = rows.filter(user_id__in=user_ids)
+    stored = {tuple(row[:-2]): (row[-2], row[-1]) for row in rows.values_list(*keys, "total", "count")}
+    return _mismatches(actual, stored)
+
+
+def check_summaries(user_ids=None):
+    """
+    Compare FinancialSummary against the source tables.
+    :return: list of (user_id, category, (stored total, count), (actual total, count)) mismatches.
+    """
+    FinancialSummary = global_apps.get_model("reports", "FinancialSummary")
+    return _compare(FinancialSummary, user_ids, ["user_id", "category"])
+
+
+def check_monthly_rollups(user_ids=None):
+    """
+    Compare MonthlyRollup against the income and expense tables.
+    :return: list of (user_id, category, month, (stored total, count), (actual total, count)) mismatches.
+    """
+    MonthlyRollup = global_apps.get_model("reports", "MonthlyRollup")
+    return _compare(MonthlyRollup, user_ids, ["user_id", "category", "month"], monthly=True)
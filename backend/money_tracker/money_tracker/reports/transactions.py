@@ -0,0 +1,75 @@
+from django.apps import apps
+from django.db import models
+from django.db.models import Q
+
+from .summary import MONTHLY_GROUPS
+from .summary import SUMMARY_GROUPS
+
+# Name column of each flow group
+NAME_FIELDS = {"income": "income_name", "expenses": "expense_name"}
+
+# Transaction types of the feed: the flow categories (income and expenses) -> (model label, group)
+TRANSACTION_TYPES = {
+    category: (label, group) for group in MONTHLY_GROUPS for label, category, _ in SUMMARY_GROUPS[group][1]
+}
+
+# Keys of every feed row; "lcy_amount" is amount_lcy in the configured valuation mode
+FEED_COLUMNS = ("type", "group", "id", "name", "currency", "amount", "lcy_amount", "notes", "created_at")
+
+
+class TransactionFeed:
+    """
+    The income and expense records of a user merged into one feed, newest first, keyed on
+    (created_at, type, id): ids repeat across tables, so the type breaks their ties.
+
+    A page is one UNION ALL statement. Each branch reads at most `limit` rows past the cursor
+    from its table's owner index, already ordered; the outer ORDER BY ... LIMIT merges them, so
+    a page costs the same however deep the client goes.
+    """
+
+    def __init__(self, user_id, types=None):
+        self.user_id = user_id
+        self.types = list(TRANSACTION_TYPES if types is None else types)
+
+    def page(self, limit, cursor=None, backwards=False):
+        """
+        At most `limit` rows after (or with `backwards`, before) the cursor (created_at, type, id),
+        as FEED_COLUMNS dicts in walking order: newest first going forwards, oldest first going backwards.
+        """
+        return list(self.queryset(limit, cursor, backwards)) if self.types else []
+
+    def queryset(self, limit, cursor=None, backwards=False):
+        """The UNION ALL values queryset page() reads."""
+        branches = [self._branch(category, limit, cursor, backwards) for category in self.types]
+        if len(branches) == 1:
+            return branches[0]  # already ordered and limited
+        prefix = "" if backwards else "-"
+        feed = branches[0].union(*branches[1:], all=True)
+        return feed.order_by(f"{prefix}created_at", f"{prefix}type", f"{prefix}id")[:limit]
+
+    def _branch(self, category, limit, cursor, backwards):
+        label, group = TRANSACTION_TYPES[category]
+        queryset = apps.get_model(label).objects.filter(created_by_id=self.user_id).valued_for_sum()
+        prefix = "" if backwards else "-"
+        if cursor is not None:
+            queryset = queryset.filter(self._after(category, cursor, backwards))
+        queryset = queryset.order_by(f"{prefix}created_at", f"{prefix}id")
+        # Every branch selects the same columns in the same order, as UNION requires
+        return queryset.values(
+            "id", "currency", "amount", "notes", "created_at",
+            type=models.Value(category, output_field=models.CharField()),
+            group=models.Value(group, output_field=models.CharField()),
+            name=models.F(NAME_FIELDS[group]),
+            lcy_amount=queryset.lcy_value("amount_lcy"),
+        )[:limit]
+
+    @staticmethod
+    def _after(category, cursor, backwards):
+        """The rows of one type past the cursor; the type is constant per branch, so it only decides ties."""
+        created_at, cursor_type, pk = cursor
+        later = "gt" if backwards else "lt"
+        if category == cursor_type:
+            return Q(**{f"created_at__{later}": created_at}) | Q(created_at=created_at, **{f"id__{later}": pk})
+        if (category > cursor_type) == backwards:
+            return Q(**{f"created_at__{later}e": created_at})
+        return Q(**{f"created_at__{later}": created_at})
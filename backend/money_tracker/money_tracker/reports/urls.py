@@ -0,0 +1,20 @@
+from django.urls import path
+from .api.views import (
+    CashFlowForecastAPIView, CurrencyExposureAPIView, DashboardSummaryAPIView, DataEventsAPIView,
+    FinancialRatiosAPIView, MonthlyReportAPIView, NetWorthReportAPIView, SyncAPIView,
+    TransactionFeedAPIView,
+)
+
+app_name = "reports"
+
+urlpatterns = [
+    path('dashboard/summary/', DashboardSummaryAPIView.as_view(), name='dashboard-summary'),
+    path('reports/currency-exposure/', CurrencyExposureAPIView.as_view(), name='currency-exposure'),
+    path('reports/forecast/', CashFlowForecastAPIView.as_view(), name='cash-flow-forecast'),
+    path('reports/monthly/', MonthlyReportAPIView.as_view(), name='monthly-report'),
+    path('reports/net-worth/', NetWorthReportAPIView.as_view(), name='net-worth-report'),
+    path('reports/ratios/', FinancialRatiosAPIView.as_view(), name='financial-ratios'),
+    path('sync/', SyncAPIView.as_view(), name='sync'),
+    path('events/', DataEventsAPIView.as_view(), name='data-events'),
+    path('transactions/', TransactionFeedAPIView.as_view(), name='transactions'),
+]
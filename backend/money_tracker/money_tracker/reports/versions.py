@@ -0,0 +1,35 @@
+import time
+
+from django.core.cache import cache
+
+from .summary import SUMMARY_GENERATION_KEY
+
+DATA_VERSION_KEY = "data_version:user:{user_id}"
+
+
+def _initial_version():
+    # Versions start at the current time in ms, so a lost key never hands out a version seen before
+    return int(time.time() * 1000)
+
+
+def bump_data_version(user_id):
+    """Mark every list and total of a user as changed."""
+    key = DATA_VERSION_KEY.format(user_id=user_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, _initial_version(), timeout=None)
+
+
+def data_version(user_id):
+    """
+    The version of a user's data, as "<user version>.<generation>", read with one cache round trip.
+    It changes with every write to the user's records (bump_data_version) and with every rate
+    change or revaluation, which bumps the shared summary generation.
+    """
+    key = DATA_VERSION_KEY.format(user_id=user_id)
+    cached = cache.get_many([key, SUMMARY_GENERATION_KEY])
+    for missing in {key, SUMMARY_GENERATION_KEY} - cached.keys():
+        cache.add(missing, _initial_version(), timeout=None)
+        cached[missing] = cache.get(missing)
+    return f"{cached[key]}.{cached[SUMMARY_GENERATION_KEY]}"
@@ -16,6 +16,7 @@ class UserViewSet(RetrieveModelMixin, ListModelMixin, UpdateModelMixin, GenericV
     serializer_class = UserSerializer
     queryset = User.objects.all()
     lookup_field = "username"
+    pagination_class = None  # lists only the requesting user
 
     def get_queryset(self, *args, **kwargs):
         assert isinstance(self.request.user.id, int)
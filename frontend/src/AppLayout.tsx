@@ -1,8 +1,11 @@
 import React from 'react';
 import { Outlet } from 'react-router-dom';
 import Navbar from './NavBar';
+import { useDataChanges } from './hooks/useDataChanges';
 
 const AppLayout: React.FC = () => {
+  useDataChanges();
+
   return (
     <>
       <Navbar />
@@ -0,0 +1,25 @@
+import { ChevronLeft, ChevronRight } from "lucide-react"
+
+import { Button } from "@/components/ui/button"
+
+interface CursorPagerProps {
+  hasPrevious: boolean
+  hasNext: boolean
+  onPrevious: () => void
+  onNext: () => void
+}
+
+export function CursorPager({ hasPrevious, hasNext, onPrevious, onNext }: CursorPagerProps) {
+  if (!hasPrevious && !hasNext) return null
+
+  return (
+    <div className="flex items-center justify-between pt-2">
+      <Button variant="outline" size="sm" className="gap-1" disabled={!hasPrevious} onClick={onPrevious}>
+        <ChevronLeft className="w-4 h-4" /> Newer
+      </Button>
+      <Button variant="outline" size="sm" className="gap-1" disabled={!hasNext} onClick={onNext}>
+        Older <ChevronRight className="w-4 h-4" />
+      </Button>
+    </div>
+  )
+}
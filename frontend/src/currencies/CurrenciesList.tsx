@@ -1,18 +1,17 @@
 import { useEffect, useState, useMemo } from "react";
 import { Link, useSearchParams } from "react-router-dom";
 import useSWR from "swr";
-import { axiosInstance } from "../services/apiClient";
+import { listFetcher } from "../utils/swrFetcher";
 import { Currency } from "../utils/zodSchemas";
 import { Accordion, AccordionItem, AccordionTrigger, AccordionContent } from "@/components/ui/accordion";
 import { Button } from "@/components/ui/button";
 import { Card, CardHeader, CardTitle, CardContent } from "@/components/ui/card";
 import { Input } from "@/components/ui/input";
 
-const fetcher = (url: string) => axiosInstance.get(url).then((res) => res.data);
 const PAGE_SIZE = 15;
 
 export default function CurrenciesList() {
-  const { data: currencies, error } = useSWR<Currency[]>("/api/currencies/currencies/", fetcher);
+  const { data: currencies, error } = useSWR<Currency[]>("/api/currencies/currencies/", listFetcher);
   const [searchParams, setSearchParams] = useSearchParams();
 
   const defaultTab =
@@ -10,7 +10,7 @@ import {
   ExchangeRate,
 } from "../utils/zodSchemas";
 import { axiosInstance } from "../services/apiClient";
-import { fetcher } from "../utils/swrFetcher";
+import { fetcher, listFetcher } from "../utils/swrFetcher";
 import ConfirmModal from "../ConfirmModal";
 import { Button } from "@/components/ui/button";
 import { Card, CardHeader, CardTitle, CardContent } from "@/components/ui/card";
@@ -52,7 +52,7 @@ export default function CurrencyDetail() {
     currency?.is_local === false
       ? `/api/currencies/exchangerates/?currency=${currency.code}`
       : null,
-    fetcher
+    listFetcher
   );
 
   const onSubmit = async (data: CurrencyFormData) => {
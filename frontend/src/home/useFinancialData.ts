@@ -1,59 +1,29 @@
 import useSWR from "swr";
 import { fetcher } from "../utils/swrFetcher";
 
-// Default SWR options for all financial data
+// Default SWR options for all financial data; changes are pushed (useDataChanges) instead of polled
 const swrOptions = {
   revalidateOnFocus: false,      // don't refetch on window focus
   revalidateIfStale: true,       // refetch if data is stale
-  refreshInterval: 60000,        // auto-refresh every 60 seconds
   shouldRetryOnError: true,      // retry if fetch fails
 };
 
+// All dashboard totals and the local currency come from one cached endpoint
 export const useFinancialData = () => {
-  const { data: localCurrency, error: localCurrencyError, isLoading: localCurrencyLoading } = useSWR(
-    "/api/currencies/get-localcurrency",
+  const { data: summary, error, isLoading } = useSWR(
+    "/api/dashboard/summary/",
     fetcher,
     swrOptions
   );
 
-  const { data: incomeTotals, error: incomeTotalsError, isLoading: incomeTotalsLoading } = useSWR(
-    "/api/income/totalincome",
-    fetcher,
-    swrOptions
-  );
-
-  const { data: assetsTotals, error: assetsTotalsError, isLoading: assetsTotalsLoading } = useSWR(
-    "/api/assets/totalassets",
-    fetcher,
-    swrOptions
-  );
-
-  const { data: expensesTotals, error: expensesTotalsError, isLoading: expensesTotalsLoading } = useSWR(
-    "/api/expenses/totalexpenses",
-    fetcher,
-    swrOptions
-  );
-
-  const { data: liabilitiesTotals, error: liabilitiesTotalsError, isLoading: liabilitiesTotalsLoading } = useSWR(
-    "/api/liabilities/totalliabilities",
-    fetcher,
-    swrOptions
-  );
-  
-
-  const isLoading =
-    localCurrencyLoading ||
-    incomeTotalsLoading ||
-    assetsTotalsLoading ||
-    expensesTotalsLoading ||
-    liabilitiesTotalsLoading;
-
-  const hasError =
-    localCurrencyError ||
-    incomeTotalsError ||
-    assetsTotalsError ||
-    expensesTotalsError ||
-    liabilitiesTotalsError;
+  // Same shapes as the per-category endpoints this hook used to poll
+  const localCurrency = summary?.local_currency
+    ? { local_currency_code: summary.local_currency.code }
+    : undefined;
+  const incomeTotals = summary?.income;
+  const assetsTotals = summary?.assets;
+  const expensesTotals = summary?.expenses;
+  const liabilitiesTotals = summary?.liabilities;
 
   return {
     localCurrency,
@@ -62,13 +32,13 @@ export const useFinancialData = () => {
     expensesTotals,
     liabilitiesTotals,
     isLoading,
-    hasError,
+    hasError: error,
     errors: {
-      localCurrencyError,
-      incomeTotalsError,
-      assetsTotalsError,
-      expensesTotalsError,
-      liabilitiesTotalsError,
+      localCurrencyError: error,
+      incomeTotalsError: error,
+      assetsTotalsError: error,
+      expensesTotalsError: error,
+      liabilitiesTotalsError: error,
     },
   };
 };
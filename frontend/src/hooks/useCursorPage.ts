@@ -0,0 +1,44 @@
+import { useState } from "react";
+import useSWR from "swr";
+import { CursorPage, fetcher } from "../utils/swrFetcher";
+
+// The API links pages absolutely; keys stay relative so that useDataChanges revalidates them with the rest of /api/
+const toPath = (link: string) => {
+  const { pathname, search } = new URL(link, window.location.origin);
+  return pathname + search;
+};
+
+// One cursor page of a list endpoint at a time, with links to the pages around it
+export const useCursorPage = <T>(endpoint: string | null) => {
+  const [listEndpoint, setListEndpoint] = useState(endpoint);
+  const [pageUrl, setPageUrl] = useState<string | null>(null);
+
+  // Another list (e.g. another expense type) starts from its first page
+  if (endpoint !== listEndpoint) {
+    setListEndpoint(endpoint);
+    setPageUrl(null);
+  }
+
+  const { data, error, isLoading, mutate } = useSWR<CursorPage<T>>(
+    endpoint ? pageUrl ?? endpoint : null,
+    fetcher,
+    { keepPreviousData: true }
+  );
+
+  const goTo = (link: string | null | undefined) => {
+    if (link) setPageUrl(toPath(link));
+  };
+
+  return {
+    items: data?.results ?? [],
+    error,
+    isLoading,
+    mutate,
+    hasNext: Boolean(data?.next),
+    hasPrevious: Boolean(data?.previous),
+    next: () => goTo(data?.next),
+    previous: () => goTo(data?.previous),
+    // After a create, the new record is at the top of the first page
+    first: () => setPageUrl(null),
+  };
+};
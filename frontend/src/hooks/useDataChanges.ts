@@ -0,0 +1,41 @@
+import { useEffect } from "react";
+import { useSWRConfig } from "swr";
+
+const API_URL = import.meta.env.VITE_API_URL;
+const EVENTS_URL = `${API_URL}/api/events/`;
+const REOPEN_DELAY = 30000; // after the server refuses the stream, e.g. while the access token is refreshed
+
+// Revalidates the cached API data whenever the server reports that the user's data changed
+export const useDataChanges = () => {
+  const { mutate } = useSWRConfig();
+
+  useEffect(() => {
+    let source: EventSource | null = null;
+    let reopenTimer: ReturnType<typeof setTimeout> | undefined;
+    let lastVersion: string | undefined;
+
+    const open = () => {
+      source = new EventSource(EVENTS_URL, { withCredentials: true });
+      source.addEventListener("version", (event) => {
+        const { version } = JSON.parse((event as MessageEvent).data);
+        // The first version only marks what is already loaded; later ones (also after a reconnect) mean changes
+        if (lastVersion !== undefined && version !== lastVersion) {
+          mutate((key) => typeof key === "string" && key.startsWith("/api/"));
+        }
+        lastVersion = version;
+      });
+      source.onerror = () => {
+        // The browser reconnects by itself unless the stream was refused
+        if (source?.readyState === EventSource.CLOSED) {
+          reopenTimer = setTimeout(open, REOPEN_DELAY);
+        }
+      };
+    };
+
+    open();
+    return () => {
+      clearTimeout(reopenTimer);
+      source?.close();
+    };
+  }, [mutate]);
+};
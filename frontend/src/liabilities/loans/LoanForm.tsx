@@ -3,7 +3,7 @@ import useSWR from "swr";
 import { useForm, Controller, useWatch } from "react-hook-form";
 import { zodResolver } from "@hookform/resolvers/zod";
 import { LoanFormSchema, LoanFormValues, InterestTypeItem, Currency, LoanFormInput } from "../../utils/zodSchemas";
-import { fetcher } from "../../utils/swrFetcher"; 
+import { listFetcher } from "../../utils/swrFetcher";
 import { formatDateLocal } from "../../utils/dateUtils";
 import DatePicker from "react-datepicker";
 import "react-datepicker/dist/react-datepicker.css";
@@ -32,8 +32,8 @@ const LoanForm = forwardRef<LoanFormHandle, Props>(({ onSubmit, initialValues },
     defaultValues: initialValues as LoanFormInput,
   });
 
-  const { data: interestTypes = [], error: interestError, isLoading: interestLoading, } = useSWR<InterestTypeItem[]>("/api/liabilities/interesttypes/", fetcher);
-  const { data: currencies = [], error: currencyError, isLoading: currencyLoading, } = useSWR<Currency[]>("/api/currencies/currencies", fetcher);
+  const { data: interestTypes = [], error: interestError, isLoading: interestLoading, } = useSWR<InterestTypeItem[]>("/api/liabilities/interesttypes/", listFetcher);
+  const { data: currencies = [], error: currencyError, isLoading: currencyLoading, } = useSWR<Currency[]>("/api/currencies/currencies", listFetcher);
 
   useImperativeHandle(ref, () => ({
     reset: () => reset(),
@@ -1,6 +1,6 @@
 import { useParams, useNavigate } from "react-router-dom";
 import useSWR from "swr";
-import { fetcher } from "../../utils/swrFetcher";
+import { fetcher, listFetcher } from "../../utils/swrFetcher";
 import { expensesTypeMap, ExpenseTypeKey, ExpenseTypeConfig } from "../../constants/expensesTypes";
 import {
   ExpensesFormValues,
@@ -35,7 +35,7 @@ const EditExpenses = () => {
 
   const { data: rawCurrencies, isLoading: currenciesLoading } = useSWR<Currency[]>(
     !isInvalid ? "/api/currencies/currencies" : null,
-    fetcher
+    listFetcher
   );
 
   const currencies = useMemo(() => {
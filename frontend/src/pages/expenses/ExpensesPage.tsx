@@ -1,6 +1,7 @@
 import { useParams } from "react-router-dom";
 import useSWR from "swr";
-import { fetcher } from "../../utils/swrFetcher";
+import { listFetcher } from "../../utils/swrFetcher";
+import { useCursorPage } from "../../hooks/useCursorPage";
 import { axiosInstance } from "../../services/apiClient";
 import { expensesTypeMap, ExpenseTypeKey, ExpenseTypeConfig } from "../../constants/expensesTypes";
 import {
@@ -23,6 +24,7 @@ import {
 } from "@/components/ui/card";
 import { Separator } from "@/components/ui/separator";
 import { Skeleton } from "@/components/ui/skeleton";
+import { CursorPager } from "@/components/cursor-pager";
 import { Plus, X } from "lucide-react";
 import { extractErrorMessage } from "../../utils/errorHandler";
 import { AxiosError } from "axios";
@@ -35,14 +37,12 @@ const ExpensesPage = () => {
   const isInvalid = !type || !(type in expensesTypeMap);
   const config: ExpenseTypeConfig | null = !isInvalid ? expensesTypeMap[type] : null;
 
-  const { data: expenses, mutate, isLoading } = useSWR<ExpensesResponse[]>(
-  !isInvalid ? config?.endpoint : null,
-  fetcher
-);
+  const expensePage = useCursorPage<ExpensesResponse>(!isInvalid && config ? config.endpoint : null);
+  const { items: expenses, mutate, isLoading } = expensePage;
 
   const { data: rawCurrencies, isLoading: currenciesLoading } = useSWR<
     Currency[]
-  >("/api/currencies/currencies", fetcher);
+  >("/api/currencies/currencies", listFetcher);
 
   const currencies = useMemo(() => {
     if (!Array.isArray(rawCurrencies)) return [];
@@ -61,6 +61,7 @@ useEffect(() => {
     try {
       await axiosInstance.post(config.endpoint, payload);
       toast.success("Expense created.");
+      expensePage.first();
       await mutate();
       setShowForm(false);
       formRef.current?.reset();
@@ -132,7 +133,15 @@ useEffect(() => {
               <Skeleton className="h-6 w-1/2" />
             </div>
           ) : (
-            <ExpensesList expenses={expenses || []} basePath={config.route} />
+            <>
+              <ExpensesList expenses={expenses} basePath={config.route} />
+              <CursorPager
+                hasPrevious={expensePage.hasPrevious}
+                hasNext={expensePage.hasNext}
+                onPrevious={expensePage.previous}
+                onNext={expensePage.next}
+              />
+            </>
           )}
         </CardContent>
       </Card>
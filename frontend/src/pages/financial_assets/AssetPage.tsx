@@ -1,6 +1,7 @@
 import { useParams } from "react-router-dom";
 import useSWR from "swr";
-import { fetcher } from "../../utils/swrFetcher";
+import { listFetcher } from "../../utils/swrFetcher";
+import { useCursorPage } from "../../hooks/useCursorPage";
 import { axiosInstance } from "../../services/apiClient";
 import { assetEndpointsMap, AssetTypeKey } from "../../constants/assetsTypes";
 import { AssetFormValues, Currency } from "../../utils/zodSchemas";
@@ -12,6 +13,7 @@ import { Button } from "@/components/ui/button";
 import { Card, CardContent } from "@/components/ui/card";
 import { Separator } from "@/components/ui/separator";
 import { Skeleton } from "@/components/ui/skeleton";
+import { CursorPager } from "@/components/cursor-pager";
 import { extractErrorMessage } from "../../utils/errorHandler";
 import { AxiosError } from "axios";
 
@@ -22,9 +24,10 @@ const AssetPage = () => {
   const label = type && assetEndpointsMap[type]?.label;
   const route = type && assetEndpointsMap[type]?.route || "";
 
-  const {data: assets, mutate, isLoading,} = useSWR(endpoint ? `${endpoint}` : null, fetcher);
+  const assetPage = useCursorPage<Omit<AssetListItem, "asset_type">>(endpoint || null);
+  const {items: assets, mutate, isLoading,} = assetPage;
 
-  const {data: rawCurrencies, isLoading: currenciesLoading,} = useSWR<Currency[]>("/api/currencies/currencies", fetcher);
+  const {data: rawCurrencies, isLoading: currenciesLoading,} = useSWR<Currency[]>("/api/currencies/currencies", listFetcher);
 
   const currencies = useMemo(() => {
     if (!rawCurrencies) return [];
@@ -44,6 +47,7 @@ useEffect(() => {
       await axiosInstance.post(endpoint, payload);
       toast.success("Asset created.");
       setShowForm(false);
+      assetPage.first();
       await mutate();
     } catch (error: unknown) {
       const axiosError = error as AxiosError<Record<string, string[]>>;
@@ -96,15 +100,21 @@ useEffect(() => {
           </div>
         </div>
       ) : (
-        <AssetList
-          assets={(assets || []).map(
-            (asset: Omit<AssetListItem, "asset_type">) => ({
+        <>
+          <AssetList
+            assets={assets.map((asset) => ({
               ...asset,
               asset_type: type,
-            })
-          )}
-          basePath={route}
-        />
+            }))}
+            basePath={route}
+          />
+          <CursorPager
+            hasPrevious={assetPage.hasPrevious}
+            hasNext={assetPage.hasNext}
+            onPrevious={assetPage.previous}
+            onNext={assetPage.next}
+          />
+        </>
       )}
     </div>
   );
@@ -2,7 +2,7 @@ import { useParams, useNavigate } from "react-router-dom";
 import useSWR from "swr";
 import { useMemo } from "react";
 import { toast } from "sonner";
-import { fetcher } from "../../utils/swrFetcher";
+import { fetcher, listFetcher } from "../../utils/swrFetcher";
 import { AssetFormValues, Currency } from "../../utils/zodSchemas";
 import AssetForm from "../../financial_assets/AssetForm";
 import { axiosInstance } from "../../services/apiClient";
@@ -38,7 +38,7 @@ const EditAsset = () => {
   const {
     data: rawCurrencies,
     isLoading: currenciesLoading,
-  } = useSWR<Currency[]>("/api/currencies/currencies", fetcher);
+  } = useSWR<Currency[]>("/api/currencies/currencies", listFetcher);
 
   const currencies = useMemo(() => {
     if (!rawCurrencies) return [];
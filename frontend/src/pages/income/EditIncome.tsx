@@ -1,6 +1,6 @@
 import { useParams, useNavigate, Link } from "react-router-dom";
 import useSWR from "swr";
-import { fetcher } from "../../utils/swrFetcher";
+import { fetcher, listFetcher } from "../../utils/swrFetcher";
 import { incomeTypeMap, IncomeTypeKey } from "../../constants/incomeTypes";
 import { IncomeFormValues, IncomeResponse, Currency } from "../../utils/zodSchemas";
 import { axiosInstance } from "../../services/apiClient";
@@ -31,7 +31,7 @@ const EditIncome = () => {
 
   const { data: rawCurrencies, isLoading: currenciesLoading } = useSWR<Currency[]>(
     "/api/currencies/currencies",
-    fetcher
+    listFetcher
   );
 
   const currencies = useMemo(() => {
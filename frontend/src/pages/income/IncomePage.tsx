@@ -1,6 +1,7 @@
 import { useParams } from "react-router-dom";
 import useSWR from "swr";
-import { fetcher } from "../../utils/swrFetcher";
+import { listFetcher } from "../../utils/swrFetcher";
+import { useCursorPage } from "../../hooks/useCursorPage";
 import { axiosInstance } from "../../services/apiClient";
 import { incomeTypeMap, IncomeTypeKey } from "../../constants/incomeTypes";
 import { IncomeFormValues, IncomeResponse, Currency } from "../../utils/zodSchemas";
@@ -18,6 +19,7 @@ import {
 } from "@/components/ui/card";
 import { Skeleton } from "@/components/ui/skeleton";
 import { Separator } from "@/components/ui/separator";
+import { CursorPager } from "@/components/cursor-pager";
 import { extractErrorMessage } from "../../utils/errorHandler";
 import { AxiosError } from "axios";
 
@@ -29,16 +31,13 @@ const IncomePage = () => {
   const { endpoint, label, route } = isInvalid
     ? { endpoint: "", label: "", route: "" }
     : incomeTypeMap[type as IncomeTypeKey];
-  const {
-    data: incomes,
-    mutate,
-    isLoading,
-  } = useSWR<IncomeResponse[]>(isInvalid ? null : endpoint, fetcher);
+  const incomePage = useCursorPage<IncomeResponse>(isInvalid ? null : endpoint);
+  const { items: incomes, mutate, isLoading } = incomePage;
 
   const {
     data: rawCurrencies,
     isLoading: currenciesLoading,
-  } = useSWR<Currency[]>("/api/currencies/currencies", fetcher);
+  } = useSWR<Currency[]>("/api/currencies/currencies", listFetcher);
 
   const currencies = useMemo(() => {
     if (!Array.isArray(rawCurrencies)) return [];
@@ -56,6 +55,7 @@ useEffect(() => {
     try {
       await axiosInstance.post(endpoint, payload);
       toast.success("Income created.");
+      incomePage.first();
       await mutate();
       setShowForm(false);
       formRef.current?.reset();
@@ -130,7 +130,15 @@ useEffect(() => {
               <Skeleton className="h-6 w-2/3" />
             </div>
           ) : (
-            <IncomeList incomes={incomes || []} basePath={route} />
+            <>
+              <IncomeList incomes={incomes} basePath={route} />
+              <CursorPager
+                hasPrevious={incomePage.hasPrevious}
+                hasNext={incomePage.hasNext}
+                onPrevious={incomePage.previous}
+                onNext={incomePage.next}
+              />
+            </>
           )}
         </CardContent>
       </Card>
@@ -1,7 +1,6 @@
 import { useRef, useState } from "react";
-import useSWR from "swr";
 import { axiosInstance } from "../../../services/apiClient";
-import { fetcher } from "../../../utils/swrFetcher";
+import { useCursorPage } from "../../../hooks/useCursorPage";
 import { toast } from "sonner";
 import InterestTypeForm, { InterestTypeFormHandle } from "../../../liabilities/interesttypes/InterestTypeForm";
 import InterestTypeList from "../../../liabilities/interesttypes/InterestTypeList";
@@ -9,20 +8,20 @@ import { InterestTypeResponse, InterestTypeFormValues } from "../../../utils/zod
 import { Card, CardHeader, CardTitle, CardContent } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { Spinner } from "@/components/ui/spinner";
+import { CursorPager } from "@/components/cursor-pager";
 
 const InterestTypePage = () => {
   const [showForm, setShowForm] = useState(false);
   const formRef = useRef<InterestTypeFormHandle>(null);
 
-  const { data: interestTypes, mutate, isLoading } = useSWR<InterestTypeResponse[]>(
-    "/api/liabilities/interesttypes/",
-    fetcher
-  );
+  const interestTypePage = useCursorPage<InterestTypeResponse>("/api/liabilities/interesttypes/");
+  const { items: interestTypes, mutate, isLoading } = interestTypePage;
 
   const handleCreate = async (payload: InterestTypeFormValues) => {
     try {
       await axiosInstance.post("/api/liabilities/interesttypes/", payload);
       toast.success("Interest type created.");
+      interestTypePage.first();
       await mutate();
       setShowForm(false);
       formRef.current?.reset();
@@ -59,7 +58,15 @@ const InterestTypePage = () => {
           <Spinner className="w-8 h-8" />
         </div>
       ) : (
-        <InterestTypeList interestTypes={interestTypes || []} basePath="/liabilities/interesttypes" />
+        <>
+          <InterestTypeList interestTypes={interestTypes} basePath="/liabilities/interesttypes" />
+          <CursorPager
+            hasPrevious={interestTypePage.hasPrevious}
+            hasNext={interestTypePage.hasNext}
+            onPrevious={interestTypePage.previous}
+            onNext={interestTypePage.next}
+          />
+        </>
       )}
     </div>
   );
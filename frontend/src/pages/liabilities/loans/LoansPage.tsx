@@ -1,6 +1,5 @@
 import { useState, useRef } from "react";
-import useSWR from "swr";
-import { fetcher } from "../../../utils/swrFetcher";
+import { useCursorPage } from "../../../hooks/useCursorPage";
 import { LoanItem, LoanFormValues } from "../../../utils/zodSchemas";
 import { axiosInstance } from "../../../services/apiClient";
 import LoanForm, { LoanFormHandle } from "../../../liabilities/loans/LoanForm";
@@ -8,6 +7,7 @@ import LoanList from "../../../liabilities/loans/LoanList";
 import { toast } from "sonner";
 import { Button } from "@/components/ui/button";
 import { Card, CardContent } from "@/components/ui/card";
+import { CursorPager } from "@/components/cursor-pager";
 import { AxiosError } from "axios";
 import { extractErrorMessage } from "../../../utils/errorHandler";
 
@@ -15,12 +15,14 @@ const LoanPage = () => {
   const [showForm, setShowForm] = useState(false);
   const formRef = useRef<LoanFormHandle>(null);
 
-  const { data: loans, error, mutate } = useSWR<LoanItem[]>("/api/liabilities/loans/", fetcher);
+  const loanPage = useCursorPage<LoanItem>("/api/liabilities/loans/");
+  const { items: loans, error, isLoading, mutate } = loanPage;
 
   const handleCreate = async (values: LoanFormValues) => {
     try {
       await axiosInstance.post("/api/liabilities/loans/", values);
       toast.success("Loan created.");
+      loanPage.first();
       await mutate();
       formRef.current?.reset();
       setShowForm(false);
@@ -59,10 +61,18 @@ const LoanPage = () => {
 
       {error ? (
         <p className="text-red-600">Failed to load loans.</p>
-      ) : loans ? (
-        <LoanList loans={loans} basePath="/liabilities/loans" />
-      ) : (
+      ) : isLoading ? (
         <p>Loading loans...</p>
+      ) : (
+        <>
+          <LoanList loans={loans} basePath="/liabilities/loans" />
+          <CursorPager
+            hasPrevious={loanPage.hasPrevious}
+            hasNext={loanPage.hasNext}
+            onPrevious={loanPage.previous}
+            onNext={loanPage.next}
+          />
+        </>
       )}
     </div>
   );
@@ -1,4 +1,24 @@
 import { axiosInstance } from "../services/apiClient";
 
-export const fetcher = (url: string) =>
-  axiosInstance.get(url).then(res => res.data);
+export interface CursorPage<T> {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+}
+
+// The largest page the API serves
+const LOOKUP_PAGE_SIZE = 500;
+
+// One request per key: list endpoints answer with a single cursor page, which useCursorPage walks
+export const fetcher = async (url: string) => {
+  const { data } = await axiosInstance.get(url);
+  return data;
+};
+
+// Short lookup lists (currencies, interest types) for pickers: the first page, as large as the API allows
+export const listFetcher = async (url: string) => {
+  const { data } = await axiosInstance.get<CursorPage<unknown>>(url, {
+    params: { page_size: LOOKUP_PAGE_SIZE },
+  });
+  return data.results;
+};